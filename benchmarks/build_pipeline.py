@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import List, Tuple
+
+from typer import run
+
+from benchmarks.programs import fibonacci_element, write_program
+from benchmarks.support import measure, report
+from benchmarks.vm_translate import synthetic_corpus
+from n2t.infra import AsmProgram, BuildProgram, EmulatorProgram, VmProgram
+
+
+def through_files(directory: Path, cycles: int) -> None:
+    VmProgram.load_from(str(directory)).translate()
+    asm_file = directory.joinpath(f"{directory.name}.asm")
+    AsmProgram.load_from(str(asm_file)).assemble()
+    hack_file = asm_file.with_suffix(".hack")
+    EmulatorProgram.load_from(str(hack_file), cycles).emulate()
+
+
+def in_memory(directory: Path, cycles: int) -> None:
+    BuildProgram.load_from(str(directory)).build(run=True, cycles=cycles)
+
+
+def main(cycles: int = 20_000) -> None:
+    rows: List[Tuple[object, ...]] = []
+    with tempfile.TemporaryDirectory() as directory:
+        fibonacci = Path(directory, "Fibonacci")
+        fibonacci.mkdir()
+        write_program(fibonacci, fibonacci_element(10))
+        corpus = Path(directory, "Corpus")
+        corpus.mkdir()
+        synthetic_corpus(corpus, files=4, functions=10, size=100)
+
+        for name, program, steps in [
+            ("FibonacciElement", fibonacci, cycles),
+            ("synthetic", corpus, cycles),
+        ]:
+            files = measure(lambda: through_files(program, steps), repeat=3)
+            memory = measure(lambda: in_memory(program, steps), repeat=3)
+            rows.append(
+                (name, steps, f"{files:.2f}", f"{memory:.2f}", f"{files / memory:.1f}x")
+            )
+
+    report(["program", "cycles", "files s", "in-memory s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import os
+import random
+import tempfile
+from pathlib import Path
+
+from typer import run
+
+from benchmarks.support import measure, report
+from n2t.infra import HackProgram
+
+COMPUTATIONS = ["0101010", "0111111", "0001100", "1110000", "0000010", "1010011"]
+
+
+def synthetic_rom(path: Path, words: int, seed: int = 2023) -> None:
+    rng = random.Random(seed)
+    with path.open("w") as file:
+        for _ in range(words):
+            if rng.random() < 0.5:
+                file.write(f"{rng.randrange(0x8000):016b}\n")
+            else:
+                computation = rng.choice(COMPUTATIONS)
+                file.write(f"111{computation}{rng.randrange(64):06b}\n")
+
+
+def main(words: int = 2_000_000, jobs: int = os.cpu_count() or 1) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        rom = Path(directory, "Synthetic.hack")
+        synthetic_rom(rom, words)
+        name = str(rom)
+
+        timings = [
+            ("chain", measure(lambda: HackProgram.load_from(name).disassemble())),
+            ("batch", measure(lambda: HackProgram.load_from(name, True).disassemble())),
+            (
+                f"batch --jobs {jobs}",
+                measure(lambda: HackProgram.load_from(name, True).disassemble(jobs)),
+            ),
+        ]
+
+    report(
+        ["mode", "seconds", "words/s"],
+        [(mode, f"{t:.2f}", f"{words / t:,.0f}") for mode, t in timings],
+    )
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import Iterable, List
+
+from typer import run
+
+from benchmarks.support import measure, report
+from n2t.infra.io import File
+
+PONG = Path(__file__).parent.parent.joinpath("tests", "e2e", "asm", "pong.asm")
+
+
+def per_line_load(path: Path) -> List[str]:
+    with path.open("r", newline="") as file:
+        return [line.strip() for line in file if line]
+
+
+def per_line_save(path: Path, lines: Iterable[str]) -> None:
+    with path.open("w", newline="") as file:
+        for line in lines:
+            file.write(f"{line}\n")
+
+
+def main(source: Path = PONG, repeat: int = 20) -> None:
+    lines = File(source).load()
+    with tempfile.TemporaryDirectory() as directory:
+        target = Path(directory, source.name)
+
+        def per_line() -> None:
+            per_line_save(target, per_line_load(source))
+
+        def bulk() -> None:
+            File(target).save(File(source).load())
+
+        rows = [
+            ("per line", measure(per_line, repeat)),
+            ("bulk, atomic", measure(bulk, repeat)),
+        ]
+        assert File(target).load() == lines
+
+    baseline = rows[0][1]
+    report(
+        ["round trip", "lines", "ms", "speedup"],
+        [
+            (name, len(lines), f"{seconds * 1000:.1f}", f"{baseline / seconds:.1f}x")
+            for name, seconds in rows
+        ],
+    )
+
+
+if __name__ == "__main__":
+    run(main)
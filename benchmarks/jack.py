@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator, List
+
+NAMES = ["a", "b", "c", "d"]
+OPERATORS = ["+", "-", "*", "/", "&", "|", "<", ">", "="]
+
+
+def synthetic_expression(rng: random.Random, depth: int = 2) -> str:
+    roll = rng.random()
+    if depth == 0 or roll < 0.3:
+        return rng.choice([*NAMES, str(rng.randrange(1000)), "true", "this"])
+    if roll < 0.4:
+        unary = rng.choice(["~", "-"])
+        return f"{unary}({synthetic_expression(rng, depth - 1)})"
+    if roll < 0.5:
+        return f"values[{synthetic_expression(rng, depth - 1)}]"
+    if roll < 0.6:
+        return f"Math.max({synthetic_expression(rng, depth - 1)}, a)"
+    left = synthetic_expression(rng, depth - 1)
+    right = synthetic_expression(rng, depth - 1)
+    return f"({left} {rng.choice(OPERATORS)} {right})"
+
+
+def synthetic_statements(rng: random.Random, count: int, depth: int) -> Iterator[str]:
+    indent = "    " * (3 - depth)
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.45:
+            target = rng.choice([*NAMES, "values[a]"])
+            yield f"{indent}let {target} = {synthetic_expression(rng)};"
+        elif roll < 0.6:
+            yield f'{indent}do Output.printString("value {rng.randrange(100)}");'
+        elif roll < 0.75 and depth > 0:
+            yield f"{indent}if ({synthetic_expression(rng)}) {{"
+            yield from synthetic_statements(rng, 3, depth - 1)
+            yield f"{indent}}} else {{"
+            yield from synthetic_statements(rng, 2, depth - 1)
+            yield f"{indent}}}"
+        elif roll < 0.9 and depth > 0:
+            yield f"{indent}while ({synthetic_expression(rng)}) {{ // loop"
+            yield from synthetic_statements(rng, 3, depth - 1)
+            yield f"{indent}}}"
+        else:
+            yield f"{indent}/* update {rng.randrange(100)} */ do Main.f0(a);"
+
+
+def synthetic_class(
+    name: str, subroutines: int, statements: int, seed: int = 2023
+) -> str:
+    rng = random.Random(seed)
+    lines: List[str] = [
+        "/**",
+        f" * Synthetic class {name}.",
+        " */",
+        f"class {name} {{",
+        "    field int a, b;",
+        "    static Array values;",
+        "",
+    ]
+    for index in range(subroutines):
+        lines.extend(
+            [
+                f"    /** Subroutine {index}. */",
+                f"    method int f{index}(int c) {{",
+                "        var int d;",
+                *synthetic_statements(rng, statements, 2),
+                "        return a;",
+                "    }",
+                "",
+            ]
+        )
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def nested_class(name: str, depth: int, width: int) -> str:
+    body = [f"do {name}.f0(a);"] * width
+    for level in range(depth):
+        body = [f"while (a < {level}) {{", *body, "}", *["let a = a + 1;"] * width]
+    return "\n".join(
+        [
+            f"class {name} {{",
+            "    static int a;",
+            "    function void f0() {",
+            *body,
+            "        return;",
+            "    }",
+            "}",
+        ]
+    )
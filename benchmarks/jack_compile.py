@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typer import run
+
+from benchmarks.jack import nested_class, synthetic_class
+from benchmarks.support import measure, report
+from n2t.core import JackCompiler
+
+
+def main(subroutines: int = 200, statements: int = 40) -> None:
+    classes = {
+        f"{subroutines} subroutines": synthetic_class("Main", subroutines, statements),
+        "nested x20": nested_class("Main", 20, 400),
+        "nested x60": nested_class("Main", 60, 120),
+    }
+    compiler = JackCompiler.create()
+    rows = []
+    for name, jack_code in classes.items():
+        lines = jack_code.splitlines()
+        vm_lines = len(list(compiler.compile(lines)))
+        seconds = measure(lambda: compiler.compile(lines), repeat=3)
+        rows.append(
+            (
+                name,
+                len(lines),
+                vm_lines,
+                f"{seconds:.3f}",
+                f"{vm_lines / seconds:,.0f}",
+            )
+        )
+
+    report(["class", "Jack lines", "VM lines", "seconds", "VM lines/s"], rows)
+
+
+if __name__ == "__main__":
+    run(main)
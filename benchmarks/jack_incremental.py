@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+from typer import run
+
+from benchmarks.jack import synthetic_class
+from benchmarks.support import measure, report
+from n2t.infra import JackProgram
+
+
+def main(classes: int = 16, subroutines: int = 40) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        for index in range(classes):
+            jack_code = synthetic_class(f"Class{index}", subroutines, 40, seed=index)
+            Path(directory, f"Class{index}.jack").write_text(jack_code)
+        program = JackProgram.load_from(directory)
+        edited = Path(directory, "Class0.jack")
+
+        def edit() -> None:
+            edited.write_text(edited.read_text() + "\n")
+            program.compile()
+
+        rows = [
+            ("forced", measure(lambda: program.compile(force=True))),
+            ("warm cache", measure(program.compile, repeat=3)),
+            ("one class edited", measure(edit, repeat=3)),
+        ]
+
+    baseline = rows[0][1]
+    report(
+        ["build", "seconds", "speedup"],
+        [
+            (name, f"{seconds:.3f}", f"{baseline / seconds:.1f}x")
+            for name, seconds in rows
+        ],
+    )
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from typer import run
+
+from benchmarks.programs import shapes, translate_program
+from benchmarks.support import assemble, execute, report
+from n2t.core import VMTranslator
+
+MAX_CYCLES = 10_000_000
+RESULT = slice(7000, 7003)
+
+
+def main() -> None:
+    modes = {
+        "per class": shapes(),
+        "whole program": shapes(whole_program=True),
+        "whole program, optimized": shapes(optimize=True, whole_program=True),
+    }
+    rows: List[Tuple[object, ...]] = []
+    baseline_cycles, expected = 0, None
+    for name, program in modes.items():
+        words = assemble(translate_program(program, VMTranslator.create()))
+        cycles, ram = execute(words, MAX_CYCLES)
+        if expected is None:
+            baseline_cycles, expected = cycles, ram[RESULT]
+        assert ram[RESULT] == expected, name
+        rows.append((name, len(words), cycles, f"{1 - cycles / baseline_cycles:.0%}"))
+
+    report(["mode", "ROM", "cycles", "cycles saved"], rows)
+
+
+if __name__ == "__main__":
+    run(main)
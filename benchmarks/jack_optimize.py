@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from typer import run
+
+from benchmarks.programs import array_sum, grid, translate_program
+from benchmarks.support import assemble, execute, report, vm_state
+from n2t.core import VMTranslator
+
+MAX_CYCLES = 10_000_000
+
+
+def main() -> None:
+    rows: List[Tuple[object, ...]] = []
+    for name, program in {"ArraySum": array_sum, "Grid": grid}.items():
+        plain = assemble(translate_program(program(), VMTranslator.create()))
+        optimized = assemble(
+            translate_program(program(optimize=True), VMTranslator.create())
+        )
+        plain_cycles, plain_ram = execute(plain, MAX_CYCLES)
+        optimized_cycles, optimized_ram = execute(optimized, MAX_CYCLES)
+        assert vm_state(plain_ram) == vm_state(optimized_ram), name
+        rows.append(
+            (
+                name,
+                len(plain),
+                len(optimized),
+                plain_cycles,
+                optimized_cycles,
+                f"{1 - optimized_cycles / plain_cycles:.0%}",
+            )
+        )
+
+    report(
+        ["program", "ROM", "optimized ROM", "cycles", "optimized cycles", "saved"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    run(main)
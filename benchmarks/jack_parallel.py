@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+from typer import run
+
+from benchmarks.jack import synthetic_class
+from benchmarks.support import measure, report
+from n2t.infra import JackProgram
+
+
+def main(classes: int = 16, subroutines: int = 40, jobs: int = 0) -> None:
+    jobs = jobs or os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as directory:
+        for index in range(classes):
+            jack_code = synthetic_class(f"Class{index}", subroutines, 40, seed=index)
+            Path(directory, f"Class{index}.jack").write_text(jack_code)
+        program = JackProgram.load_from(directory)
+
+        rows = [
+            (
+                count,
+                f"{measure(lambda: program.compile(count, force=True), repeat=3):.2f}",
+            )
+            for count in sorted({1, jobs})
+        ]
+
+    report(["jobs", "seconds"], rows)
+
+
+if __name__ == "__main__":
+    run(main)
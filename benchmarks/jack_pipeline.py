@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from typer import run
+
+from benchmarks.programs import (
+    MEMORY_JACK,
+    POINT_JACK,
+    SHAPES_JACK,
+    STRING_JACK,
+    SYS_VM,
+    TEXT_JACK,
+)
+from benchmarks.support import measure, report
+from n2t.infra import (
+    AsmProgram,
+    BuildProgram,
+    EmulatorProgram,
+    JackProgram,
+    VmProgram,
+)
+
+PROGRAMS = {
+    "Shapes": {"Main": SHAPES_JACK, "Point": POINT_JACK, "Memory": MEMORY_JACK},
+    "Text": {"Main": TEXT_JACK, "String": STRING_JACK, "Memory": MEMORY_JACK},
+}
+
+
+def write_classes(directory: Path, classes: Dict[str, str]) -> None:
+    for name, jack_code in classes.items():
+        directory.joinpath(f"{name}.jack").write_text(jack_code)
+    directory.joinpath("Sys.vm").write_text(SYS_VM.lstrip())
+
+
+def through_files(directory: Path, cycles: int) -> None:
+    JackProgram.load_from(str(directory)).compile(force=True)
+    VmProgram.load_from(str(directory)).translate()
+    asm_file = directory.joinpath(f"{directory.name}.asm")
+    AsmProgram.load_from(str(asm_file)).assemble()
+    hack_file = asm_file.with_suffix(".hack")
+    EmulatorProgram.load_from(str(hack_file), cycles).emulate()
+
+
+def in_memory(directory: Path, cycles: int) -> None:
+    BuildProgram.load_from(str(directory)).run(cycles)
+
+
+def main(cycles: int = 20_000) -> None:
+    rows: List[Tuple[object, ...]] = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name, classes in PROGRAMS.items():
+            files_directory = Path(directory, "files", name)
+            memory_directory = Path(directory, "memory", name)
+            for program in (files_directory, memory_directory):
+                program.mkdir(parents=True)
+                write_classes(program, classes)
+
+            files = measure(lambda: through_files(files_directory, cycles), repeat=3)
+            memory = measure(lambda: in_memory(memory_directory, cycles), repeat=3)
+            expected = files_directory.joinpath(f"{name}.json").read_text()
+            assert memory_directory.joinpath(f"{name}.json").read_text() == expected
+            rows.append(
+                (
+                    name,
+                    cycles,
+                    f"{files:.2f}",
+                    f"{memory:.2f}",
+                    f"{files / memory:.1f}x",
+                )
+            )
+
+    report(["program", "cycles", "files s", "in-memory s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    run(main)
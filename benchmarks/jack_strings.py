@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from typer import run
+
+from benchmarks.programs import text, translate_program
+from benchmarks.support import assemble, execute, report
+from n2t.core import VMTranslator
+
+MAX_CYCLES = 10_000_000
+RESULT = slice(7000, 7003)
+
+
+def main() -> None:
+    modes = {
+        "plain": text(),
+        "constant indices": text(optimize=True),
+        "interned strings": text(optimize=True, intern_strings=True),
+    }
+    rows: List[Tuple[object, ...]] = []
+    baseline_rom, baseline_cycles, expected = 0, 0, None
+    for name, program in modes.items():
+        words = assemble(translate_program(program, VMTranslator.create()))
+        cycles, ram = execute(words, MAX_CYCLES)
+        if expected is None:
+            baseline_rom, baseline_cycles, expected = len(words), cycles, ram[RESULT]
+        assert ram[RESULT] == expected, name
+        rows.append(
+            (
+                name,
+                len(words),
+                f"{1 - len(words) / baseline_rom:.0%}",
+                cycles,
+                f"{1 - cycles / baseline_cycles:.0%}",
+            )
+        )
+
+    report(["mode", "ROM", "ROM saved", "cycles", "cycles saved"], rows)
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typer import run
+
+from benchmarks.jack import synthetic_class
+from benchmarks.support import measure, report
+from n2t.core.compiler.tokenizer import tokenize
+
+
+def main(subroutines: int = 200, statements: int = 40) -> None:
+    jack_code = synthetic_class("Main", subroutines, statements)
+    tokens = len(tokenize(jack_code))
+
+    seconds = measure(lambda: tokenize(jack_code), repeat=5)
+
+    report(
+        ["lines", "tokens", "seconds", "tokens/s", "MB/s"],
+        [
+            (
+                jack_code.count("\n") + 1,
+                f"{tokens:,}",
+                f"{seconds:.3f}",
+                f"{tokens / seconds:,.0f}",
+                f"{len(jack_code) / seconds / 1e6:.1f}",
+            )
+        ],
+    )
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from n2t.core import JackCompiler, VMTranslator
+
+Program = Dict[str, str]
+
+
+def fibonacci_element(n: int = 4) -> Program:
+    return {
+        "Main.vm": """
+function Main.fibonacci 0
+push argument 0
+push constant 2
+lt
+if-goto IF_TRUE
+goto IF_FALSE
+label IF_TRUE
+push argument 0
+return
+label IF_FALSE
+push argument 0
+push constant 2
+sub
+call Main.fibonacci 1
+push argument 0
+push constant 1
+sub
+call Main.fibonacci 1
+add
+return
+""",
+        "Sys.vm": f"""
+function Sys.init 0
+push constant {n}
+call Main.fibonacci 1
+label WHILE
+goto WHILE
+""",
+    }
+
+
+def statics_test() -> Program:
+    classes = {f"Class{i}.vm": f"""
+function Class{i}.set 0
+push argument 0
+pop static 0
+push argument 1
+pop static 1
+push constant 0
+return
+function Class{i}.get 0
+push static 0
+push static 1
+sub
+return
+""" for i in (1, 2)}
+    return {
+        **classes,
+        "Sys.vm": """
+function Sys.init 0
+push constant 6
+push constant 8
+call Class1.set 2
+pop temp 0
+push constant 23
+push constant 15
+call Class2.set 2
+pop temp 0
+call Class1.get 0
+call Class2.get 0
+label WHILE
+goto WHILE
+""",
+    }
+
+
+SYS_VM = """
+function Sys.init 0
+call Main.main 0
+pop temp 0
+label WHILE
+goto WHILE
+"""
+
+ARRAY_SUM_JACK = """
+class Main {
+    function void main() {
+        var int i, sum;
+        var Array values, out;
+        let values = 8000;
+        let out = 7000;
+        let i = 0;
+        while (i < 300) {
+            let values[i] = i + i;
+            let i = i + 1;
+        }
+        let i = 0;
+        let sum = 0;
+        while (i < 300) {
+            if ((values[i] > 100) & (~(values[i] = 200))) {
+                let sum = sum + values[i];
+            } else {
+                let sum = sum - 1;
+            }
+            let i = i + 1;
+        }
+        let out[0] = sum;
+        let out[1] = Main.count(20);
+        return;
+    }
+
+    function int count(int n) {
+        if (n = 0) {
+            return 0;
+        }
+        return Main.count(n - 1) + 1;
+    }
+}
+"""
+
+
+MATH_JACK = """
+class Math {
+    function int multiply(int x, int y) {
+        var int sum, bit;
+        let sum = 0;
+        let bit = 1;
+        while (~(bit = 0)) {
+            if (~((y & bit) = 0)) {
+                let sum = sum + x;
+            }
+            let x = x + x;
+            let bit = bit + bit;
+        }
+        return sum;
+    }
+
+    function int divide(int x, int y) {
+        var int quotient;
+        let quotient = 0;
+        while (~(x < y)) {
+            let x = x - y;
+            let quotient = quotient + 1;
+        }
+        return quotient;
+    }
+}
+"""
+
+GRID_JACK = """
+class Main {
+    function void main() {
+        var int row, column, total;
+        var Array cells;
+        let cells = 8000;
+        let row = 0;
+        let total = 0;
+        while (row < 16) {
+            let column = 0;
+            while (column < 16) {
+                let cells[(row * 16) + column] = (column * 4) - (-2 * 3);
+                let total = total + ~(~cells[(row * 16) + column]) + (60 / 4);
+                let column = column + 1;
+            }
+            let row = row + 1;
+        }
+        let cells[-1] = total * 2;
+        return;
+    }
+}
+"""
+
+
+MEMORY_JACK = """
+class Memory {
+    static int free;
+
+    function int alloc(int size) {
+        var int block;
+        if (free = 0) {
+            let free = 2048;
+        }
+        let block = free;
+        let free = free + size;
+        return block;
+    }
+}
+"""
+
+STRING_JACK = """
+class String {
+    field Array chars;
+    field int length;
+
+    constructor String new(int maxLength) {
+        let chars = Memory.alloc(maxLength);
+        let length = 0;
+        return this;
+    }
+
+    method String appendChar(char c) {
+        let chars[length] = c;
+        let length = length + 1;
+        return this;
+    }
+
+    method int length() {
+        return length;
+    }
+
+    method char charAt(int i) {
+        return chars[i];
+    }
+}
+"""
+
+TEXT_JACK = """
+class Main {
+    function void main() {
+        var int i;
+        var Array out;
+        let out = 7000;
+        let out[0] = 0;
+        let i = 0;
+        while (i < 40) {
+            let out[0] = out[0] + Main.checksum("The quick brown fox");
+            let out[0] = out[0] + Main.checksum("jumps over the lazy dog");
+            let out[1] = out[1] + Main.checksum("The quick brown fox");
+            let out[2] = i;
+            let i = i + 1;
+        }
+        return;
+    }
+
+    function int checksum(String text) {
+        return text.length() + text.charAt(0) + text.charAt(4);
+    }
+}
+"""
+
+POINT_JACK = """
+class Point {
+    field int x, y;
+
+    constructor Point new(int ax, int ay) {
+        let x = ax;
+        let y = ay;
+        return this;
+    }
+
+    method int getX() {
+        return x;
+    }
+
+    method int getY() {
+        return y;
+    }
+
+    method void setX(int value) {
+        let x = value;
+        return;
+    }
+
+    method void setY(int value) {
+        let y = value;
+        return;
+    }
+}
+"""
+
+SHAPES_JACK = """
+class Main {
+    function void main() {
+        var int i, total;
+        var Point p, q;
+        var Array out;
+        let out = 7000;
+        let p = Point.new(1, 2);
+        let q = Point.new(3, 4);
+        let i = 0;
+        let total = 0;
+        while (i < 200) {
+            do p.setX(p.getX() + q.getY());
+            do q.setY(q.getY() + 1);
+            let total = total + p.getX() - q.getX() + p.getY();
+            let i = i + 1;
+        }
+        let out[0] = total;
+        let out[1] = p.getX();
+        let out[2] = q.getY();
+        return;
+    }
+}
+"""
+
+
+def compile_jack(
+    classes: Dict[str, str],
+    optimize: bool = False,
+    intern_strings: bool = False,
+    whole_program: bool = False,
+) -> Program:
+    compiler = JackCompiler.create(optimize, intern_strings)
+    sources = [(name, code.splitlines()) for name, code in classes.items()]
+    if whole_program:
+        vm_code = compiler.compile_program(sources).vm_code
+    else:
+        vm_code = {name: list(compiler.compile(code)) for name, code in sources}
+    program = {
+        name.replace(".jack", ".vm"): "\n".join(lines)
+        for name, lines in vm_code.items()
+    }
+    return {**program, "Sys.vm": SYS_VM}
+
+
+def array_sum(optimize: bool = False) -> Program:
+    return compile_jack({"Main.jack": ARRAY_SUM_JACK}, optimize)
+
+
+def text(optimize: bool = False, intern_strings: bool = False) -> Program:
+    classes = {
+        "Main.jack": TEXT_JACK,
+        "String.jack": STRING_JACK,
+        "Memory.jack": MEMORY_JACK,
+    }
+    return compile_jack(classes, optimize, intern_strings)
+
+
+def grid(optimize: bool = False) -> Program:
+    return compile_jack({"Main.jack": GRID_JACK, "Math.jack": MATH_JACK}, optimize)
+
+
+def shapes(optimize: bool = False, whole_program: bool = False) -> Program:
+    classes = {
+        "Main.jack": SHAPES_JACK,
+        "Point.jack": POINT_JACK,
+        "Memory.jack": MEMORY_JACK,
+    }
+    return compile_jack(classes, optimize, whole_program=whole_program)
+
+
+VM_PROGRAMS = {
+    "FibonacciElement": fibonacci_element,
+    "StaticsTest": statics_test,
+}
+
+
+def write_program(directory: Path, program: Program) -> List[str]:
+    for name, code in program.items():
+        directory.joinpath(name).write_text(code.lstrip())
+    return [str(directory.joinpath(name)) for name in program]
+
+
+def translate_program(program: Program, translator: VMTranslator) -> Iterable[str]:
+    with tempfile.TemporaryDirectory() as directory:
+        files = write_program(Path(directory), program)
+        return translator.translate(files, directory, True)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+from typer import run
+
+from benchmarks.support import report
+
+TINY_ASM = ["@2", "D=A", "@0", "M=D", "(END)", "@END", "0;JMP"]
+
+
+def import_time(arguments: Sequence[str]) -> float:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "n2t", *arguments],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Unindented names are top-level imports, whose cumulative time includes
+    # every module they pulled in.
+    total = 0
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit() and not name[1:].startswith(" "):
+            total += int(cumulative)
+    return total / 1e6
+
+
+def wall_time(arguments: Sequence[str], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "n2t", *arguments], capture_output=True, check=True
+        )
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main(repeat: int = 10) -> None:
+    rows: List[Tuple[object, ...]] = []
+    with tempfile.TemporaryDirectory() as directory:
+        asm_file = Path(directory, "Tiny.asm")
+        asm_file.write_text("\n".join(TINY_ASM) + "\n")
+        hack_file = asm_file.with_suffix(".hack")
+        commands = {
+            "assemble": ["assemble", str(asm_file)],
+            "execute": ["execute", str(hack_file), "--cycles", "10"],
+        }
+        for name, arguments in commands.items():
+            seconds = wall_time(arguments, repeat)
+            imports = import_time(arguments)
+            rows.append((name, f"{seconds * 1000:.0f}", f"{imports * 1000:.0f}"))
+
+    report(["command", "wall ms", "import ms"], rows)
+
+
+if __name__ == "__main__":
+    run(main)
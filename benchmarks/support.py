@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import time
+from typing import Callable, Iterable, List, Sequence, Tuple
+
+from typer import echo
+
+from n2t.core import Assembler
+from n2t.core.emulator.facade import Computer
+
+
+def measure(action: Callable[[], object], repeat: int = 1) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(header: Sequence[str], rows: Iterable[Sequence[object]]) -> None:
+    table = [list(map(str, header))] + [list(map(str, row)) for row in rows]
+    widths = [max(len(row[i]) for row in table) for i in range(len(header))]
+    for row in table:
+        echo("  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
+
+
+HALT = 0b1110101010000111  # 0;JMP
+
+
+def assemble(assembly: Iterable[str]) -> List[int]:
+    return [int(word, 2) for word in Assembler.create().assemble(assembly)]
+
+
+def execute(words: Sequence[int], max_cycles: int) -> Tuple[int, List[int]]:
+    computer = Computer()
+    computer.rom[: len(words)] = words
+    for cycle in range(max_cycles):
+        pc = computer.pc
+        line = computer.rom[pc]
+        if line == -1 or (line == HALT and computer.a_register == pc - 1):
+            return cycle, computer.ram
+        computer.make_step()
+    return max_cycles, computer.ram
+
+
+# Memory a VM program can observe: pointers, statics, the stack and the heap.
+def vm_state(ram: Sequence[int]) -> Tuple[int, ...]:
+    stack_pointer = ram[0]
+    return (*ram[0:5], *ram[16:256], *ram[256:stack_pointer], *ram[2048:24577])
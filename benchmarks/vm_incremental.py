@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+from typer import run
+
+from benchmarks.support import measure, report
+from benchmarks.vm_translate import synthetic_corpus
+from n2t.infra import VmProgram
+
+
+def main(files: int = 40, functions: int = 50, size: int = 200) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        corpus = Path(directory, "Corpus")
+        corpus.mkdir()
+        synthetic_corpus(corpus, files, functions, size)
+        program = VmProgram.load_from(str(corpus))
+        edited = corpus.joinpath("Class0.vm")
+
+        def edit() -> None:
+            edited.write_text(edited.read_text() + "\n")
+            program.translate(cache=True)
+
+        rows = [
+            ("no cache", measure(program.translate)),
+            ("cold cache", measure(lambda: program.translate(cache=True))),
+            ("warm cache", measure(lambda: program.translate(cache=True), repeat=3)),
+            ("one file edited", measure(edit, repeat=3)),
+        ]
+
+    baseline = rows[0][1]
+    report(
+        ["build", "seconds", "speedup"],
+        [
+            (name, f"{seconds:.3f}", f"{baseline / seconds:.1f}x")
+            for name, seconds in rows
+        ],
+    )
+
+
+if __name__ == "__main__":
+    run(main)
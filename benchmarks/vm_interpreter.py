@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import time
+from typing import Callable, Dict, List, Tuple
+
+from typer import run
+
+from benchmarks.programs import (
+    VM_PROGRAMS,
+    Program,
+    fibonacci_element,
+    translate_program,
+)
+from benchmarks.support import assemble, execute, report
+from n2t.core import VMInterpreter, VMTranslator
+
+MAX_CYCLES = 10_000_000
+
+
+def main(fibonacci: int = 14) -> None:
+    rows: List[Tuple[object, ...]] = []
+    programs: Dict[str, Callable[[], Program]] = {
+        **VM_PROGRAMS,
+        "FibonacciElement": lambda: fibonacci_element(fibonacci),
+    }
+    for name, program in programs.items():
+        words = assemble(translate_program(program(), VMTranslator.create()))
+        start = time.perf_counter()
+        cycles, _ = execute(words, MAX_CYCLES)
+        emulated = time.perf_counter() - start
+
+        sources = [
+            (file, code.splitlines()) for file, code in sorted(program().items())
+        ]
+        start = time.perf_counter()
+        machine = VMInterpreter.create().load(sources, bootstrap=True)
+        steps = machine.run()
+        interpreted = time.perf_counter() - start
+        rows.append(
+            (
+                name,
+                cycles,
+                steps,
+                f"{emulated:.3f}",
+                f"{interpreted:.3f}",
+                f"{emulated / interpreted:.0f}x",
+            )
+        )
+
+    report(
+        [
+            "program",
+            "Hack cycles",
+            "VM steps",
+            "emulator s",
+            "interpreter s",
+            "speedup",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+
+from typer import run
+
+from benchmarks.support import assemble, report
+from benchmarks.vm_translate import synthetic_corpus
+from n2t.infra import VmProgram
+
+
+def main(files: int = 10, functions: int = 20, size: int = 200) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        corpus = Path(directory, "Corpus")
+        corpus.mkdir()
+        synthetic_corpus(corpus, files, functions, size)
+        program = VmProgram.load_from(str(corpus))
+        asm_file = corpus.joinpath("Corpus.asm")
+
+        rows = []
+        for prune in (False, True):
+            start = time.perf_counter()
+            removed = program.translate(prune=prune).removed
+            translated = time.perf_counter()
+            words = assemble(asm_file.read_text().splitlines())
+            assembled = time.perf_counter()
+            rows.append(
+                (
+                    "pruned" if prune else "full",
+                    len(removed),
+                    len(words),
+                    f"{translated - start:.2f}",
+                    f"{assembled - translated:.2f}",
+                )
+            )
+
+    report(["build", "removed", "ROM", "translate s", "assemble s"], rows)
+
+
+if __name__ == "__main__":
+    run(main)
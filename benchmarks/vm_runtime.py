@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from typer import run
+
+from benchmarks.programs import (
+    VM_PROGRAMS,
+    Program,
+    fibonacci_element,
+    translate_program,
+)
+from benchmarks.support import assemble, execute, report, vm_state
+from benchmarks.vm_translate import synthetic_corpus
+from n2t.core import VMTranslator
+
+MAX_CYCLES = 10_000_000
+
+
+def main(fibonacci: int = 12) -> None:
+    rows: List[Tuple[object, ...]] = []
+    programs: Dict[str, Callable[[], Program]] = {
+        **VM_PROGRAMS,
+        "FibonacciElement": lambda: fibonacci_element(fibonacci),
+    }
+    for name, program in programs.items():
+        inline = assemble(translate_program(program(), VMTranslator.create()))
+        shared = assemble(translate_program(program(), VMTranslator.create(True)))
+        inline_cycles, inline_ram = execute(inline, MAX_CYCLES)
+        shared_cycles, shared_ram = execute(shared, MAX_CYCLES)
+        assert vm_state(inline_ram) == vm_state(shared_ram), name
+        rows.append(
+            (
+                name,
+                len(inline),
+                len(shared),
+                f"{len(inline) / len(shared):.1f}x",
+                inline_cycles,
+                shared_cycles,
+            )
+        )
+
+    with tempfile.TemporaryDirectory() as directory:
+        synthetic_corpus(Path(directory), files=10, functions=20, size=200)
+        files = sorted(str(path) for path in Path(directory).glob("*.vm"))
+        inline = assemble(VMTranslator.create().translate(files, directory, True))
+        shared = assemble(VMTranslator.create(True).translate(files, directory, True))
+        rows.append(
+            (
+                "synthetic",
+                len(inline),
+                len(shared),
+                f"{len(inline) / len(shared):.1f}x",
+                "-",
+                "-",
+            )
+        )
+
+    report(
+        [
+            "program",
+            "inline ROM",
+            "shared ROM",
+            "ratio",
+            "inline cycles",
+            "shared cycles",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from typer import run
+
+from benchmarks.programs import VM_PROGRAMS, array_sum, translate_program
+from benchmarks.support import assemble, execute, report, vm_state
+from n2t.core import VMTranslator
+
+MAX_CYCLES = 10_000_000
+
+
+def main() -> None:
+    rows: List[Tuple[object, ...]] = []
+    for name, program in {**VM_PROGRAMS, "ArraySum (Jack)": array_sum}.items():
+        plain = assemble(translate_program(program(), VMTranslator.create()))
+        cached = assemble(
+            translate_program(program(), VMTranslator.create(stack_cache=True))
+        )
+        plain_cycles, plain_ram = execute(plain, MAX_CYCLES)
+        cached_cycles, cached_ram = execute(cached, MAX_CYCLES)
+        assert vm_state(plain_ram) == vm_state(cached_ram), name
+        rows.append(
+            (
+                name,
+                len(plain),
+                len(cached),
+                plain_cycles,
+                cached_cycles,
+                f"{1 - cached_cycles / plain_cycles:.0%}",
+            )
+        )
+
+    report(["program", "ROM", "cached ROM", "cycles", "cached cycles", "saved"], rows)
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import random
+import tempfile
+from pathlib import Path
+from typing import Iterator
+
+from typer import run
+
+from benchmarks.support import measure, report
+from n2t.infra import VmProgram
+
+SEGMENTS = ["local", "argument", "this", "that", "temp", "pointer", "static"]
+ARITHMETIC = ["add", "sub", "neg", "eq", "lt", "gt", "and", "or", "not"]
+
+
+def synthetic_function(rng: random.Random, name: str, size: int) -> Iterator[str]:
+    yield f"function {name} {rng.randrange(4)}"
+    for line in range(size):
+        roll = rng.random()
+        if roll < 0.35:
+            yield f"push constant {rng.randrange(32768)}"
+        elif roll < 0.5:
+            segment = rng.choice(SEGMENTS)
+            yield f"push {segment} {rng.randrange(2 if segment == 'pointer' else 8)}"
+        elif roll < 0.6:
+            segment = rng.choice(SEGMENTS)
+            yield f"pop {segment} {rng.randrange(2 if segment == 'pointer' else 8)}"
+        elif roll < 0.8:
+            yield rng.choice(ARITHMETIC)
+        elif roll < 0.85:
+            yield f"label {name}$L{line}"
+        elif roll < 0.9:
+            yield f"if-goto {name}$L{rng.randrange(size)}  // conditional"
+        elif roll < 0.93:
+            yield f"goto {name}$L{rng.randrange(size)}"
+        elif roll < 0.97:
+            yield f"call {name} {rng.randrange(3)}"
+        else:
+            yield ""
+            yield "// comment"
+    yield "return"
+
+
+def synthetic_corpus(
+    directory: Path, files: int, functions: int, size: int, seed: int = 2023
+) -> None:
+    rng = random.Random(seed)
+    for file in range(files):
+        with directory.joinpath(f"Class{file}.vm").open("w") as vm_file:
+            for function in range(functions):
+                name = f"Class{file}.f{function}"
+                vm_file.writelines(
+                    f"{line}\n" for line in synthetic_function(rng, name, size)
+                )
+    with directory.joinpath("Sys.vm").open("w") as vm_file:
+        vm_file.write(
+            "function Sys.init 0\ncall Class0.f0 0\nlabel WHILE\ngoto WHILE\n"
+        )
+
+
+def main(files: int = 40, functions: int = 50, size: int = 200) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        corpus = Path(directory, "Corpus")
+        corpus.mkdir()
+        synthetic_corpus(corpus, files, functions, size)
+        name = str(corpus)
+
+        seconds = measure(lambda: VmProgram.load_from(name).translate(), repeat=3)
+        commands = files * functions * (size + 2)
+
+    report(
+        ["files", "VM commands", "seconds", "commands/s"],
+        [(files, f"{commands:,}", f"{seconds:.2f}", f"{commands / seconds:,.0f}")],
+    )
+
+
+if __name__ == "__main__":
+    run(main)
@@ -1,7 +1,39 @@
-from n2t.core.assembler import Assembler
-from n2t.core.compiler import JackCompiler
-from n2t.core.disassembler import Disassembler
-from n2t.core.emulator import Emulator
-from n2t.core.vm_translator import VMTranslator
+from __future__ import annotations
 
-__all__ = ["Assembler", "Disassembler", "VMTranslator", "JackCompiler", "Emulator"]
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from n2t.core.assembler import Assembler
+    from n2t.core.compiler import JackCompiler
+    from n2t.core.disassembler import Disassembler
+    from n2t.core.emulator import Emulator
+    from n2t.core.vm_interpreter import VMInterpreter
+    from n2t.core.vm_translator import VMTranslator
+
+__all__ = [
+    "Assembler",
+    "Disassembler",
+    "VMTranslator",
+    "VMInterpreter",
+    "JackCompiler",
+    "Emulator",
+]
+
+# Each tool is imported on first use, so a command only pays for its own.
+_MODULES = {
+    "Assembler": "n2t.core.assembler",
+    "Disassembler": "n2t.core.disassembler",
+    "VMTranslator": "n2t.core.vm_translator",
+    "VMInterpreter": "n2t.core.vm_interpreter",
+    "JackCompiler": "n2t.core.compiler",
+    "Emulator": "n2t.core.emulator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_MODULES[name]), name)
+    globals()[name] = value
+    return value
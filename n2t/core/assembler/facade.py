@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Dict, Iterable, List, Tuple
+
+from n2t.core.assembler.source_map import LABEL, NO_LABEL, VARIABLE, SourceMap
 
 
 class CodeModule:
@@ -51,6 +53,7 @@ class CodeModule:
         "AM": "101",
         "AD": "110",
         "ADM": "111",
+        "AMD": "111",
     }
 
     jump_table = {
@@ -116,7 +119,7 @@ class SymbolTable:
     }
 
     def __init__(self) -> None:
-        self.symbol_table = self.symbol_table
+        self.symbol_table = dict(self.symbol_table)
 
     def contains(self, symbol: str) -> bool:
         if symbol in self.symbol_table:
@@ -183,7 +186,7 @@ class LineInfo:
                 pair = self.current.split(";")[0]
                 return pair.strip()
             else:
-                return None
+                return self.current.strip()
         else:
             raise BaseException("Error, not correct type of command")
 
@@ -205,10 +208,52 @@ class Assembler:
         return cls()
 
     def assemble(self, assembly: Iterable[str]) -> Iterable[str]:
+        result, _ = self.assemble_with_map(assembly)
+        return result
+
+    def assemble_words(self, assembly: Iterable[str]) -> List[int]:
+        code = CodeModule()
+        encoded: Dict[str, int] = {}
+        words = []
+        for _, _, instruction in self._resolve(assembly, SourceMap()):
+            if isinstance(instruction, int):
+                words.append(instruction)
+                continue
+
+            word = encoded.get(instruction)
+            if word is None:
+                line_info = LineInfo(instruction)
+                comp = code.comp(line_info.comp())
+                dest = code.dest(line_info.dest())
+                jump = code.jump(line_info.jump())
+                word = encoded[instruction] = int("111" + comp + dest + jump, 2)
+            words.append(word)
+        return words
+
+    def assemble_with_map(self, assembly: Iterable[str]) -> Tuple[list[str], SourceMap]:
         result = []
+        source_map = SourceMap()
+        code = CodeModule()
+        for line_number, scope, instruction in self._resolve(assembly, source_map):
+            if isinstance(instruction, int):
+                result.append(format(instruction, "016b"))
+            else:
+                line_info = LineInfo(instruction)
+                comp = code.comp(line_info.comp())
+                dest = code.dest(line_info.dest())
+                jump = code.jump(line_info.jump())
+                result.append("111" + comp + dest + jump)
+            source_map.add_instruction(line_number, scope)
+        return result, source_map
 
+    # Strips comments, places labels and allocates variables, recording both in
+    # source_map. Each instruction comes back as (source line, enclosing label,
+    # A-instruction address or C-instruction text).
+    def _resolve(
+        self, assembly: Iterable[str], source_map: SourceMap
+    ) -> List[Tuple[int, int, int | str]]:
         assembly_list = []
-        for line in assembly:
+        for line_number, line in enumerate(assembly, start=1):
             if not line:
                 continue
             comment_index = line.find("//")
@@ -217,50 +262,38 @@ class Assembler:
             line = line.strip()
             if line == "":
                 continue
-            assembly_list.append(line)
+            assembly_list.append((line_number, line))
 
         symbols = SymbolTable()
-        code = CodeModule()
+        labels: Dict[str, int] = {}
         idx = 0
-        added_symbols = []
-        for line in assembly_list:
-            parser = LineInfo(line)
-            if parser.command_type() == L_COMMAND:
-                symbols.add_entry(parser.symbol(), idx)
-                added_symbols.append(parser.symbol())
+        for _, line in assembly_list:
+            if line[0] == "(":
+                symbol = line[1:-1]
+                if not symbols.contains(symbol):
+                    labels[symbol] = source_map.add_symbol(symbol, idx, LABEL)
+                symbols.add_entry(symbol, idx)
                 continue
             idx += 1
+
+        addresses = symbols.symbol_table
+        instructions: List[Tuple[int, int, int | str]] = []
+        scope = NO_LABEL
         idx = 16
-        for line in assembly_list:
-            line_info = LineInfo(line)
-
-            if line_info.command_type() == C_COMMAND:
-                c = line_info.comp()
-                d = line_info.dest()
-                j = line_info.jump()
-                comp = str(code.comp(c))
-                dest = str(code.dest(d))
-                jump = str(code.jump(j))
-                res = "111" + comp + dest + jump
-                result.append(res)
-            elif line_info.command_type() == A_COMMAND:
-                symbol = line_info.symbol()
-                if symbols.contains(symbol):
-                    address = symbols.get_address(symbol)
-                else:
+        for line_number, line in assembly_list:
+            if line[0] == "(":
+                scope = labels.get(line[1:-1], scope)
+            elif line[0] == "@":
+                symbol = line[1:]
+                address = addresses.get(symbol)
+                if address is None:
                     if symbol.isdigit():
                         address = int(symbol)
                     else:
-                        symbols.add_entry(symbol, idx)
-                        address = idx
+                        addresses[symbol] = address = idx
+                        source_map.add_symbol(symbol, idx, VARIABLE)
                         idx += 1
-                binary_address = format(address, "b")
-                zeros_left = 16 - len(binary_address)
-                res = ""
-                for i in range(zeros_left):
-                    res += "0"
-                res += binary_address
-                result.append(res)
-        for symbol in added_symbols:
-            symbols.symbol_table.pop(symbol)
-        return result
+                instructions.append((line_number, scope, address))
+            else:
+                instructions.append((line_number, scope, line))
+        return instructions
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+MAGIC = b"N2TM"
+VERSION = 1
+NO_LABEL = 0xFFFFFFFF
+
+LABEL = 0
+VARIABLE = 1
+
+# magic, version, ROM size, symbol count, byte size of the name table
+_HEADER = struct.Struct("<4sHIII")
+
+
+def _words(values: array[int]) -> bytes:
+    if sys.byteorder == "big":  # pragma: no cover
+        values = array("I", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack(data: bytes, offset: int, count: int) -> array[int]:
+    values = array("I")
+    end = offset + count * values.itemsize
+    values.frombytes(data[offset:end])
+    if sys.byteorder == "big":  # pragma: no cover
+        values.byteswap()
+    return values
+
+
+# ROM address -> (source line, enclosing label) plus the user defined symbols.
+# Every table is a flat array indexed by ROM address or symbol number, so the
+# whole map is loaded with a single read and each lookup is O(1).
+@dataclass
+class SourceMap:
+    lines: array[int] = field(default_factory=lambda: array("I"))
+    scopes: array[int] = field(default_factory=lambda: array("I"))
+    names: List[str] = field(default_factory=list)
+    addresses: array[int] = field(default_factory=lambda: array("I"))
+    kinds: array[int] = field(default_factory=lambda: array("I"))
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def add_instruction(self, line: int, scope: int) -> None:
+        self.lines.append(line)
+        self.scopes.append(scope)
+
+    def add_symbol(self, name: str, address: int, kind: int) -> int:
+        self.names.append(name)
+        self.addresses.append(address)
+        self.kinds.append(kind)
+        return len(self.names) - 1
+
+    def lookup(self, address: int) -> Tuple[int, Optional[str]]:
+        scope = self.scopes[address]
+        return self.lines[address], None if scope == NO_LABEL else self.names[scope]
+
+    @property
+    def symbols(self) -> Dict[str, int]:
+        return dict(zip(self.names, self.addresses))
+
+    @property
+    def variables(self) -> Dict[str, int]:
+        return {
+            name: address
+            for name, address, kind in zip(self.names, self.addresses, self.kinds)
+            if kind == VARIABLE
+        }
+
+    def to_bytes(self) -> bytes:
+        names = "\n".join(self.names).encode("utf-8")
+        header = _HEADER.pack(
+            MAGIC, VERSION, len(self.lines), len(self.names), len(names)
+        )
+        entries = array("I", (0, 0)) * len(self.lines)
+        entries[0::2] = self.lines
+        entries[1::2] = self.scopes
+        symbols = array("I", (0, 0)) * len(self.names)
+        symbols[0::2] = self.addresses
+        symbols[1::2] = self.kinds
+        return header + _words(entries) + _words(symbols) + names
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> SourceMap:
+        magic, version, size, count, names_size = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise BaseException("Error while loading source map")
+
+        offset = _HEADER.size
+        entries = _unpack(data, offset, 2 * size)
+        offset += len(entries) * entries.itemsize
+        symbols = _unpack(data, offset, 2 * count)
+        offset += len(symbols) * symbols.itemsize
+        end = offset + names_size
+        names = data[offset:end].decode("utf-8")
+
+        return cls(
+            lines=entries[0::2],
+            scopes=entries[1::2],
+            names=names.split("\n") if count else [],
+            addresses=symbols[0::2],
+            kinds=symbols[1::2],
+        )
@@ -1,5 +1,6 @@
-from n2t.core.compiler.facade import JackCompiler
+from n2t.core.compiler.facade import JackCompiler, ProgramOutput
 
 __all__ = [
     "JackCompiler",
+    "ProgramOutput",
 ]
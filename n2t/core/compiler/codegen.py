@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from n2t.core.compiler.expressions import (
+    ArrayAccess,
+    Binary,
+    Call,
+    Constant,
+    Expression,
+    FieldOf,
+    KeywordConstant,
+    ShiftLeft,
+    Slot,
+    StringConstant,
+    Unary,
+    Variable,
+    is_pure,
+)
+from n2t.core.compiler.semantics import ClassInfo, Scope
+from n2t.core.compiler.syntax import (
+    DoStatement,
+    IfStatement,
+    JackClass,
+    LetStatement,
+    SetField,
+    Statement,
+    Subroutine,
+    WhileStatement,
+)
+
+MATH_MAPPINGS = {
+    "+": "add",
+    "-": "sub",
+    "&": "and",
+    "|": "or",
+    "<": "lt",
+    ">": "gt",
+    "=": "eq",
+}
+
+MATH_CALLS = {"*": "Math.multiply", "/": "Math.divide"}
+
+APPEND_CHAR = "call String.appendChar 2"
+
+STRINGS_FUNCTION = "$strings"
+
+
+class VMWriter:
+    def __init__(self) -> None:
+        self.output: List[str] = []
+
+    def write_push(self, segment: Any, index: Any) -> None:
+        self.output.append(f"push {segment} {index}")
+
+    def write_pop(self, segment: Any, index: Any) -> None:
+        self.output.append(f"pop {segment} {index}")
+
+    def write_arithmetic(self, command: str) -> None:
+        self.output.append(command)
+
+    def write_label(self, label: str) -> None:
+        self.output.append(f"label {label}")
+
+    def write_goto(self, label: str) -> None:
+        self.output.append(f"goto {label}")
+
+    def write_if_goto(self, label: str) -> None:
+        self.output.append(f"if-goto {label}")
+
+    def write_call(self, name: str, args_num: Any) -> None:
+        self.output.append(f"call {name} {args_num}")
+
+    def write_function(self, name: str, locals_num: Any) -> None:
+        self.output.append(f"function {name} {locals_num}")
+
+    def write_return(self) -> None:
+        self.output.append("return")
+
+
+class CodeGenerator:
+    def __init__(
+        self, info: ClassInfo, optimize: bool = False, intern_strings: bool = False
+    ) -> None:
+        self.info = info
+        self.optimize = optimize
+        self.intern_strings = intern_strings
+        self.vm_writer = VMWriter()
+        self.scope = Scope(info.name, {})
+        self.counter = 0
+        self.strings: Dict[str, int] = {}
+        self.string_uses = 0
+        self.emitters: Dict[type, Callable[[Any], None]] = {
+            Constant: self.write_constant,
+            KeywordConstant: self.write_keyword,
+            StringConstant: self.write_string,
+            Variable: self.write_variable_term,
+            ArrayAccess: self.write_array_access,
+            Call: self.write_call,
+            Unary: self.write_unary,
+            Binary: self.write_binary,
+            ShiftLeft: self.write_shift_left,
+            Slot: self.write_slot,
+            FieldOf: self.write_field_of,
+        }
+
+    def generate(self, jack_class: JackClass) -> List[str]:
+        for subroutine in jack_class.subroutines:
+            self.write_subroutine(subroutine)
+        if self.strings:
+            self.write_string_table()
+        return self.vm_writer.output
+
+    def write_subroutine(self, subroutine: Subroutine) -> None:
+        self.scope = self.info.scopes[subroutine.name]
+        self.vm_writer.write_function(self.scope.name, self.scope.locals)
+        if subroutine.kind == "method":
+            self.vm_writer.write_push("argument", 0)
+            self.vm_writer.write_pop("pointer", 0)
+        elif subroutine.kind == "constructor":
+            self.vm_writer.write_push("constant", self.info.fields)
+            self.vm_writer.write_call("Memory.alloc", 1)
+            self.vm_writer.write_pop("pointer", 0)
+        self.write_statements(subroutine.body)
+
+    def write_statements(self, statements: Iterable[Statement]) -> None:
+        for statement in statements:
+            if isinstance(statement, LetStatement):
+                self.write_let(statement)
+            elif isinstance(statement, IfStatement):
+                self.write_if(statement)
+            elif isinstance(statement, WhileStatement):
+                self.write_while(statement)
+            elif isinstance(statement, DoStatement):
+                self.write_call(statement.call)
+                self.vm_writer.write_pop("temp", 0)
+            elif isinstance(statement, SetField):
+                self.write_set_field(statement)
+            else:
+                if statement.value is None:
+                    self.vm_writer.write_push("constant", 0)
+                else:
+                    self.write_expression(statement.value)
+                self.vm_writer.write_return()
+
+    def write_let(self, statement: LetStatement) -> None:
+        if statement.index is None:
+            self.write_expression(statement.value)
+            self.write_pop_variable(statement.name)
+            return
+
+        offset = self.constant_index(statement.index)
+        if offset is not None and is_pure(statement.value):
+            self.write_expression(statement.value)
+            self.write_variable(statement.name)
+            self.vm_writer.write_pop("pointer", 1)
+            self.vm_writer.write_pop("that", offset)
+            return
+
+        self.write_variable(statement.name)
+        if offset is None:
+            self.write_expression(statement.index)
+            self.vm_writer.write_arithmetic("add")
+        self.write_expression(statement.value)
+        self.vm_writer.write_pop("temp", 0)
+        self.vm_writer.write_pop("pointer", 1)
+        self.vm_writer.write_push("temp", 0)
+        self.vm_writer.write_pop("that", offset or 0)
+
+    def constant_index(self, index: Expression) -> Optional[int]:
+        if self.optimize and isinstance(index, Constant) and index.value >= 0:
+            return index.value
+        return None
+
+    def write_set_field(self, statement: SetField) -> None:
+        if statement.receiver is None:
+            self.write_expression(statement.value)
+            self.vm_writer.write_pop("this", statement.index)
+        elif is_pure(statement.value):
+            self.write_expression(statement.value)
+            self.write_variable(statement.receiver)
+            self.vm_writer.write_pop("pointer", 1)
+            self.vm_writer.write_pop("that", statement.index)
+        else:
+            self.write_variable(statement.receiver)
+            self.write_expression(statement.value)
+            self.vm_writer.write_pop("temp", 0)
+            self.vm_writer.write_pop("pointer", 1)
+            self.vm_writer.write_push("temp", 0)
+            self.vm_writer.write_pop("that", statement.index)
+
+    def write_while(self, statement: WhileStatement) -> None:
+        while1 = "WHILE_EXP" + str(self.counter)
+        while2 = "WHILE_END" + str(self.counter)
+        self.counter += 1
+        self.vm_writer.write_label(while1)
+        self.write_expression(statement.condition)
+        self.vm_writer.write_arithmetic("not")
+        self.vm_writer.write_if_goto(while2)
+        self.write_statements(statement.body)
+        self.vm_writer.write_goto(while1)
+        self.vm_writer.write_label(while2)
+
+    def write_if(self, statement: IfStatement) -> None:
+        if1 = "IF_TRUE" + str(self.counter)
+        if2 = "IF_FALSE" + str(self.counter)
+        self.counter += 1
+        self.write_expression(statement.condition)
+        self.vm_writer.write_arithmetic("not")
+        self.vm_writer.write_if_goto(if1)
+        self.write_statements(statement.then)
+        self.vm_writer.write_goto(if2)
+        self.vm_writer.write_label(if1)
+        self.write_statements(statement.otherwise)
+        self.vm_writer.write_label(if2)
+
+    def write_expression(self, expression: Expression) -> None:
+        self.emitters[type(expression)](expression)
+
+    def write_constant(self, constant: Constant) -> None:
+        if constant.value < 0:
+            self.vm_writer.write_push("constant", ~constant.value)
+            self.vm_writer.write_arithmetic("not")
+        else:
+            self.vm_writer.write_push("constant", constant.value)
+
+    def write_keyword(self, keyword: KeywordConstant) -> None:
+        if keyword.keyword == "this":
+            self.vm_writer.write_push("pointer", 0)
+        elif keyword.keyword == "true":
+            self.vm_writer.write_push("constant", 0)
+            self.vm_writer.write_arithmetic("not")
+        else:
+            self.vm_writer.write_push("constant", 0)
+
+    def write_string(self, string: StringConstant) -> None:
+        if self.intern_strings:
+            self.write_interned_string(string.text)
+            return
+
+        self.write_new_string(string.text)
+
+    def write_new_string(self, text: str) -> None:
+        self.vm_writer.write_push("constant", len(text))
+        self.vm_writer.write_call("String.new", 1)
+        for char in text:
+            self.vm_writer.output += (f"push constant {ord(char)}", APPEND_CHAR)
+
+    # Interned literals live in hidden statics after the declared ones. A static
+    # starts at 0, so the first use that finds it unset builds the whole table.
+    def write_interned_string(self, text: str) -> None:
+        index = self.strings.setdefault(text, self.info.statics + len(self.strings))
+        ready = f"STRING_READY{self.string_uses}"
+        self.string_uses += 1
+        self.vm_writer.write_push("static", index)
+        self.vm_writer.write_if_goto(ready)
+        self.vm_writer.write_call(f"{self.info.name}.{STRINGS_FUNCTION}", 0)
+        self.vm_writer.write_pop("temp", 0)
+        self.vm_writer.write_label(ready)
+        self.vm_writer.write_push("static", index)
+
+    def write_string_table(self) -> None:
+        self.vm_writer.write_function(f"{self.info.name}.{STRINGS_FUNCTION}", 0)
+        for text, index in self.strings.items():
+            self.write_new_string(text)
+            self.vm_writer.write_pop("static", index)
+        self.vm_writer.write_push("constant", 0)
+        self.vm_writer.write_return()
+
+    def write_array_access(self, access: ArrayAccess) -> None:
+        offset = self.constant_index(access.index)
+        if offset is not None:
+            self.write_variable(access.name)
+            self.vm_writer.write_pop("pointer", 1)
+            self.vm_writer.write_push("that", offset)
+            return
+
+        self.write_variable(access.name)
+        self.write_expression(access.index)
+        self.vm_writer.write_arithmetic("add")
+        self.vm_writer.write_pop("pointer", 1)
+        self.vm_writer.write_push("that", 0)
+
+    def write_unary(self, unary: Unary) -> None:
+        self.write_expression(unary.operand)
+        self.vm_writer.write_arithmetic("neg" if unary.operator == "-" else "not")
+
+    def write_binary(self, binary: Binary) -> None:
+        self.write_expression(binary.left)
+        self.write_expression(binary.right)
+        if binary.operator in MATH_CALLS:
+            self.vm_writer.write_call(MATH_CALLS[binary.operator], 2)
+        else:
+            self.vm_writer.write_arithmetic(MATH_MAPPINGS[binary.operator])
+
+    def write_slot(self, slot: Slot) -> None:
+        self.vm_writer.write_push(slot.segment, slot.index)
+
+    def write_field_of(self, field: FieldOf) -> None:
+        self.write_variable(field.receiver)
+        self.vm_writer.write_pop("pointer", 1)
+        self.vm_writer.write_push("that", field.index)
+
+    def write_variable_term(self, variable: Variable) -> None:
+        self.write_variable(variable.name)
+
+    def write_variable(self, var_name: str) -> None:
+        self.vm_writer.output.append(self.scope.resolve(var_name).push)
+
+    def write_pop_variable(self, var_name: str) -> None:
+        self.vm_writer.output.append(self.scope.resolve(var_name).pop)
+
+    def write_call(self, call: Call) -> None:
+        args_num = len(call.arguments)
+        if call.receiver is None:
+            class_name = self.info.name
+            args_num += 1
+            self.vm_writer.write_push("pointer", 0)
+        elif call.receiver in self.scope.symbols:
+            class_name = self.scope.symbols[call.receiver].type
+            args_num += 1
+            self.write_variable(call.receiver)
+        else:
+            class_name = call.receiver
+        for argument in call.arguments:
+            self.write_expression(argument)
+        self.vm_writer.write_call(class_name + "." + call.name, args_num)
+
+    def write_shift_left(self, shift: ShiftLeft) -> None:
+        bits = shift.bits
+        if isinstance(shift.operand, Variable):
+            self.write_variable(shift.operand.name)
+            self.write_variable(shift.operand.name)
+            self.vm_writer.write_arithmetic("add")
+            bits -= 1
+        else:
+            self.write_expression(shift.operand)
+        for _ in range(bits):
+            self.vm_writer.write_pop("temp", 1)
+            self.vm_writer.write_push("temp", 1)
+            self.vm_writer.write_push("temp", 1)
+            self.vm_writer.write_arithmetic("add")
+
+
+def generate(
+    jack_class: JackClass,
+    info: ClassInfo,
+    optimize: bool = False,
+    intern_strings: bool = False,
+) -> List[str]:
+    return CodeGenerator(info, optimize, intern_strings).generate(jack_class)
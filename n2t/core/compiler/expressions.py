@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple, Union
+
+WORD_BITS = 16
+WORD = 1 << WORD_BITS
+TRUE = -1
+FALSE = 0
+
+
+@dataclass(slots=True)
+class Constant:
+    value: int
+
+
+@dataclass(slots=True)
+class KeywordConstant:
+    keyword: str
+
+
+@dataclass(slots=True)
+class StringConstant:
+    text: str
+
+
+@dataclass(slots=True)
+class Variable:
+    name: str
+
+
+@dataclass(slots=True)
+class ArrayAccess:
+    name: str
+    index: Expression
+
+
+@dataclass(slots=True)
+class Call:
+    receiver: Optional[str]
+    name: str
+    arguments: Tuple[Expression, ...]
+
+
+@dataclass(slots=True)
+class Unary:
+    operator: str
+    operand: Expression
+
+
+@dataclass(slots=True)
+class Binary:
+    operator: str
+    left: Expression
+    right: Expression
+
+
+@dataclass(slots=True)
+class ShiftLeft:
+    operand: Expression
+    bits: int
+
+
+@dataclass(slots=True)
+class Slot:
+    segment: str
+    index: int
+
+
+@dataclass(slots=True)
+class FieldOf:
+    receiver: str
+    index: int
+
+
+Expression = Union[
+    Constant,
+    KeywordConstant,
+    StringConstant,
+    Variable,
+    ArrayAccess,
+    Call,
+    Unary,
+    Binary,
+    ShiftLeft,
+    Slot,
+    FieldOf,
+]
+
+KEYWORD_VALUES = {"true": TRUE, "false": FALSE, "null": FALSE}
+COMMUTATIVE = frozenset(["+", "*", "&", "|", "="])
+
+
+def word(value: int) -> int:
+    return (value + WORD // 2) % WORD - WORD // 2
+
+
+def is_pure(expression: Expression) -> bool:
+    if isinstance(expression, (Call, StringConstant)):
+        return False
+    if isinstance(expression, ArrayAccess):
+        return is_pure(expression.index)
+    if isinstance(expression, (Unary, ShiftLeft)):
+        return is_pure(expression.operand)
+    if isinstance(expression, Binary):
+        return is_pure(expression.left) and is_pure(expression.right)
+    return True
+
+
+def transform(
+    expression: Expression, rewrite: Callable[[Expression], Expression]
+) -> Expression:
+    if isinstance(expression, ArrayAccess):
+        expression = ArrayAccess(expression.name, transform(expression.index, rewrite))
+    elif isinstance(expression, Call):
+        arguments = tuple(
+            transform(argument, rewrite) for argument in expression.arguments
+        )
+        expression = Call(expression.receiver, expression.name, arguments)
+    elif isinstance(expression, Unary):
+        expression = Unary(expression.operator, transform(expression.operand, rewrite))
+    elif isinstance(expression, Binary):
+        expression = Binary(
+            expression.operator,
+            transform(expression.left, rewrite),
+            transform(expression.right, rewrite),
+        )
+    return rewrite(expression)
+
+
+def fold(operator: str, left: int, right: int) -> Optional[int]:
+    if operator == "+":
+        return word(left + right)
+    if operator == "-":
+        return word(left - right)
+    if operator == "*":
+        return word(left * right)
+    if operator == "/":
+        if right == 0:
+            return None
+        quotient = abs(left) // abs(right)
+        return word(-quotient if (left < 0) != (right < 0) else quotient)
+    if operator == "&":
+        return left & right
+    if operator == "|":
+        return left | right
+    # lt and gt test the sign of x - y, which wraps for operands far apart.
+    if operator == "<":
+        return TRUE if word(left - right) < 0 else FALSE
+    if operator == ">":
+        return TRUE if word(left - right) > 0 else FALSE
+    if operator == "=":
+        return TRUE if left == right else FALSE
+    return None
+
+
+def power_of_two(value: int) -> Optional[int]:
+    unsigned = value % WORD
+    if unsigned == 0 or unsigned & (unsigned - 1):
+        return None
+    return unsigned.bit_length() - 1
+
+
+def simplify(expression: Expression) -> Expression:
+    if isinstance(expression, KeywordConstant):
+        if expression.keyword in KEYWORD_VALUES:
+            return Constant(KEYWORD_VALUES[expression.keyword])
+        return expression
+    if isinstance(expression, ArrayAccess):
+        return ArrayAccess(expression.name, simplify(expression.index))
+    if isinstance(expression, Call):
+        arguments = tuple(simplify(argument) for argument in expression.arguments)
+        return Call(expression.receiver, expression.name, arguments)
+    if isinstance(expression, Unary):
+        return unary(expression.operator, simplify(expression.operand))
+    if isinstance(expression, Binary):
+        return binary(
+            expression.operator, simplify(expression.left), simplify(expression.right)
+        )
+    return expression
+
+
+def unary(operator: str, operand: Expression) -> Expression:
+    if isinstance(operand, Constant):
+        value = operand.value
+        return Constant(word(-value) if operator == "-" else ~value)
+    if isinstance(operand, Unary) and operand.operator == operator:
+        return operand.operand
+    return Unary(operator, operand)
+
+
+def binary(operator: str, left: Expression, right: Expression) -> Expression:
+    if isinstance(left, Constant) and isinstance(right, Constant):
+        folded = fold(operator, left.value, right.value)
+        if folded is not None:
+            return Constant(folded)
+
+    swapped = operator in COMMUTATIVE and isinstance(left, Constant)
+    if swapped:
+        left, right = right, left
+    if not isinstance(right, Constant):
+        if operator == "-" and isinstance(left, Constant) and left.value == 0:
+            return unary("-", right)
+        return Binary(operator, left, right)
+
+    value = right.value
+    if operator in ("+", "-") and value == 0:
+        return left
+    if operator in ("+", "-") and value < 0 and value != -WORD // 2:
+        return Binary("-" if operator == "+" else "+", left, Constant(-value))
+    if operator == "*":
+        product = multiply(left, value)
+        if product is not None:
+            return product
+        # Math.multiply loops over the bits of y, so keep the written order.
+        return (
+            Binary(operator, right, left) if swapped else Binary(operator, left, right)
+        )
+    if operator == "/" and value in (1, -1):
+        return left if value == 1 else unary("-", left)
+    if operator == "&" and value == TRUE or operator == "|" and value == FALSE:
+        return left
+    if is_pure(left) and (
+        operator == "&" and value == FALSE or operator == "|" and value == TRUE
+    ):
+        return right
+    return Binary(operator, left, right)
+
+
+def multiply(operand: Expression, value: int) -> Optional[Expression]:
+    if value == 0 and is_pure(operand):
+        return Constant(0)
+    if value == 1:
+        return operand
+    if value == -1:
+        return unary("-", operand)
+
+    bits = power_of_two(value)
+    if bits is not None:
+        return ShiftLeft(operand, bits)
+    bits = power_of_two(-value)
+    if bits is not None:
+        return unary("-", ShiftLeft(operand, bits))
+    return None
@@ -1,143 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable
-
-KEYWORD = 0
-SYMBOL = 1
-IDENTIFIER = 2
-INT_CONST = 3
-STRING_CONST = 4
-
-KEYWORDS = [
-    "class",
-    "constructor",
-    "function",
-    "method",
-    "field",
-    "static",
-    "var",
-    "int",
-    "char",
-    "boolean",
-    "void",
-    "true",
-    "false",
-    "null",
-    "this",
-    "let",
-    "do",
-    "if",
-    "else",
-    "while",
-    "return",
-]
-
-SYMBOLS = [
-    "{",
-    "}",
-    "(",
-    ")",
-    "[",
-    "]",
-    ".",
-    ",",
-    ";",
-    "+",
-    "-",
-    "*",
-    "/",
-    "&",
-    "|",
-    "<",
-    ">",
-    "=",
-    "~",
-]
-
-EXPR_OPS = ["+", "-", "*", "/", "&", "|", "<", ">", "="]
-
-STATEMENTS = ["do", "let", "while", "return", "if"]
-
-COMPARATOR = ["<", ">", "&"]
-
-
-class SymbolTable:
-    def __init__(self) -> None:
-        self.next_index = {"static": 0, "this": 0, "argument": 0, "local": 0}
-        self.class_table: Dict[str, Any] = {}
-        self.subroutine_table: Dict[str, Any] = {}
-
-    def define(self, name: str, type: str, kind: str) -> None:
-        kind = kind if kind != "field" else "this"
-        if kind == "static" or kind == "this":
-            self.class_table[name] = (type, kind, self.var_count(kind))
-            self.next_index[kind] += 1
-        elif kind in ["local", "argument"]:
-            self.class_table[name] = (type, kind, self.var_count(kind))
-            self.next_index[kind] += 1
-
-    def __contains__(self, name: str) -> bool:
-        return self.get_row_by_name(name) is not None
-
-    def start_subroutine(self) -> None:
-        self.subroutine_table = {}
-        self.next_index["local"] = 0
-        self.next_index["argument"] = 0
-
-    def var_count(self, kind: str) -> int:
-        return self.next_index[kind]
-
-    def kind_of(self, name: str) -> str | None:
-        entry = self.get_row_by_name(name)
-        return entry[1] if entry else None
-
-    def type_of(self, name: str) -> str | None:
-        entry = self.get_row_by_name(name)
-        return entry[0] if entry else None
-
-    def index_of(self, name: str) -> int | None:
-        entry = self.get_row_by_name(name)
-        return entry[2] if entry else None
-
-    def get_row_by_name(self, name: str) -> Any:
-        if name in self.subroutine_table:
-            return self.subroutine_table[name]
-        elif name in self.class_table:
-            return self.class_table[name]
-        return None
-
-
-class VMWriter:
-    def __init__(self) -> None:
-        self.unique_counter = 0
-
-    def write_push(self, segment: Any, index: Any) -> list[str]:
-        return [f"push {segment} {index}"]
-
-    def write_pop(self, segment: Any, index: Any) -> list[str]:
-        return [f"pop {segment} {index}"]
-
-    def write_arithmetic(self, command: str) -> list[str]:
-        return [f"{command}"]
-
-    def write_label(self, label: str) -> list[str]:
-        return [f"label {label}"]
-
-    def write_goto(self, label: str) -> list[str]:
-        return [f"goto {label}"]
-
-    def write_if_goto(self, label: str) -> list[str]:
-        return [f"if-goto {label}"]
-
-    def write_call(self, name: str, args_num: Any) -> list[str]:
-        return [f"call {name} {args_num}"]
-
-    def write_function(self, name: str, locals_num: Any) -> list[str]:
-        return [f"function {name} {locals_num}"]
-
-    def write_return(self) -> list[str]:
-        return ["return"]
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from n2t.core.compiler.codegen import generate as generate_vm
+from n2t.core.compiler.inlining import InlinedCall, ProgramIndex, inline_calls
+from n2t.core.compiler.parser import parse
+from n2t.core.compiler.passes import fold_constants
+from n2t.core.compiler.semantics import ClassInfo, analyze
+from n2t.core.compiler.syntax import JackClass
+from n2t.core.compiler.tokenizer import (
+    IDENTIFIER,
+    INT_CONST,
+    KEYWORD,
+    KEYWORD_SET,
+    STRING_CONST,
+    SYMBOL,
+    SYMBOL_SET,
+    Tokens,
+    scan,
+)
+
+COMPARATOR = frozenset(["<", ">", "&"])
+
+ParsedClass = Tuple[JackClass, ClassInfo]
 
 
 class WordInfo:
@@ -145,9 +31,9 @@ class WordInfo:
         self.word = current_word
 
     def token_type(self) -> int:
-        if self.word in KEYWORDS:
+        if self.word in KEYWORD_SET:
             return KEYWORD
-        elif self.word in SYMBOLS:
+        elif self.word in SYMBOL_SET:
             return SYMBOL
         elif self.word[0] == '"':
             return STRING_CONST
@@ -157,13 +43,13 @@ class WordInfo:
             return IDENTIFIER
 
     def keyword(self) -> str:
-        if self.word in KEYWORDS:
+        if self.word in KEYWORD_SET:
             return self.word
         else:
             raise BaseException("Error")
 
     def symbol(self) -> str:
-        if self.word in SYMBOLS:
+        if self.word in SYMBOL_SET:
             if self.word in COMPARATOR:
                 if self.word == ">":
                     return "&gt;"
@@ -196,52 +82,6 @@ class WordInfo:
             raise BaseException("Error")
 
 
-def find_tokens(line: str) -> list[str]:
-    result = []
-    curr = ""
-    i = 0
-    while i < len(line):
-        ch = line[i]
-        if ch in SYMBOLS:
-            result.append(ch)
-            i += 1
-        elif ch == '"':
-            curr += ch
-            i += 1
-            ch = ""
-            while not ch == '"':
-                ch = line[i]
-                curr += ch
-                i += 1
-            result.append(curr)
-            curr = ""
-        elif ch.isalpha():
-            curr += ch
-            i += 1
-            while ch.isalpha() or ch.isdigit() or ch == "_":
-                ch = line[i]
-                if ch in SYMBOLS:
-                    break
-                curr += ch
-                i += 1
-            result.append(curr)
-            curr = ""
-        elif ch.isdigit():
-            curr += ch
-            i += 1
-            while ch.isdigit():
-                ch = line[i]
-                if ch in SYMBOLS:
-                    break
-                curr += ch
-                i += 1
-            result.append(curr)
-            curr = ""
-        else:
-            i += 1
-    return result
-
-
 def generate(word: str) -> str:
     w = WordInfo(word)
     res = ""
@@ -268,423 +108,74 @@ def generate(word: str) -> str:
     return res
 
 
-class CompilationEngine:
-    def __init__(self, tokens: list[str]):
-        self.subroutine_name = ""
-        self.subroutine_type = ""
-        self.i = 0
-        self.tokens = tokens
-        self.vm_writer = VMWriter()
-        self.symbol_table = SymbolTable()
-        self.counter = 0
-        self.class_name = ""
-        self.math_mappings = {
-            "+": "add",
-            "-": "sub",
-            "*": "Math.multiply",
-            "/": "Math.divide",
-            "&": "and",
-            "|": "or",
-            "<": "lt",
-            ">": "gt",
-            "=": "eq",
-        }
-
-    def compile_class(self) -> list[str]:
-        result = []
-        self.i += 1
-        curr = self.tokens[self.i]
-        self.class_name = curr
-        self.i += 1
-        self.i += 1
-        curr = self.tokens[self.i]
-        while curr == "static" or curr == "field":
-            self.compile_class_var_dec()
-            self.i += 1
-            curr = self.tokens[self.i]
-
-        while curr == "constructor" or curr == "function" or curr == "method":
-            result += self.compile_subroutine()
-            self.i += 1
-            curr = self.tokens[self.i]
-        return result
-
-    def compile_class_var_dec(self) -> None:
-        kind = self.tokens[self.i]
-        self.i += 1
-        type = self.tokens[self.i]
-        curr = type
-        while True:
-            self.i += 1
-            self.symbol_table.define(self.tokens[self.i], type, kind)
-            self.i += 1
-            curr = self.tokens[self.i]
-            if curr != ",":
-                break
-
-    def compile_subroutine(self) -> list[str]:
-        result = []
-        self.symbol_table.start_subroutine()
-        self.subroutine_type = self.tokens[self.i]
-        if self.subroutine_type == "method":
-            self.symbol_table.define("this", self.class_name, "argument")
-        self.i += 1
-        self.i += 1
-        self.subroutine_name = self.tokens[self.i]
-        self.i += 1
-        self.i += 1
-        self.compile_parameter_list()
-        self.i += 1
-        self.i += 1
-        local_vars = 0
-        curr = self.tokens[self.i]
-        while curr == "var":
-            local_vars += self.compile_var_dec()
-            self.i += 1
-            curr = self.tokens[self.i]
-        result += self.vm_writer.write_function(
-            self.class_name + "." + self.subroutine_name, local_vars
-        )
-        if self.subroutine_type == "method":
-            result += self.vm_writer.write_push("argument", 0)
-            result += self.vm_writer.write_pop("pointer", 0)
-        elif self.subroutine_type == "constructor":
-            result += self.vm_writer.write_push(
-                "constant", self.symbol_table.var_count("this")
-            )
-            result += self.vm_writer.write_call("Memory.alloc", 1)
-            result += self.vm_writer.write_pop("pointer", 0)
-        result += self.compile_statements()
-        return result
-
-    def compile_parameter_list(self) -> None:
-        curr = self.tokens[self.i]
-        while curr != ")":
-            info = WordInfo(curr)
-            type = info.token_type()
-            self.i += 1
-            curr = self.tokens[self.i]
-            self.symbol_table.define(curr, str(type), "argument")
-            self.i += 1
-            curr = self.tokens[self.i]
-            if curr == ",":
-                self.i += 1
-                curr = self.tokens[self.i]
-
-    def compile_var_dec(self) -> int:
-        var_num = 0
-        self.i += 1
-        curr = self.tokens[self.i]
-        type = curr
-        while curr != ";":
-            var_num += 1
-            self.i += 1
-            curr = self.tokens[self.i]
-            var_name = curr
-            self.symbol_table.define(var_name, type, "local")
-            self.i += 1
-            curr = self.tokens[self.i]
-        return var_num
-
-    def compile_statements(self) -> list[str]:
-        result = []
-        curr = self.tokens[self.i]
-        while curr in STATEMENTS:
-            if curr == "do":
-                result += self.compile_do()
-            elif curr == "let":
-                result += self.compile_let()
-            elif curr == "while":
-                result += self.compile_while()
-            elif curr == "return":
-                result += self.compile_return()
-            elif curr == "if":
-                result += self.compile_if()
-            curr = self.tokens[self.i]
-        return result
-
-    def compile_subroutine_call(self) -> list[str]:
-        name = self.tokens[self.i]
-        self.i += 1
-        result = []
-        args_num = 1
-        class_name: str = self.class_name
-        curr = self.tokens[self.i]
-        if curr == ".":
-            if name not in self.symbol_table:
-                args_num = 0
-                class_name = name
-            else:
-                class_name = str(self.symbol_table.type_of(name))
-                result += self.vm_writer.write_push(
-                    self.symbol_table.kind_of(name), self.symbol_table.index_of(name)
-                )
-            self.i += 1
-            curr = self.tokens[self.i]
-            name = curr
-            self.i += 1
-            curr = self.tokens[self.i]
-        else:
-            result += self.vm_writer.write_push("pointer", 0)
-        subroutine_name = class_name + "." + name
-        self.i += 1
-        tmp = self.compile_expression_list()
-        args_num += tmp[1]
-        result += tmp[0]
-        result += self.vm_writer.write_call(subroutine_name, args_num)
-        self.i += 1
-        return result
-
-    def compile_do(self) -> list[str]:
-        result = []
-        self.i += 1
-        result += self.compile_subroutine_call()
-        result += self.vm_writer.write_pop("temp", 0)
-        self.i += 1
-        return result
-
-    def compile_let(self) -> list[str]:
-        result = []
-        self.i += 1
-        var_name = self.tokens[self.i]
-        self.i += 1
-        curr = self.tokens[self.i]
-        if curr == "[":
-            self.i += 1
-            curr = self.tokens[self.i]
-            result += self.vm_writer.write_push(
-                self.symbol_table.kind_of(var_name),
-                self.symbol_table.index_of(var_name),
-            )
-            result += self.compile_expression()
-            result += self.vm_writer.write_arithmetic("add")
-            self.i += 1
-            self.i += 1
-            result += self.compile_expression()
-            result += self.vm_writer.write_pop("temp", 0)
-            result += self.vm_writer.write_pop("pointer", 1)
-            result += self.vm_writer.write_push("temp", 0)
-            result += self.vm_writer.write_pop("that", 0)
-        else:
-            self.i += 1
-            result += self.compile_expression()
-            result += self.vm_writer.write_pop(
-                self.symbol_table.kind_of(var_name),
-                self.symbol_table.index_of(var_name),
-            )
-        self.i += 1
-        return result
-
-    def compile_while(self) -> list[str]:
-        result = []
-        while1 = "WHILE_EXP" + str(self.counter)
-        while2 = "WHILE_END" + str(self.counter)
-        self.counter += 1
-        self.i += 1
-        self.i += 1
-        result += self.vm_writer.write_label(while1)
-        result += self.compile_expression()
-        result += self.vm_writer.write_arithmetic("not")
-        result += self.vm_writer.write_if_goto(while2)
-        self.i += 1
-        self.i += 1
-        result += self.compile_statements()
-        result += self.vm_writer.write_goto(while1)
-        result += self.vm_writer.write_label(while2)
-        self.i += 1
-        return result
-
-    def compile_return(self) -> list[str]:
-        result = []
-        self.i += 1
-        curr = self.tokens[self.i]
-        if curr == ";":
-            result += self.vm_writer.write_push("constant", 0)
-        else:
-            result += self.compile_expression()
-        result += self.vm_writer.write_return()
-        self.i += 1
-        return result
-
-    def compile_if(self) -> list[str]:
-        result = []
-        if1 = "IF_TRUE" + str(self.counter)
-        if2 = "IF_FALSE" + str(self.counter)
-        self.counter += 1
-        self.i += 1
-        curr = self.tokens[self.i]
-        self.i += 1
-        curr = self.tokens[self.i]
-        result += self.compile_expression()
-        result += self.vm_writer.write_arithmetic("not")
-        self.i += 1
-        curr = self.tokens[self.i]
-        self.i += 1
-        curr = self.tokens[self.i]
-        result += self.vm_writer.write_if_goto(if1)
-        result += self.compile_statements()
-        result += self.vm_writer.write_goto(if2)
-        self.i += 1
-        curr = self.tokens[self.i]
-        result += self.vm_writer.write_label(if1)
-        curr = self.tokens[self.i]
-        if curr == "else":
-            self.i += 1
-            curr = self.tokens[self.i]
-            self.i += 1
-            curr = self.tokens[self.i]
-            result += self.compile_statements()
-            self.i += 1
-            curr = self.tokens[self.i]
-        result += self.vm_writer.write_label(if2)
-        return result
-
-    def compile_expression(self) -> list[str]:
-        result = []
-        result += self.compile_term()
-        curr = self.tokens[self.i]
-        while curr in EXPR_OPS:
-            operator = curr
-            self.i += 1
-            curr = self.tokens[self.i]
-            result += self.compile_term()
-            command = self.math_mappings[operator]
-            if operator in ["*", "/"]:
-                result += self.vm_writer.write_call(command, 2)
-            else:
-                result += self.vm_writer.write_arithmetic(command)
-        return result
-
-    def compile_term(self) -> list[str]:
-        result = []
-        curr = self.tokens[self.i]
-        w = WordInfo(curr)
-        if curr == "(":
-            self.i += 1
-            curr = self.tokens[self.i]
-            result += self.compile_expression()
-            self.i += 1
-            curr = self.tokens[self.i]
-        elif curr == "-" or curr == "~":
-            self.i += 1
-            curr = self.tokens[self.i]
-            result += self.compile_term()
-            arithmetic = "neg" if curr == "-" else "not"
-            result += self.vm_writer.write_arithmetic(arithmetic)
-        elif w.token_type() == IDENTIFIER:
-            result += self.compile_term_identifier()
-        elif (
-            w.token_type() == INT_CONST
-            or w.token_type() == STRING_CONST
-            or w.token_type() == KEYWORD
-        ):
-            result += self.compile_term_constants()
-        return result
-
-    def compile_term_constants(self) -> list[str]:
-        result = []
-        curr = self.tokens[self.i]
-        info = WordInfo(curr)
-        if info.token_type() == INT_CONST:
-            result += self.vm_writer.write_push("constant", curr)
-        elif info.token_type() == KEYWORD:
-            if curr == "this":
-                result += self.vm_writer.write_push("pointer", 0)
-            elif curr == "true":
-                result += self.vm_writer.write_push("constant", 0)
-                result += self.vm_writer.write_arithmetic("not")
-            else:
-                result += self.vm_writer.write_push("constant", 0)
-        else:
-            curr = curr[1:-1]
-            length = len(curr)
-            result += self.vm_writer.write_push("constant", length)
-            result += self.vm_writer.write_call("String.new", 1)
-            for char in curr:
-                result += self.vm_writer.write_push("constant", ord(char))
-                result += self.vm_writer.write_call("String.appendChar", 2)
-        self.i += 1
-        return result
-
-    def compile_term_identifier(self) -> list[str]:
-        result = []
-        self.i += 1
-        curr = self.tokens[self.i]
-        if curr == "[":
-            var_name = self.tokens[self.i - 1]
-            result += self.vm_writer.write_push(
-                self.symbol_table.kind_of(var_name),
-                self.symbol_table.index_of(var_name),
-            )
-            self.i += 1
-            curr = self.tokens[self.i]
-            result += self.compile_expression()
-            result += self.vm_writer.write_arithmetic("add")
-            result += self.vm_writer.write_pop("pointer", 1)
-            result += self.vm_writer.write_push("that", 0)
-            self.i += 1
-            curr = self.tokens[self.i]
-        elif curr == "(" or curr == ".":
-            self.i -= 1
-            result += self.compile_subroutine_call()
-        else:
-            var_name = self.tokens[self.i - 1]
-            segment = self.symbol_table.kind_of(var_name)
-            index = self.symbol_table.index_of(var_name)
-            result += self.vm_writer.write_push(segment, index)
-        return result
+@dataclass
+class ProgramOutput:
+    vm_code: Dict[str, List[str]] = field(default_factory=dict)
+    inlined: List[InlinedCall] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
 
-    def compile_expression_list(self) -> tuple[list[Any], int]:
-        result = []
-        args_num = 0
-        curr = self.tokens[self.i]
-        while curr != ")":
-            args_num += 1
-            result += self.compile_expression()
-            curr = self.tokens[self.i]
-            if curr == ",":
-                self.i += 1
-                curr = self.tokens[self.i]
-        return result, args_num
+    @property
+    def cycles_saved(self) -> int:
+        return sum(call.cycles for call in self.inlined)
 
 
 @dataclass
 class JackCompiler:
+    optimize: bool = False
+    intern_strings: bool = False
+
     @classmethod
-    def create(cls) -> JackCompiler:
-        return cls()
+    def create(
+        cls, optimize: bool = False, intern_strings: bool = False
+    ) -> JackCompiler:
+        return cls(optimize, intern_strings)
 
     def compile(self, jack_code: Iterable[str]) -> Iterable[str]:
-        tokens = []
-        # result = ["<tokens>"]
-        for line in jack_code:
-            stripped_line = line.strip()
-            if not stripped_line:
-                continue
-            if (
-                stripped_line[0] == "*"
-                or stripped_line[0:2] == "//"
-                or stripped_line[0:2] == "/*"
-            ):
-                continue
-            comment_index = stripped_line.find("//")
-            if comment_index != -1:
-                stripped_line = stripped_line[:comment_index]
-            stripped_line = stripped_line.strip()
-            if not stripped_line:
+        return self.generate_code(*self.parse_class(jack_code))
+
+    def parse_class(self, jack_code: Iterable[str]) -> ParsedClass:
+        return self.parse_tokens(self.tokenize(jack_code))
+
+    def tokenize(self, jack_code: Iterable[str]) -> Tokens:
+        return scan("\n".join(jack_code))
+
+    def parse_tokens(self, tokens: Tokens) -> ParsedClass:
+        jack_class = parse(*tokens)
+        info = analyze(jack_class)
+        if self.optimize:
+            jack_class = fold_constants(jack_class)
+        return jack_class, info
+
+    def generate_code(self, jack_class: JackClass, info: ClassInfo) -> List[str]:
+        return generate_vm(jack_class, info, self.optimize, self.intern_strings)
+
+    # A class that fails is reported in errors; the rest are still compiled,
+    # just without inlining calls into the failed class.
+    def compile_program(
+        self, sources: Sequence[Tuple[str, Iterable[str]]]
+    ) -> ProgramOutput:
+        output = ProgramOutput()
+        index = ProgramIndex()
+        program = []
+        for name, jack_code in sources:
+            try:
+                jack_class, info = self.parse_class(jack_code)
+                index.add(jack_class, info)
+            except KeyboardInterrupt:
+                raise
+            except BaseException as error:
+                output.errors[name] = repr(error)
                 continue
-            comment_index = stripped_line.find("/*")
-            if comment_index != -1:
-                stripped_line = stripped_line[:comment_index]
-            stripped_line = stripped_line.strip()
-            if not stripped_line:
+            program.append((name, jack_class, info))
+
+        for name, jack_class, info in program:
+            try:
+                jack_class, inlined = inline_calls(jack_class, info, index)
+                output.vm_code[name] = self.generate_code(jack_class, info)
+            except KeyboardInterrupt:
+                raise
+            except BaseException as error:
+                output.errors[name] = repr(error)
                 continue
-            tokens_list = find_tokens(stripped_line)
-            list_stripped = []
-            for word in tokens_list:
-                list_stripped.append(word.strip())
-            tokens += list_stripped
-        ce = CompilationEngine(tokens)
-        result = ce.compile_class()
-        # result.append("</tokens>")
-        return result
+            output.inlined.extend(inlined)
+        return output
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from n2t.core.compiler.expressions import (
+    Call,
+    Constant,
+    Expression,
+    FieldOf,
+    KeywordConstant,
+    Slot,
+    Variable,
+    is_pure,
+    transform,
+)
+from n2t.core.compiler.passes import rewrite_statement
+from n2t.core.compiler.semantics import ClassInfo, Scope
+from n2t.core.compiler.syntax import (
+    DoStatement,
+    IfStatement,
+    JackClass,
+    LetStatement,
+    ReturnStatement,
+    SetField,
+    Statement,
+    Subroutine,
+    WhileStatement,
+)
+
+# Instruction counts of the call and return sequences and of the method
+# prologue emitted by the standard VM translator; each is one cycle.
+CALL_CYCLES = 49
+RETURN_CYCLES = 49
+PROLOGUE_CYCLES = 23
+
+
+@dataclass(frozen=True)
+class ReturnsConstant:
+    value: Expression
+
+
+@dataclass(frozen=True)
+class ReturnsArgument:
+    position: int
+
+
+@dataclass(frozen=True)
+class ReturnsField:
+    index: int
+
+
+@dataclass(frozen=True)
+class ReturnsStatic:
+    index: int
+
+
+@dataclass(frozen=True)
+class SetsField:
+    index: int
+
+
+Body = Union[ReturnsConstant, ReturnsArgument, ReturnsField, ReturnsStatic, SetsField]
+
+
+@dataclass(frozen=True)
+class Inlinable:
+    name: str
+    subroutine: Subroutine
+    body: Body
+
+    @property
+    def is_method(self) -> bool:
+        return self.subroutine.kind == "method"
+
+    @property
+    def cycles(self) -> int:
+        prologue = PROLOGUE_CYCLES if self.is_method else 0
+        return CALL_CYCLES + RETURN_CYCLES + prologue
+
+
+@dataclass(frozen=True)
+class InlinedCall:
+    caller: str
+    callee: str
+    cycles: int
+
+
+@dataclass
+class ProgramIndex:
+    classes: Dict[str, ClassInfo] = field(default_factory=dict)
+    inlinable: Dict[str, Inlinable] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, program: Iterable[Tuple[JackClass, ClassInfo]]) -> ProgramIndex:
+        index = cls()
+        for jack_class, info in program:
+            index.add(jack_class, info)
+        return index
+
+    def add(self, jack_class: JackClass, info: ClassInfo) -> None:
+        inlinable = {}
+        for subroutine in jack_class.subroutines:
+            name = f"{jack_class.name}.{subroutine.name}"
+            body = trivial_body(subroutine, info.scopes[subroutine.name])
+            if body is not None:
+                inlinable[name] = Inlinable(name, subroutine, body)
+        self.classes[jack_class.name] = info
+        self.inlinable.update(inlinable)
+
+
+def trivial_body(subroutine: Subroutine, scope: Scope) -> Optional[Body]:
+    if subroutine.kind == "constructor":
+        return None
+
+    body = subroutine.body
+    is_method = subroutine.kind == "method"
+    if len(body) == 1 and isinstance(body[0], ReturnStatement):
+        value = body[0].value
+        if isinstance(value, Constant) or (
+            isinstance(value, KeywordConstant) and value.keyword != "this"
+        ):
+            return ReturnsConstant(value)
+        if not isinstance(value, Variable):
+            return None
+        symbol = scope.resolve(value.name)
+        if symbol.segment == "argument":
+            return ReturnsArgument(symbol.index - (1 if is_method else 0))
+        if symbol.segment == "this" and is_method:
+            return ReturnsField(symbol.index)
+        if symbol.segment == "static":
+            return ReturnsStatic(symbol.index)
+        return None
+
+    if (
+        is_method
+        and len(subroutine.parameters) == 1
+        and len(body) == 2
+        and isinstance(body[0], LetStatement)
+        and body[0].index is None
+        and body[0].value == Variable(subroutine.parameters[0].name)
+        and body[1] == ReturnStatement(None)
+    ):
+        target = scope.resolve(body[0].name)
+        if target.segment == "this":
+            return SetsField(target.index)
+    return None
+
+
+class Inliner:
+    def __init__(self, index: ProgramIndex, info: ClassInfo) -> None:
+        self.index = index
+        self.info = info
+        self.scope = Scope(info.name, {})
+        self.inlined: List[InlinedCall] = []
+
+    def inline_class(self, jack_class: JackClass) -> JackClass:
+        subroutines = []
+        for subroutine in jack_class.subroutines:
+            self.scope = self.info.scopes[subroutine.name]
+            body = self.inline_statements(subroutine.body)
+            subroutines.append(replace(subroutine, body=body))
+        return replace(jack_class, subroutines=tuple(subroutines))
+
+    def inline_statements(
+        self, statements: Sequence[Statement]
+    ) -> Tuple[Statement, ...]:
+        result: List[Statement] = []
+        for statement in statements:
+            if isinstance(statement, DoStatement):
+                result.extend(self.inline_do(statement))
+            elif isinstance(statement, IfStatement):
+                result.append(
+                    IfStatement(
+                        self.inline_expression(statement.condition),
+                        self.inline_statements(statement.then),
+                        self.inline_statements(statement.otherwise),
+                    )
+                )
+            elif isinstance(statement, WhileStatement):
+                result.append(
+                    WhileStatement(
+                        self.inline_expression(statement.condition),
+                        self.inline_statements(statement.body),
+                    )
+                )
+            else:
+                result.append(rewrite_statement(statement, self.inline_expression))
+        return tuple(result)
+
+    def inline_do(self, statement: DoStatement) -> List[Statement]:
+        arguments = tuple(map(self.inline_expression, statement.call.arguments))
+        call = replace(statement.call, arguments=arguments)
+        target = self.target(call)
+        if target is not None and isinstance(target.body, SetsField):
+            self.record(target)
+            return [SetField(self.receiver(call), target.body.index, arguments[0])]
+
+        inlined = self.inline_call(call)
+        if inlined is call or isinstance(inlined, Call):
+            return [DoStatement(inlined)]
+        if is_pure(inlined):
+            return []
+        self.inlined.pop()
+        return [DoStatement(call)]
+
+    def inline_expression(self, expression: Expression) -> Expression:
+        return transform(expression, self.inline_call)
+
+    def inline_call(self, expression: Expression) -> Expression:
+        if not isinstance(expression, Call):
+            return expression
+        target = self.target(expression)
+        if target is None:
+            return expression
+
+        body = target.body
+        receiver = self.receiver(expression)
+        if isinstance(body, ReturnsConstant):
+            result = body.value
+        elif isinstance(body, ReturnsArgument):
+            result = expression.arguments[body.position]
+        elif isinstance(body, ReturnsField):
+            result = Slot("this", body.index)
+            if receiver is not None:
+                result = FieldOf(receiver, body.index)
+        elif isinstance(body, ReturnsStatic) and target.name.startswith(
+            f"{self.info.name}."
+        ):
+            result = Slot("static", body.index)
+        else:
+            return expression
+
+        dropped = [
+            argument for argument in expression.arguments if argument is not result
+        ]
+        if not all(map(is_pure, dropped)):
+            return expression
+        self.record(target)
+        return result
+
+    def receiver(self, call: Call) -> Optional[str]:
+        if call.receiver in self.scope.symbols:
+            return call.receiver
+        return None
+
+    def target(self, call: Call) -> Optional[Inlinable]:
+        if call.receiver is None:
+            class_name, is_method = self.info.name, True
+        elif call.receiver in self.scope.symbols:
+            class_name, is_method = self.scope.symbols[call.receiver].type, True
+        else:
+            class_name, is_method = call.receiver, False
+
+        inlinable = self.index.inlinable.get(f"{class_name}.{call.name}")
+        if (
+            inlinable is None
+            or inlinable.is_method != is_method
+            or len(inlinable.subroutine.parameters) != len(call.arguments)
+        ):
+            return None
+        return inlinable
+
+    def record(self, inlinable: Inlinable) -> None:
+        self.inlined.append(
+            InlinedCall(self.scope.name, inlinable.name, inlinable.cycles)
+        )
+
+
+def inline_calls(
+    jack_class: JackClass, info: ClassInfo, index: ProgramIndex
+) -> Tuple[JackClass, List[InlinedCall]]:
+    inliner = Inliner(index, info)
+    return inliner.inline_class(jack_class), inliner.inlined
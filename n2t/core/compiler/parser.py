@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from n2t.core.compiler.expressions import (
+    ArrayAccess,
+    Binary,
+    Call,
+    Constant,
+    Expression,
+    KeywordConstant,
+    StringConstant,
+    Unary,
+    Variable,
+)
+from n2t.core.compiler.syntax import (
+    DoStatement,
+    IfStatement,
+    JackClass,
+    LetStatement,
+    Parameter,
+    ReturnStatement,
+    Statement,
+    Subroutine,
+    VarDec,
+    WhileStatement,
+)
+from n2t.core.compiler.tokenizer import IDENTIFIER, INT_CONST, STRING_CONST
+
+EXPR_OPS = frozenset(["+", "-", "*", "/", "&", "|", "<", ">", "="])
+
+CLASS_VARS = frozenset(["static", "field"])
+
+SUBROUTINES = frozenset(["constructor", "function", "method"])
+
+KEYWORD_CONSTANTS = frozenset(["true", "false", "null", "this"])
+
+END_OF_FILE = "end of file"
+
+
+class Parser:
+    def __init__(self, types: List[int], tokens: List[str]) -> None:
+        self.types = [*types, -1]
+        self.tokens = [*tokens, END_OF_FILE]
+        self.i = 0
+
+    def expect(self, token: str) -> None:
+        found = self.tokens[self.i]
+        if found != token:
+            raise BaseException(
+                f"Error while parsing: expected {token!r}, got {found!r}"
+            )
+        self.i += 1
+
+    def next(self) -> str:
+        token = self.tokens[self.i]
+        if token == END_OF_FILE:
+            raise BaseException(f"Error while parsing: unexpected {token!r}")
+        self.i += 1
+        return token
+
+    def parse_class(self) -> JackClass:
+        self.expect("class")
+        name = self.next()
+        self.expect("{")
+        variables = []
+        while self.tokens[self.i] in CLASS_VARS:
+            variables.append(self.parse_var_dec(self.next()))
+        subroutines = []
+        while self.tokens[self.i] in SUBROUTINES:
+            subroutines.append(self.parse_subroutine())
+        self.expect("}")
+        return JackClass(name, tuple(variables), tuple(subroutines))
+
+    def parse_var_dec(self, kind: str) -> VarDec:
+        type = self.next()
+        names = [self.next()]
+        while self.next() == ",":
+            names.append(self.next())
+        return VarDec(kind, type, tuple(names))
+
+    def parse_subroutine(self) -> Subroutine:
+        kind = self.next()
+        return_type = self.next()
+        name = self.next()
+        self.expect("(")
+        parameters = []
+        while self.tokens[self.i] != ")":
+            parameters.append(Parameter(self.next(), self.next()))
+            if self.tokens[self.i] == ",":
+                self.i += 1
+        self.i += 1
+        self.expect("{")
+        variables = []
+        while self.tokens[self.i] == "var":
+            self.i += 1
+            variables.append(self.parse_var_dec("local"))
+        body = self.parse_statements()
+        self.expect("}")
+        return Subroutine(
+            kind, return_type, name, tuple(parameters), tuple(variables), body
+        )
+
+    def parse_statements(self) -> Tuple[Statement, ...]:
+        statements: List[Statement] = []
+        while True:
+            curr = self.tokens[self.i]
+            if curr == "let":
+                statements.append(self.parse_let())
+            elif curr == "do":
+                self.i += 1
+                statements.append(DoStatement(self.parse_subroutine_call()))
+                self.expect(";")
+            elif curr == "while":
+                statements.append(self.parse_while())
+            elif curr == "if":
+                statements.append(self.parse_if())
+            elif curr == "return":
+                statements.append(self.parse_return())
+            else:
+                return tuple(statements)
+
+    def parse_let(self) -> LetStatement:
+        self.i += 1
+        name = self.next()
+        index = None
+        if self.tokens[self.i] == "[":
+            self.i += 1
+            index = self.parse_expression()
+            self.expect("]")
+        self.expect("=")
+        value = self.parse_expression()
+        self.expect(";")
+        return LetStatement(name, index, value)
+
+    def parse_while(self) -> WhileStatement:
+        self.i += 1
+        condition = self.parse_condition()
+        return WhileStatement(condition, self.parse_block())
+
+    def parse_if(self) -> IfStatement:
+        self.i += 1
+        condition = self.parse_condition()
+        then = self.parse_block()
+        otherwise: Tuple[Statement, ...] = ()
+        if self.tokens[self.i] == "else":
+            self.i += 1
+            otherwise = self.parse_block()
+        return IfStatement(condition, then, otherwise)
+
+    def parse_return(self) -> ReturnStatement:
+        self.i += 1
+        if self.tokens[self.i] == ";":
+            self.i += 1
+            return ReturnStatement(None)
+        value = self.parse_expression()
+        self.expect(";")
+        return ReturnStatement(value)
+
+    def parse_condition(self) -> Expression:
+        self.expect("(")
+        condition = self.parse_expression()
+        self.expect(")")
+        return condition
+
+    def parse_block(self) -> Tuple[Statement, ...]:
+        self.expect("{")
+        statements = self.parse_statements()
+        self.expect("}")
+        return statements
+
+    def parse_subroutine_call(self) -> Call:
+        name = self.next()
+        receiver = None
+        if self.tokens[self.i] == ".":
+            receiver = name
+            self.i += 1
+            name = self.next()
+        self.expect("(")
+        arguments = self.parse_expression_list()
+        self.i += 1
+        return Call(receiver, name, arguments)
+
+    def parse_expression(self) -> Expression:
+        expression = self.parse_term()
+        operator = self.tokens[self.i]
+        while operator in EXPR_OPS:
+            self.i += 1
+            expression = Binary(operator, expression, self.parse_term())
+            operator = self.tokens[self.i]
+        return expression
+
+    def parse_term(self) -> Expression:
+        token_type = self.types[self.i]
+        if token_type == IDENTIFIER:
+            return self.parse_term_identifier()
+        curr = self.tokens[self.i]
+        self.i += 1
+        if token_type == INT_CONST:
+            return Constant(int(curr))
+        if curr == "(":
+            expression = self.parse_expression()
+            self.expect(")")
+            return expression
+        if curr == "-" or curr == "~":
+            return Unary(curr, self.parse_term())
+        if token_type == STRING_CONST:
+            return StringConstant(curr[1:-1])
+        if curr not in KEYWORD_CONSTANTS:
+            raise BaseException(f"Error while parsing: unexpected {curr!r}")
+        return KeywordConstant(curr)
+
+    def parse_term_identifier(self) -> Expression:
+        curr = self.tokens[self.i + 1]
+        if curr == "(" or curr == ".":
+            return self.parse_subroutine_call()
+        var_name = self.tokens[self.i]
+        self.i += 1
+        if curr != "[":
+            return Variable(var_name)
+        self.i += 1
+        index = self.parse_expression()
+        self.expect("]")
+        return ArrayAccess(var_name, index)
+
+    def parse_expression_list(self) -> Tuple[Expression, ...]:
+        arguments = []
+        while self.tokens[self.i] != ")":
+            arguments.append(self.parse_expression())
+            if self.tokens[self.i] == ",":
+                self.i += 1
+        return tuple(arguments)
+
+
+def parse(types: List[int], tokens: List[str]) -> JackClass:
+    return Parser(types, tokens).parse_class()
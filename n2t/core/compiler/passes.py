@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Callable, Iterable, Tuple
+
+from n2t.core.compiler.expressions import Call, Expression, simplify
+from n2t.core.compiler.syntax import (
+    DoStatement,
+    IfStatement,
+    JackClass,
+    LetStatement,
+    ReturnStatement,
+    SetField,
+    Statement,
+    WhileStatement,
+)
+
+Rewrite = Callable[[Expression], Expression]
+
+
+def rewrite_expressions(jack_class: JackClass, rewrite: Rewrite) -> JackClass:
+    subroutines = tuple(
+        replace(subroutine, body=rewrite_statements(subroutine.body, rewrite))
+        for subroutine in jack_class.subroutines
+    )
+    return replace(jack_class, subroutines=subroutines)
+
+
+def rewrite_statements(
+    statements: Iterable[Statement], rewrite: Rewrite
+) -> Tuple[Statement, ...]:
+    return tuple(rewrite_statement(statement, rewrite) for statement in statements)
+
+
+def rewrite_statement(statement: Statement, rewrite: Rewrite) -> Statement:
+    if isinstance(statement, LetStatement):
+        index = None if statement.index is None else rewrite(statement.index)
+        return LetStatement(statement.name, index, rewrite(statement.value))
+    if isinstance(statement, IfStatement):
+        return IfStatement(
+            rewrite(statement.condition),
+            rewrite_statements(statement.then, rewrite),
+            rewrite_statements(statement.otherwise, rewrite),
+        )
+    if isinstance(statement, WhileStatement):
+        return WhileStatement(
+            rewrite(statement.condition), rewrite_statements(statement.body, rewrite)
+        )
+    if isinstance(statement, DoStatement):
+        call = rewrite(statement.call)
+        return DoStatement(call) if isinstance(call, Call) else statement
+    if isinstance(statement, SetField):
+        return SetField(statement.receiver, statement.index, rewrite(statement.value))
+    if statement.value is None:
+        return statement
+    return ReturnStatement(rewrite(statement.value))
+
+
+def fold_constants(jack_class: JackClass) -> JackClass:
+    return rewrite_expressions(jack_class, simplify)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict
+
+from n2t.core.compiler.syntax import JackClass, Subroutine
+
+SEGMENTS = {"static": "static", "field": "this"}
+
+
+@dataclass(frozen=True, slots=True)
+class Symbol:
+    type: str
+    segment: str
+    index: int
+    push: str
+    pop: str
+
+    @classmethod
+    def create(cls, type: str, segment: str, index: int) -> Symbol:
+        return cls(
+            type, segment, index, f"push {segment} {index}", f"pop {segment} {index}"
+        )
+
+
+@dataclass
+class Scope:
+    name: str
+    symbols: Dict[str, Symbol]
+    locals: int = 0
+
+    def resolve(self, name: str) -> Symbol:
+        symbol = self.symbols.get(name)
+        if symbol is None:
+            raise BaseException(f"Error while resolving {name!r} in {self.name}")
+        return symbol
+
+
+@dataclass
+class ClassInfo:
+    name: str
+    fields: int = 0
+    statics: int = 0
+    scopes: Dict[str, Scope] = field(default_factory=dict)
+
+
+def analyze(jack_class: JackClass) -> ClassInfo:
+    info = ClassInfo(jack_class.name)
+    class_symbols: Dict[str, Symbol] = {}
+    counts = {"static": 0, "this": 0}
+    for declaration in jack_class.variables:
+        segment = SEGMENTS[declaration.kind]
+        for name in declaration.names:
+            class_symbols[name] = Symbol.create(
+                declaration.type, segment, counts[segment]
+            )
+            counts[segment] += 1
+    info.fields = counts["this"]
+    info.statics = counts["static"]
+
+    for subroutine in jack_class.subroutines:
+        if subroutine.name in info.scopes:
+            raise BaseException(
+                f"Error while declaring {jack_class.name}.{subroutine.name} twice"
+            )
+        info.scopes[subroutine.name] = subroutine_scope(
+            jack_class.name, subroutine, class_symbols
+        )
+    return info
+
+
+def subroutine_scope(
+    class_name: str, subroutine: Subroutine, class_symbols: Dict[str, Symbol]
+) -> Scope:
+    symbols = dict(class_symbols)
+    first_argument = 1 if subroutine.kind == "method" else 0
+    for index, parameter in enumerate(subroutine.parameters, first_argument):
+        symbols[parameter.name] = Symbol.create(parameter.type, "argument", index)
+    locals = 0
+    for declaration in subroutine.variables:
+        for name in declaration.names:
+            symbols[name] = Symbol.create(declaration.type, "local", locals)
+            locals += 1
+    return Scope(f"{class_name}.{subroutine.name}", symbols, locals)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+
+from n2t.core.compiler.expressions import Call, Expression
+
+
+@dataclass(slots=True)
+class LetStatement:
+    name: str
+    index: Optional[Expression]
+    value: Expression
+
+
+@dataclass(slots=True)
+class IfStatement:
+    condition: Expression
+    then: Tuple[Statement, ...]
+    otherwise: Tuple[Statement, ...]
+
+
+@dataclass(slots=True)
+class WhileStatement:
+    condition: Expression
+    body: Tuple[Statement, ...]
+
+
+@dataclass(slots=True)
+class DoStatement:
+    call: Call
+
+
+@dataclass(slots=True)
+class ReturnStatement:
+    value: Optional[Expression]
+
+
+@dataclass(slots=True)
+class SetField:
+    receiver: Optional[str]
+    index: int
+    value: Expression
+
+
+Statement = Union[
+    LetStatement, IfStatement, WhileStatement, DoStatement, ReturnStatement, SetField
+]
+
+
+@dataclass(slots=True)
+class VarDec:
+    kind: str
+    type: str
+    names: Tuple[str, ...]
+
+
+@dataclass(slots=True)
+class Parameter:
+    type: str
+    name: str
+
+
+@dataclass(slots=True)
+class Subroutine:
+    kind: str
+    return_type: str
+    name: str
+    parameters: Tuple[Parameter, ...]
+    variables: Tuple[VarDec, ...]
+    body: Tuple[Statement, ...]
+
+
+@dataclass(slots=True)
+class JackClass:
+    name: str
+    variables: Tuple[VarDec, ...]
+    subroutines: Tuple[Subroutine, ...]
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import re
+import string
+from typing import List, Tuple
+
+KEYWORD = 0
+SYMBOL = 1
+IDENTIFIER = 2
+INT_CONST = 3
+STRING_CONST = 4
+
+KEYWORD_SET = frozenset(
+    [
+        "class",
+        "constructor",
+        "function",
+        "method",
+        "field",
+        "static",
+        "var",
+        "int",
+        "char",
+        "boolean",
+        "void",
+        "true",
+        "false",
+        "null",
+        "this",
+        "let",
+        "do",
+        "if",
+        "else",
+        "while",
+        "return",
+    ]
+)
+SYMBOL_SET = frozenset("{}()[].,;+-*/&|<>=~")
+
+TOKEN_TYPES = {
+    **{char: SYMBOL for char in SYMBOL_SET},
+    **{char: INT_CONST for char in string.digits},
+    **{char: IDENTIFIER for char in string.ascii_letters + "_"},
+    '"': STRING_CONST,
+}
+KEYWORD_TYPES = {keyword: KEYWORD for keyword in KEYWORD_SET}
+UNTERMINATED = frozenset(["/*", '"'])
+
+# Whitespace and comments are consumed in front of each token, so findall returns
+# only token texts; stray characters are captured so they can be reported.
+TOKEN_PATTERN = re.compile(
+    r"""
+    (?:\s+|//[^\n]*|/\*.*?\*/)*
+    (
+        [A-Za-z_][A-Za-z0-9_]*
+        | [0-9]+
+        | "[^"\n]*"
+        | /\*
+        | [{}()\[\].,;+\-*/&|<>=~]
+        | "
+        | \S
+    )?
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+Token = Tuple[int, str]
+
+Tokens = Tuple[List[int], List[str]]
+
+
+def scan(jack_code: str) -> Tokens:
+    values: List[str] = TOKEN_PATTERN.findall(jack_code)
+    while values and not values[-1]:
+        values.pop()
+
+    types = [
+        KEYWORD_TYPES.get(value, TOKEN_TYPES.get(value[0], -1)) for value in values
+    ]
+    if -1 in types or not UNTERMINATED.isdisjoint(values):
+        report_error(jack_code)
+    return types, values
+
+
+def tokenize(jack_code: str) -> List[Token]:
+    return list(zip(*scan(jack_code)))
+
+
+def report_error(jack_code: str) -> None:
+    for match in TOKEN_PATTERN.finditer(jack_code):
+        value = match.group(1)
+        if value in UNTERMINATED or (value and value[0] not in TOKEN_TYPES):
+            line = jack_code.count("\n", 0, match.start(1)) + 1
+            raise BaseException(f"Error while tokenizing {value!r} on line {line}")
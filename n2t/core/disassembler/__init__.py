@@ -1,5 +1,9 @@
+from n2t.core.disassembler.batch import BatchDisassembler
 from n2t.core.disassembler.facade import Disassembler
+from n2t.core.disassembler.labels import LabelRecoveringDisassembler
 
 __all__ = [
     "Disassembler",
+    "BatchDisassembler",
+    "LabelRecoveringDisassembler",
 ]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator, Sequence, Tuple
+
+from n2t.core.disassembler.entities import Computation, Destination, Jump, Word
+
+ADDRESS_LIMIT = 0x8000
+COMMAND_PREFIX = 0xE000
+CHUNK_SIZE = 4096
+
+
+@lru_cache(maxsize=None)
+def decoding_table() -> Tuple[str, ...]:
+    destinations = [Destination.MAP[f"{bits:03b}"] for bits in range(8)]
+    computations = [
+        Computation.MAP.get(f"{bits:07b}", f"{bits:07b}") for bits in range(128)
+    ]
+    jumps = [Jump.MAP[f"{bits:03b}"] for bits in range(8)]
+
+    addresses = [f"@{value}" for value in range(ADDRESS_LIMIT)]
+    failures = [
+        f"// Disassembly of <{value:016b}> failed."
+        for value in range(ADDRESS_LIMIT, COMMAND_PREFIX)
+    ]
+    commands = [
+        f"{destination}{computation}{jump}"
+        for computation in computations
+        for destination in destinations
+        for jump in jumps
+    ]
+
+    return tuple(addresses + failures + commands)
+
+
+def _chunks(words: Iterable[str]) -> Iterator[Sequence[str]]:
+    iterator = iter(words)
+    while chunk := list(islice(iterator, CHUNK_SIZE)):
+        yield chunk
+
+
+def _is_valid(chunk: Sequence[str]) -> bool:
+    lengths = set(map(len, chunk))
+    return lengths == {Word.accepted_length} and not "".join(chunk).strip("01")
+
+
+@dataclass
+class BatchDisassembler:
+    table: Tuple[str, ...] = field(default_factory=decoding_table)
+
+    @classmethod
+    def create(cls) -> BatchDisassembler:
+        return cls()
+
+    def disassemble(self, words: Iterable[str]) -> Iterable[str]:
+        table = self.table
+        for chunk in _chunks(words):
+            if _is_valid(chunk):
+                yield from [table[int(word, 2)] for word in chunk]
+            else:
+                yield from map(self.disassemble_one, chunk)
+
+    def disassemble_packed(self, words: Iterable[int]) -> Iterable[str]:
+        table = self.table
+        return (table[word & 0xFFFF] for word in words)
+
+    def disassemble_one(self, word: str) -> str:
+        if len(word) != Word.accepted_length:
+            return f"// <{word}> has unacceptable length."
+        if word.strip("01"):
+            return f"// <{word}> violates alphabet."
+
+        return self.table[int(word, 2)]
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+from n2t.core.disassembler.batch import ADDRESS_LIMIT, COMMAND_PREFIX, BatchDisassembler
+
+JUMP_BITS = 0b111
+READS_MEMORY = 1 << 12
+WRITES_MEMORY = 1 << 3
+
+VARIABLE_BASE = 16
+PREDEFINED = {
+    0: "SP",
+    1: "LCL",
+    2: "ARG",
+    3: "THIS",
+    4: "THAT",
+    **{address: f"R{address}" for address in range(5, VARIABLE_BASE)},
+}
+DEVICES = {16384: "SCREEN", 24576: "KBD"}
+
+
+def _parse(word: str) -> Optional[int]:
+    if len(word) != 16 or word.strip("01"):
+        return None
+    return int(word, 2)
+
+
+def _is_command(word: Optional[int]) -> bool:
+    return word is not None and word >= COMMAND_PREFIX
+
+
+def _is_address(word: Optional[int]) -> bool:
+    return word is not None and word < ADDRESS_LIMIT
+
+
+@dataclass
+class LabelRecoveringDisassembler:
+    batch: BatchDisassembler = field(default_factory=BatchDisassembler.create)
+
+    @classmethod
+    def create(cls) -> LabelRecoveringDisassembler:
+        return cls()
+
+    def disassemble(self, words: Iterable[str]) -> Iterable[str]:
+        lines = list(words)
+        values = [_parse(word) for word in lines]
+
+        targets = self._jump_targets(values)
+        symbols = self._memory_symbols(values, targets)
+
+        table = self.batch.table
+        for address, (line, value) in enumerate(zip(lines, values)):
+            if address in targets:
+                yield f"(L_{address})"
+            if value is None:
+                yield self.batch.disassemble_one(line)
+            elif address in symbols:
+                yield f"@{symbols[address]}"
+            else:
+                yield table[value]
+        if len(lines) in targets:
+            yield f"(L_{len(lines)})"
+
+    @staticmethod
+    def _jump_targets(values: List[Optional[int]]) -> Set[int]:
+        targets = set()
+        for address in range(len(values) - 1):
+            value, following = values[address], values[address + 1]
+            if _is_address(value) and _is_command(following):
+                assert value is not None and following is not None
+                if following & JUMP_BITS and value <= len(values):
+                    targets.add(value)
+
+        return targets
+
+    # ROM address of an A-instruction -> symbol it is rewritten to
+    @staticmethod
+    def _memory_symbols(
+        values: List[Optional[int]], targets: Set[int]
+    ) -> Dict[int, str]:
+        symbols: Dict[int, str] = {}
+        variables: Dict[int, str] = {}
+        next_variable = VARIABLE_BASE
+
+        for address, value in enumerate(values):
+            if not _is_address(value):
+                continue
+            assert value is not None
+
+            following = values[address + 1] if address + 1 < len(values) else None
+            if not _is_command(following):
+                if value in DEVICES:
+                    symbols[address] = DEVICES[value]
+                continue
+            assert following is not None
+
+            if following & JUMP_BITS and value in targets:
+                symbols[address] = f"L_{value}"
+            elif value in DEVICES:
+                symbols[address] = DEVICES[value]
+            elif not following & (READS_MEMORY | WRITES_MEMORY):
+                continue
+            elif value in PREDEFINED:
+                symbols[address] = PREDEFINED[value]
+            elif value in variables:
+                symbols[address] = variables[value]
+            elif value == next_variable:
+                # the assembler allocates variables in order of first use, so a
+                # name is only recovered when that order reproduces the address
+                variables[value] = symbols[address] = f"VAR_{value}"
+                next_variable += 1
+
+        return symbols
@@ -50,6 +50,7 @@ class CodeModule:
         "AM": "101",
         "AD": "110",
         "ADM": "111",
+        "AMD": "111",
     }
 
     jump_table = {
@@ -182,7 +183,7 @@ class LineInfo:
                 pair = self.current.split(";")[0]
                 return pair.strip()
             else:
-                return None
+                return self.current.strip()
         else:
             raise BaseException("Error, not correct type of command")
 
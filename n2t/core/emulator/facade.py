@@ -1,9 +1,8 @@
 from __future__ import annotations
 
+import itertools
 from dataclasses import dataclass
-from typing import Dict, Iterable, Tuple
-
-from n2t.core.emulator.assembly_to_hack import assemble
+from typing import Dict, Iterable, List, Tuple
 
 
 def get_bit(bits: int, index: int) -> bool:
@@ -148,18 +147,8 @@ class Computer:
             self.d_register = alu_output
 
 
-def simulate_hack_with_cycles(hack_lines: Iterable[str], cycles: int) -> Iterable[str]:
+def ram_lines(result_ram: Dict[int, int]) -> List[str]:
     result = []
-    computer = Computer()
-    for i, line in enumerate(hack_lines, start=0):
-        computer.rom[i] = to_int(line) & 0xFFFF
-
-    for _ in range(cycles):
-        has_more = computer.make_step()
-        if has_more is None:
-            break
-
-    result_ram = computer.result
     sorted_result_ram = dict(sorted(result_ram.items()))
     dict_size = len(sorted_result_ram)
     i = 0
@@ -173,42 +162,48 @@ def simulate_hack_with_cycles(hack_lines: Iterable[str], cycles: int) -> Iterabl
     return result
 
 
-def simulate_hack_without_cycles(hack_lines: Iterable[str]) -> Iterable[str]:
-    result = []
+def load_words(words: Iterable[int]) -> Computer:
     computer = Computer()
-    for i, line in enumerate(hack_lines, start=0):
-        computer.rom[i] = to_int(line) & 0xFFFF
+    for i, word in enumerate(words, start=0):
+        computer.rom[i] = word & 0xFFFF
+    return computer
 
-    while True:
+
+def cycle_range(cycles: int) -> Iterable[int]:
+    assert cycles >= -1
+    return range(cycles) if cycles >= 0 else itertools.count()
+
+
+def simulate_words(words: Iterable[int], cycles: int) -> Iterable[str]:
+    computer = load_words(words)
+    for _ in cycle_range(cycles):
         has_more = computer.make_step()
         if has_more is None:
             break
 
-    result_ram = computer.result
-    sorted_result_ram = dict(sorted(result_ram.items()))
-    dict_size = len(sorted_result_ram)
-    i = 0
-    for key, value in sorted_result_ram.items():
-        i += 1
-        if i == dict_size:
-            result.append('        "' + str(key) + '": ' + str(value))
-        else:
-            result.append('        "' + str(key) + '": ' + str(value) + ",")
+    return ram_lines(computer.result)
 
-    return result
+
+def count_hits(words: Iterable[int], cycles: int) -> List[int]:
+    computer = load_words(words)
+    hits = [0] * len(computer.rom)
+    for _ in cycle_range(cycles):
+        pc = computer.pc
+        has_more = computer.make_step()
+        if has_more is None:
+            break
+        hits[pc] += 1
+
+    return hits
 
 
 def simulate_hack(hack_lines: Iterable[str], cycles: int) -> Iterable[str]:
-    assert cycles >= -1
-    if cycles >= 0:
-        return simulate_hack_with_cycles(hack_lines, cycles)
-    else:
-        return simulate_hack_without_cycles(hack_lines)
+    return simulate_words((to_int(line) for line in hack_lines), cycles)
 
 
-def write_json(hack_lines: Iterable[str], cycles: int) -> Iterable[str]:
+def write_json(ram: Iterable[str]) -> Iterable[str]:
     result = ["{", '    "RAM": {']
-    result += simulate_hack(hack_lines, cycles)
+    result += ram
     result.append("    }")
     result.append("}")
     return result
@@ -219,6 +214,9 @@ def transfer_to_hack_lines(lines: Iterable[str], file_name: str) -> Iterable[str
     if file_type == "hack":
         return lines
     else:
+        # Only .asm input needs the assembler, so .hack runs skip importing it.
+        from n2t.core.emulator.assembly_to_hack import assemble
+
         return assemble(lines)
 
 
@@ -232,5 +230,11 @@ class Emulator:
         self, lines: Iterable[str], file_name: str, cycles: int
     ) -> Iterable[str]:
         hack_lines = transfer_to_hack_lines(lines, file_name)
-        result = write_json(hack_lines, cycles)
+        result = write_json(simulate_hack(hack_lines, cycles))
         return result
+
+    def emulate_words(self, words: Iterable[int], cycles: int) -> Iterable[str]:
+        return write_json(simulate_words(words, cycles))
+
+    def profile_words(self, words: Iterable[int], cycles: int) -> List[int]:
+        return count_hits(words, cycles)
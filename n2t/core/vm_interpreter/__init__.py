@@ -0,0 +1,7 @@
+from n2t.core.vm_interpreter.facade import VMInterpreter
+from n2t.core.vm_interpreter.machine import VirtualMachine
+
+__all__ = [
+    "VMInterpreter",
+    "VirtualMachine",
+]
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Sequence, Tuple
+
+from n2t.core.emulator.facade import ram_lines, write_json
+from n2t.core.vm_interpreter.loader import load_program
+from n2t.core.vm_interpreter.machine import VirtualMachine
+
+
+@dataclass
+class VMInterpreter:
+    @classmethod
+    def create(cls) -> VMInterpreter:
+        return cls()
+
+    def load(
+        self, sources: Sequence[Tuple[str, Iterable[str]]], bootstrap: bool
+    ) -> VirtualMachine:
+        return load_program(sources, bootstrap)
+
+    def interpret(
+        self,
+        sources: Sequence[Tuple[str, Iterable[str]]],
+        steps: int,
+        bootstrap: bool,
+    ) -> Iterable[str]:
+        machine = self.load(sources, bootstrap)
+        machine.run(steps)
+        return write_json(ram_lines(machine.result()))
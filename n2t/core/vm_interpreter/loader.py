@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from n2t.core.vm_interpreter.machine import (
+    ADD,
+    AND,
+    CALL,
+    EQ,
+    FUNCTION,
+    GOTO,
+    GT,
+    IF_GOTO,
+    LT,
+    NEG,
+    NOT,
+    OR,
+    POP_FIXED,
+    POP_SEGMENT,
+    PUSH_CONSTANT,
+    PUSH_FIXED,
+    PUSH_SEGMENT,
+    RETURN,
+    STACK_BASE,
+    SUB,
+    Instruction,
+    VirtualMachine,
+)
+from n2t.core.vm_translator.commands import (
+    C_ARITHMETIC,
+    C_CALL,
+    C_FUNCTION,
+    C_GOTO,
+    C_IF_GOTO,
+    C_LABEL,
+    C_POP,
+    C_PUSH,
+    C_RETURN,
+    parse_line,
+)
+
+ENTRY_POINT = "Sys.init"
+VARIABLE_BASE = 16
+
+SEGMENT_POINTERS = {"local": 1, "argument": 2, "this": 3, "that": 4}
+FIXED_SEGMENTS = {"pointer": 3, "temp": 5}
+ARITHMETIC = {
+    "add": ADD,
+    "sub": SUB,
+    "neg": NEG,
+    "eq": EQ,
+    "lt": LT,
+    "gt": GT,
+    "and": AND,
+    "or": OR,
+    "not": NOT,
+}
+
+Jump = Tuple[int, str]
+
+
+class Loader:
+    def __init__(self) -> None:
+        self.code: List[Instruction] = []
+        self.labels: Dict[str, int] = {}
+        self.functions: Dict[str, int] = {}
+        self.statics: Dict[str, int] = {}
+        self.jumps: List[Jump] = []
+        self.calls: List[Jump] = []
+
+    def load(self, file_name: str, vm_code: Iterable[str]) -> None:
+        scope = ""
+        for line in vm_code:
+            command = parse_line(line)
+            if command is None:
+                continue
+            segment, index = command.arg1, command.arg2
+            if command.type == C_PUSH:
+                self.code.append(self.push(file_name, segment, index))
+            elif command.type == C_POP:
+                self.code.append(self.pop(file_name, segment, index))
+            elif command.type == C_ARITHMETIC:
+                self.code.append((ARITHMETIC[command.command], 0, 0))
+            elif command.type == C_LABEL:
+                self.labels[scoped(scope, segment)] = len(self.code)
+            elif command.type in (C_GOTO, C_IF_GOTO):
+                self.jumps.append((len(self.code), scoped(scope, segment)))
+                op = GOTO if command.type == C_GOTO else IF_GOTO
+                self.code.append((op, 0, 0))
+            elif command.type == C_CALL:
+                self.calls.append((len(self.code), segment))
+                self.code.append((CALL, 0, index))
+            elif command.type == C_FUNCTION:
+                scope = segment
+                self.functions[segment] = len(self.code)
+                self.code.append((FUNCTION, index, 0))
+            elif command.type == C_RETURN:
+                self.code.append((RETURN, 0, 0))
+
+    def push(self, file_name: str, segment: str, index: int) -> Instruction:
+        if segment == "constant":
+            return PUSH_CONSTANT, index & 0xFFFF, 0
+        elif segment in SEGMENT_POINTERS:
+            return PUSH_SEGMENT, SEGMENT_POINTERS[segment], index
+        return PUSH_FIXED, self.address(file_name, segment, index), 0
+
+    def pop(self, file_name: str, segment: str, index: int) -> Instruction:
+        if segment in SEGMENT_POINTERS:
+            return POP_SEGMENT, SEGMENT_POINTERS[segment], index
+        return POP_FIXED, self.address(file_name, segment, index), 0
+
+    def address(self, file_name: str, segment: str, index: int) -> int:
+        if segment in FIXED_SEGMENTS:
+            return FIXED_SEGMENTS[segment] + index
+        elif segment == "static":
+            name = f"{file_name}.{index}"
+            if name not in self.statics:
+                self.statics[name] = VARIABLE_BASE + len(self.statics)
+            return self.statics[name]
+        raise BaseException("Error while finding segment " + segment)
+
+    def link(self, bootstrap: bool) -> VirtualMachine:
+        for position, label in self.jumps:
+            op, _, _ = self.code[position]
+            self.code[position] = (op, self.target(self.labels, label), 0)
+        for position, function in self.calls:
+            _, _, args_num = self.code[position]
+            self.code[position] = (
+                CALL,
+                self.target(self.functions, function),
+                args_num,
+            )
+
+        if not bootstrap:
+            return VirtualMachine(self.code)
+
+        entry = len(self.code)
+        self.code.append((CALL, self.target(self.functions, ENTRY_POINT), 0))
+        machine = VirtualMachine(self.code, entry)
+        machine.set(0, STACK_BASE)
+        return machine
+
+    @staticmethod
+    def target(targets: Dict[str, int], name: str) -> int:
+        if name not in targets:
+            raise BaseException("Error while finding symbol " + name)
+        return targets[name]
+
+
+def scoped(scope: str, label: str) -> str:
+    return f"{scope}${label}" if scope else label
+
+
+def load_program(
+    sources: Sequence[Tuple[str, Iterable[str]]], bootstrap: bool
+) -> VirtualMachine:
+    loader = Loader()
+    for file_name, vm_code in sources:
+        loader.load(file_name, vm_code)
+    return loader.link(bootstrap)
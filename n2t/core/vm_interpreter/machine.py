@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from array import array
+from typing import Dict, List, Set, Tuple
+
+MEMORY_SIZE = 65536
+STACK_BASE = 256
+
+PUSH_CONSTANT = 0
+PUSH_SEGMENT = 1
+POP_SEGMENT = 2
+PUSH_FIXED = 3
+POP_FIXED = 4
+ADD = 5
+SUB = 6
+IF_GOTO = 7
+GOTO = 8
+EQ = 9
+LT = 10
+GT = 11
+NEG = 12
+NOT = 13
+AND = 14
+OR = 15
+CALL = 16
+FUNCTION = 17
+RETURN = 18
+
+Instruction = Tuple[int, int, int]
+
+FRAME_WRITTEN = b"\x01" * 5
+
+
+class VirtualMachine:
+    def __init__(self, code: List[Instruction], entry: int = 0) -> None:
+        self.code = code
+        self.pc = entry
+        self.ram = array("H", bytes(2 * MEMORY_SIZE))
+        self.written = bytearray(MEMORY_SIZE)
+        self.return_slots: Set[int] = set()
+
+    def set(self, address: int, value: int) -> None:
+        self.ram[address] = value & 0xFFFF
+        self.written[address] = 1
+
+    def result(self) -> Dict[int, int]:
+        ram = self.ram
+        return {
+            address: ram[address] for address, flag in enumerate(self.written) if flag
+        }
+
+    def run(self, steps: int = -1) -> int:
+        code, ram, written = self.code, self.ram, self.written
+        return_slots = self.return_slots
+        pc, sp, end = self.pc, ram[0], len(code)
+        executed = 0
+        while executed != steps and pc < end:
+            op, x, y = code[pc]
+            pc += 1
+            executed += 1
+            if op == PUSH_CONSTANT:
+                ram[sp] = x
+                written[sp] = 1
+                sp += 1
+            elif op == PUSH_SEGMENT:
+                ram[sp] = ram[ram[x] + y]
+                written[sp] = 1
+                sp += 1
+            elif op == POP_SEGMENT:
+                sp -= 1
+                address = ram[x] + y
+                ram[address] = ram[sp]
+                written[address] = 1
+            elif op == ADD:
+                sp -= 1
+                ram[sp - 1] = (ram[sp - 1] + ram[sp]) & 0xFFFF
+            elif op == SUB:
+                sp -= 1
+                ram[sp - 1] = (ram[sp - 1] - ram[sp]) & 0xFFFF
+            elif op == PUSH_FIXED:
+                ram[sp] = ram[x]
+                written[sp] = 1
+                sp += 1
+            elif op == POP_FIXED:
+                sp -= 1
+                ram[x] = ram[sp]
+                written[x] = 1
+            elif op == IF_GOTO:
+                sp -= 1
+                if ram[sp]:
+                    pc = x
+            elif op == GOTO:
+                if x == pc - 1:
+                    pc = x
+                    break
+                pc = x
+            elif op == EQ:
+                sp -= 1
+                ram[sp - 1] = 0xFFFF if ram[sp - 1] == ram[sp] else 0
+            elif op == LT:
+                sp -= 1
+                difference = (ram[sp - 1] - ram[sp]) & 0xFFFF
+                ram[sp - 1] = 0xFFFF if difference & 0x8000 else 0
+            elif op == GT:
+                sp -= 1
+                difference = (ram[sp - 1] - ram[sp]) & 0xFFFF
+                ram[sp - 1] = 0xFFFF if difference and not difference & 0x8000 else 0
+            elif op == NEG:
+                ram[sp - 1] = -ram[sp - 1] & 0xFFFF
+            elif op == NOT:
+                ram[sp - 1] = ~ram[sp - 1] & 0xFFFF
+            elif op == AND:
+                sp -= 1
+                ram[sp - 1] = ram[sp - 1] & ram[sp]
+            elif op == OR:
+                sp -= 1
+                ram[sp - 1] = ram[sp - 1] | ram[sp]
+            elif op == CALL:
+                return_slots.add(sp)
+                ram[sp] = pc
+                ram[sp + 1] = ram[1]
+                ram[sp + 2] = ram[2]
+                ram[sp + 3] = ram[3]
+                ram[sp + 4] = ram[4]
+                frame = sp + 5
+                written[sp:frame] = FRAME_WRITTEN
+                sp = frame
+                ram[2] = sp - 5 - y
+                ram[1] = sp
+                written[1] = written[2] = 1
+                pc = x
+            elif op == FUNCTION:
+                for _ in range(x):
+                    ram[sp] = 0
+                    written[sp] = 1
+                    sp += 1
+            elif op == RETURN:
+                frame = ram[1]
+                pc = ram[frame - 5]
+                argument = ram[2]
+                ram[argument] = ram[sp - 1]
+                written[argument] = 1
+                sp = argument + 1
+                ram[4] = ram[frame - 1]
+                ram[3] = ram[frame - 2]
+                ram[2] = ram[frame - 3]
+                ram[1] = ram[frame - 4]
+                written[1] = written[2] = written[3] = written[4] = 1
+
+        self.pc = pc
+        ram[0] = sp
+        if executed:
+            written[0] = 1
+        return executed
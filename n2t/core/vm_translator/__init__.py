@@ -1,5 +1,6 @@
-from n2t.core.vm_translator.facade import VMTranslator
+from n2t.core.vm_translator.facade import Fragment, VMTranslator
 
 __all__ = [
+    "Fragment",
     "VMTranslator",
 ]
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import sys
+from itertools import count
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple
+
+from n2t.core.vm_translator.commands import (
+    C_ARITHMETIC,
+    C_CALL,
+    C_FUNCTION,
+    C_GOTO,
+    C_IF_GOTO,
+    C_LABEL,
+    C_POP,
+    C_PUSH,
+    C_RETURN,
+    VMCommand,
+)
+
+Asm = Tuple[str, ...]
+
+
+def asm(code: str) -> Asm:
+    return tuple(sys.intern(line) for line in code.split(" "))
+
+
+MARKERS = {
+    C_POP: "//pop",
+    C_PUSH: "//push",
+    C_ARITHMETIC: "//arithmetic",
+    C_LABEL: "//label",
+    C_GOTO: "//goto",
+    C_IF_GOTO: "//if-goto",
+    C_CALL: "//call",
+    C_FUNCTION: "//function",
+    C_RETURN: "//return",
+}
+
+VM_SEGMENTS_STACK = {
+    "local": "@LCL",
+    "argument": "@ARG",
+    "this": "@THIS",
+    "that": "@THAT",
+}
+
+NOTHING = asm("")
+PUSH_D = asm("@SP A=M M=D @SP M=M+1")
+POP_TO_R13 = asm("D=D+A @R13 M=D @SP M=M-1 A=M D=M @R13 A=M M=D")
+POP_D = asm("@SP M=M-1 A=M D=M")
+PUSH_ZERO = asm("@SP A=M M=0 @SP M=M+1")
+SAVE_FRAME = asm(
+    "D=A @SP A=M M=D @SP M=M+1 "
+    "@LCL D=M @SP A=M M=D @SP M=M+1 "
+    "@ARG D=M @SP A=M M=D @SP M=M+1 "
+    "@THIS D=M @SP A=M M=D @SP M=M+1 "
+    "@THAT D=M @SP A=M M=D @SP M=M+1 "
+    "@SP D=M @5 D=D-A"
+)
+ENTER_FRAME = asm("D=D-A @ARG M=D @SP D=M @LCL M=D")
+RETURN = asm(
+    "@LCL D=M @R13 M=D "
+    "@5 D=A @R13 D=M-D A=D D=M @R14 M=D "
+    "@SP A=M-1 D=M @ARG A=M M=D "
+    "@ARG D=M @SP M=D+1 "
+    "@R13 M=M-1 A=M D=M @THAT M=D "
+    "@R13 M=M-1 A=M D=M @THIS M=D "
+    "@R13 M=M-1 A=M D=M @ARG M=D "
+    "@R13 M=M-1 A=M D=M @LCL M=D "
+    "@R14 A=M 0;JMP"
+)
+BOOTSTRAP = asm("@256 D=A @SP M=D")
+
+BINARY = {
+    "add": asm("@SP M=M-1 A=M D=M A=A-1 M=M+D"),
+    "sub": asm("@SP M=M-1 A=M D=M A=A-1 M=M-D"),
+    "and": asm("@SP M=M-1 A=M D=M A=A-1 M=M&D"),
+    "or": asm("@SP M=M-1 A=M D=M A=A-1 M=M|D"),
+}
+UNARY = {
+    "neg": asm("@SP A=M-1 M=-M"),
+    "not": asm("@SP A=M-1 M=!M"),
+}
+COMPARE = {
+    "eq": "D;JEQ",
+    "lt": "D;JLT",
+    "gt": "D;JGT",
+}
+COMPARE_HEAD = asm("@SP M=M-1 A=M D=M A=A-1 D=M-D")
+COMPARE_FALSE = asm("@SP A=M-1 M=0")
+COMPARE_TRUE = asm("@SP A=M-1 M=-1")
+JUMP = "0;JMP"
+
+SHARED_CALL = "$$CALL"
+SHARED_RETURN = "$$RETURN"
+SHARED_CMP = "$$CMP"
+SHARED_HALT = "$$HALT"
+BOOTSTRAP_RETURN = "$$BOOTSTRAP$ret"
+
+# D = return address, R13 = number of arguments, R14 = callee address
+SHARED_CALL_ROUTINE = asm(
+    "($$CALL) "
+    "@SP A=M M=D @SP M=M+1 "
+    "@LCL D=M @SP A=M M=D @SP M=M+1 "
+    "@ARG D=M @SP A=M M=D @SP M=M+1 "
+    "@THIS D=M @SP A=M M=D @SP M=M+1 "
+    "@THAT D=M @SP A=M M=D @SP M=M+1 "
+    "@R13 D=M @5 D=D+A @SP D=M-D @ARG M=D "
+    "@SP D=M @LCL M=D "
+    "@R14 A=M 0;JMP"
+)
+SHARED_RETURN_ROUTINE = (sys.intern("($$RETURN)"), *RETURN)
+# D = return address, entered through $$CMP.EQ, $$CMP.LT or $$CMP.GT
+SHARED_CMP_ROUTINE = asm(
+    "($$CMP.EQ) @R15 M=D @SP AM=M-1 D=M A=A-1 D=M-D "
+    "@$$CMP.TRUE D;JEQ @$$CMP.FALSE 0;JMP "
+    "($$CMP.LT) @R15 M=D @SP AM=M-1 D=M A=A-1 D=M-D "
+    "@$$CMP.TRUE D;JLT @$$CMP.FALSE 0;JMP "
+    "($$CMP.GT) @R15 M=D @SP AM=M-1 D=M A=A-1 D=M-D "
+    "@$$CMP.TRUE D;JGT "
+    "($$CMP.FALSE) @SP A=M-1 M=0 @R15 A=M 0;JMP "
+    "($$CMP.TRUE) @SP A=M-1 M=-1 @R15 A=M 0;JMP"
+)
+SHARED_ROUTINES = {
+    SHARED_CALL: SHARED_CALL_ROUTINE,
+    SHARED_RETURN: SHARED_RETURN_ROUTINE,
+    SHARED_CMP: SHARED_CMP_ROUTINE,
+}
+
+
+def call_frame(name: str, args_num: int, return_label: str) -> List[str]:
+    return [
+        f"@{return_label}",
+        *SAVE_FRAME,
+        f"@{args_num}",
+        *ENTER_FRAME,
+        f"@{name}",
+        JUMP,
+        f"({return_label})",
+    ]
+
+
+def bootstrap() -> List[str]:
+    return [*BOOTSTRAP, *call_frame("Sys.init", 0, BOOTSTRAP_RETURN)]
+
+
+def shared_runtime(routines: Iterable[str]) -> List[str]:
+    used = [name for name in SHARED_ROUTINES if name in routines]
+    if not used:
+        return []
+
+    result = ["//runtime", f"@{SHARED_HALT}", JUMP]
+    for name in used:
+        result.extend(SHARED_ROUTINES[name])
+    result.append(f"({SHARED_HALT})")
+    return result
+
+
+class CodeGenerator:
+    def __init__(self, file_name: str) -> None:
+        self.file_name = file_name
+        self.namespace = file_name.split(".")[0]
+        self.scope = ""
+        self.returns = count(1)
+        self.compares = count(1)
+        self.routines: Set[str] = set()
+        self.emitters: Dict[int, Callable[[VMCommand], List[str]]] = {
+            C_PUSH: self.push,
+            C_POP: self.pop,
+            C_ARITHMETIC: self.arithmetic,
+            C_LABEL: self.label,
+            C_GOTO: self.goto,
+            C_IF_GOTO: self.if_goto,
+            C_CALL: self.call,
+            C_FUNCTION: self.function,
+            C_RETURN: self.return_,
+        }
+
+    def translate(self, commands: Iterator[VMCommand]) -> List[str]:
+        result: List[str] = []
+        emitters = self.emitters
+        for command in commands:
+            emitter = emitters.get(command.type)
+            if emitter is None:
+                result.extend(NOTHING)
+                continue
+            result.append(MARKERS[command.type])
+            result.extend(emitter(command))
+        return result
+
+    def return_label(self) -> str:
+        return f"{self.namespace}$ret.{next(self.returns)}"
+
+    def compare_label(self, operation: str) -> str:
+        return f"{self.namespace}${operation}.{next(self.compares)}"
+
+    def scoped(self, label: str) -> str:
+        return f"{self.scope}${label}" if self.scope else label
+
+    def push(self, command: VMCommand) -> List[str]:
+        segment, index = command.arg1, command.arg2
+        if segment == "constant":
+            return [f"@{index}", "D=A", *PUSH_D]
+        elif segment == "static":
+            return [f"@{self.file_name}{index}", "D=M", *PUSH_D]
+        elif segment == "temp":
+            return [f"@{index}", "D=A", "@5", "A=A+D", "D=M", *PUSH_D]
+        elif segment in VM_SEGMENTS_STACK:
+            base = VM_SEGMENTS_STACK[segment]
+            return [f"@{index}", "D=A", base, "A=M+D", "D=M", *PUSH_D]
+        elif segment == "pointer":
+            return [f"@{index}", "D=A", "@3", "A=A+D", "D=M", *PUSH_D]
+        return list(NOTHING)
+
+    def pop(self, command: VMCommand) -> List[str]:
+        segment, index = command.arg1, command.arg2
+        if segment == "static":
+            return [*POP_D, f"@{self.file_name}{index}", "M=D"]
+        elif segment == "temp":
+            return [f"@{index}", "D=A", "@5", *POP_TO_R13]
+        elif segment in VM_SEGMENTS_STACK:
+            base = VM_SEGMENTS_STACK[segment]
+            return [f"@{index}", "D=A", base, "A=M", *POP_TO_R13]
+        elif segment == "pointer":
+            return [f"@{index}", "D=A", "@3", *POP_TO_R13]
+        return list(NOTHING)
+
+    def arithmetic(self, command: VMCommand) -> List[str]:
+        operation = command.command
+        if operation in BINARY:
+            return list(BINARY[operation])
+        elif operation in UNARY:
+            return list(UNARY[operation])
+
+        label = self.compare_label(operation)
+        return [
+            *COMPARE_HEAD,
+            f"@{label}",
+            COMPARE[operation],
+            *COMPARE_FALSE,
+            f"@{label}.end",
+            JUMP,
+            f"({label})",
+            *COMPARE_TRUE,
+            f"({label}.end)",
+        ]
+
+    def label(self, command: VMCommand) -> List[str]:
+        return [f"({self.scoped(command.arg1)})"]
+
+    def goto(self, command: VMCommand) -> List[str]:
+        return [f"@{self.scoped(command.arg1)}", JUMP]
+
+    def if_goto(self, command: VMCommand) -> List[str]:
+        return [*POP_D, f"@{self.scoped(command.arg1)}", "D;JNE"]
+
+    def call(self, command: VMCommand) -> List[str]:
+        return call_frame(command.arg1, command.arg2, self.return_label())
+
+    def function(self, command: VMCommand) -> List[str]:
+        self.scope = command.arg1
+        return [f"({command.arg1})", *PUSH_ZERO * command.arg2]
+
+    def return_(self, command: VMCommand) -> List[str]:
+        return list(RETURN)
+
+
+class SharedRuntimeGenerator(CodeGenerator):
+    def arithmetic(self, command: VMCommand) -> List[str]:
+        if command.command not in COMPARE:
+            return super().arithmetic(command)
+
+        self.routines.add(SHARED_CMP)
+        return_label = self.compare_label(command.command)
+        return [
+            f"@{return_label}",
+            "D=A",
+            f"@{SHARED_CMP}.{command.command.upper()}",
+            JUMP,
+            f"({return_label})",
+        ]
+
+    def call(self, command: VMCommand) -> List[str]:
+        self.routines.add(SHARED_CALL)
+        return_label = self.return_label()
+        return [
+            f"@{command.arg2}",
+            "D=A",
+            "@R13",
+            "M=D",
+            f"@{command.arg1}",
+            "D=A",
+            "@R14",
+            "M=D",
+            f"@{return_label}",
+            "D=A",
+            f"@{SHARED_CALL}",
+            JUMP,
+            f"({return_label})",
+        ]
+
+    def return_(self, command: VMCommand) -> List[str]:
+        self.routines.add(SHARED_RETURN)
+        return [f"@{SHARED_RETURN}", JUMP]
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import NamedTuple, Optional
+
+C_UNKNOWN = -1
+C_ARITHMETIC = 1
+C_PUSH = 2
+C_POP = 3
+C_LABEL = 4
+C_IF_GOTO = 5
+C_GOTO = 6
+C_FUNCTION = 7
+C_RETURN = 8
+C_CALL = 9
+
+COMMAND_TYPES = {
+    "push": C_PUSH,
+    "pop": C_POP,
+    "add": C_ARITHMETIC,
+    "sub": C_ARITHMETIC,
+    "neg": C_ARITHMETIC,
+    "eq": C_ARITHMETIC,
+    "lt": C_ARITHMETIC,
+    "gt": C_ARITHMETIC,
+    "and": C_ARITHMETIC,
+    "or": C_ARITHMETIC,
+    "not": C_ARITHMETIC,
+    "label": C_LABEL,
+    "goto": C_GOTO,
+    "if-goto": C_IF_GOTO,
+    "function": C_FUNCTION,
+    "call": C_CALL,
+    "return": C_RETURN,
+}
+
+
+class VMCommand(NamedTuple):
+    type: int
+    command: str
+    arg1: str = ""
+    arg2: int = 0
+
+
+UNKNOWN = VMCommand(C_UNKNOWN, "")
+
+
+def parse_line(line: str) -> Optional[VMCommand]:
+    if not line or line.isspace():
+        return None
+    comment_index = line.find("//")
+    if comment_index != -1:
+        line = line[:comment_index]
+
+    parts = line.split()
+    if not parts or parts[0] not in COMMAND_TYPES:
+        return UNKNOWN
+
+    command = parts[0]
+    arg1 = parts[1] if len(parts) > 1 else ""
+    arg2 = int(parts[2]) if len(parts) > 2 else 0
+    return VMCommand(COMMAND_TYPES[command], command, arg1, arg2)
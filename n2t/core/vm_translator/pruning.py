@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Dict, List, NamedTuple, Sequence, Set, Tuple
+
+from n2t.core.vm_translator.commands import C_CALL, C_FUNCTION, parse_line
+
+ENTRY_POINT = "Sys.init"
+TOP_LEVEL = ""
+
+VMSource = Tuple[str, Sequence[str]]
+
+
+class FunctionCode(NamedTuple):
+    name: str
+    lines: List[str]
+    calls: Set[str]
+
+
+def split_functions(vm_code: Sequence[str]) -> List[FunctionCode]:
+    functions = [FunctionCode(TOP_LEVEL, [], set())]
+    for line in vm_code:
+        command = parse_line(line)
+        if command is not None and command.type == C_FUNCTION:
+            functions.append(FunctionCode(command.arg1, [], set()))
+        elif command is not None and command.type == C_CALL:
+            functions[-1].calls.add(command.arg1)
+        functions[-1].lines.append(line)
+    return functions
+
+
+def reachable(graph: Dict[str, Set[str]], roots: Sequence[str]) -> Set[str]:
+    seen = set(roots)
+    pending = list(roots)
+    while pending:
+        for callee in graph.get(pending.pop(), ()):
+            if callee not in seen:
+                seen.add(callee)
+                pending.append(callee)
+    return seen
+
+
+def eliminate_dead_functions(
+    sources: Sequence[VMSource], entry_point: str = ENTRY_POINT
+) -> Tuple[List[Tuple[str, List[str]]], List[str]]:
+    files = [(name, split_functions(vm_code)) for name, vm_code in sources]
+    graph: Dict[str, Set[str]] = {}
+    for _, functions in files:
+        for function in functions:
+            graph.setdefault(function.name, set()).update(function.calls)
+    if entry_point not in graph:
+        return [(name, list(vm_code)) for name, vm_code in sources], []
+
+    live = reachable(graph, [TOP_LEVEL, entry_point])
+    pruned = [
+        (name, [line for code in functions if code.name in live for line in code.lines])
+        for name, functions in files
+    ]
+    return pruned, sorted(graph.keys() - live)
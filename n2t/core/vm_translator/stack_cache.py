@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from typing import Iterator, List
+
+from n2t.core.vm_translator.codegen import (
+    BINARY,
+    COMPARE,
+    JUMP,
+    PUSH_D,
+    VM_SEGMENTS_STACK,
+    CodeGenerator,
+    asm,
+)
+from n2t.core.vm_translator.commands import VMCommand
+
+POP_TO_D = asm("@SP AM=M-1 D=M")
+STORE_D_R13 = asm("@R13 M=D")
+STORE_R13 = asm("D=D+A @R14 M=D @R13 D=M @R14 A=M M=D")
+
+CACHED_BINARY = {
+    "add": asm("@SP AM=M-1 D=D+M"),
+    "sub": asm("@SP AM=M-1 D=M-D"),
+    "and": asm("@SP AM=M-1 D=D&M"),
+    "or": asm("@SP AM=M-1 D=D|M"),
+}
+CACHED_UNARY = {"neg": "D=-D", "not": "D=!D"}
+FIXED_SEGMENTS = {"temp": 5, "pointer": 3}
+SHORT_OFFSET = 10
+
+
+# Keeps the top of the stack in D across straight-line code and only
+# writes it back to the RAM stack when control flow or a call needs it.
+class StackCachingGenerator(CodeGenerator):
+    def __init__(self, file_name: str) -> None:
+        super().__init__(file_name)
+        self.cached = False
+
+    def translate(self, commands: Iterator[VMCommand]) -> List[str]:
+        result = super().translate(commands)
+        result.extend(self.spill())
+        return result
+
+    def spill(self) -> List[str]:
+        if not self.cached:
+            return []
+        self.cached = False
+        return list(PUSH_D)
+
+    def fill(self) -> List[str]:
+        if self.cached:
+            return []
+        self.cached = True
+        return list(POP_TO_D)
+
+    def push(self, command: VMCommand) -> List[str]:
+        result = self.spill()
+        result.extend(self.load(command.arg1, command.arg2))
+        self.cached = True
+        return result
+
+    def load(self, segment: str, index: int) -> List[str]:
+        if segment == "constant":
+            return (
+                ["D=0"]
+                if index == 0
+                else ["D=1"] if index == 1 else [f"@{index}", "D=A"]
+            )
+        elif segment == "static":
+            return [f"@{self.file_name}{index}", "D=M"]
+        elif segment in FIXED_SEGMENTS:
+            return [f"@{FIXED_SEGMENTS[segment] + index}", "D=M"]
+
+        base = VM_SEGMENTS_STACK[segment]
+        if index < 3:
+            return [base, "A=M", *["A=A+1"] * index, "D=M"]
+        return [base, "D=M", f"@{index}", "A=D+A", "D=M"]
+
+    def pop(self, command: VMCommand) -> List[str]:
+        segment, index = command.arg1, command.arg2
+        result = self.fill()
+        self.cached = False
+        if segment == "static":
+            return [*result, f"@{self.file_name}{index}", "M=D"]
+        elif segment in FIXED_SEGMENTS:
+            return [*result, f"@{FIXED_SEGMENTS[segment] + index}", "M=D"]
+
+        base = VM_SEGMENTS_STACK[segment]
+        if index < SHORT_OFFSET:
+            return [*result, base, "A=M", *["A=A+1"] * index, "M=D"]
+        return [*result, *STORE_D_R13, base, "D=M", f"@{index}", *STORE_R13]
+
+    def arithmetic(self, command: VMCommand) -> List[str]:
+        operation = command.command
+        result = self.fill()
+        if operation in BINARY:
+            return [*result, *CACHED_BINARY[operation]]
+        elif operation in CACHED_UNARY:
+            return [*result, CACHED_UNARY[operation]]
+
+        label = self.compare_label(operation)
+        return [
+            *result,
+            *POP_TO_D[:2],
+            "D=M-D",
+            f"@{label}",
+            COMPARE[operation],
+            "D=0",
+            f"@{label}.end",
+            JUMP,
+            f"({label})",
+            "D=-1",
+            f"({label}.end)",
+        ]
+
+    def label(self, command: VMCommand) -> List[str]:
+        return [*self.spill(), *super().label(command)]
+
+    def goto(self, command: VMCommand) -> List[str]:
+        return [*self.spill(), *super().goto(command)]
+
+    def if_goto(self, command: VMCommand) -> List[str]:
+        result = self.fill()
+        self.cached = False
+        return [*result, f"@{self.scoped(command.arg1)}", "D;JNE"]
+
+    def call(self, command: VMCommand) -> List[str]:
+        return [*self.spill(), *super().call(command)]
+
+    def function(self, command: VMCommand) -> List[str]:
+        return [*self.spill(), *super().function(command)]
+
+    def return_(self, command: VMCommand) -> List[str]:
+        return [*self.spill(), *super().return_(command)]
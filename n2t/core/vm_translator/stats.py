@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence
+
+BOOTSTRAP = "$$bootstrap"
+RUNTIME = "$$runtime"
+
+
+@dataclass
+class FunctionStats:
+    start: int
+    instructions: int = 0
+    commands: Dict[str, int] = field(default_factory=dict)
+    cycles: Optional[int] = None
+
+    def to_json(self) -> Dict[str, object]:
+        result: Dict[str, object] = {
+            "start": self.start,
+            "instructions": self.instructions,
+            "commands": self.commands,
+        }
+        if self.cycles is not None:
+            result["cycles"] = self.cycles
+        return result
+
+
+@dataclass
+class ProgramStats:
+    functions: Dict[str, FunctionStats] = field(default_factory=dict)
+    owners: List[FunctionStats] = field(default_factory=list)
+
+    @classmethod
+    def from_assembly(cls, assembly: Iterable[str]) -> ProgramStats:
+        stats = cls()
+        current = stats.enter(BOOTSTRAP)
+        command = "bootstrap"
+        entering = False
+        for line in assembly:
+            if not line:
+                continue
+            if line.startswith("//"):
+                command = line[2:]
+                entering = command == "function"
+                if command == "runtime":
+                    current = stats.enter(RUNTIME)
+            elif line[0] == "(":
+                if entering:
+                    current = stats.enter(line[1:-1])
+                    entering = False
+            else:
+                current.instructions += 1
+                current.commands[command] = current.commands.get(command, 0) + 1
+                stats.owners.append(current)
+        return stats
+
+    def enter(self, function: str) -> FunctionStats:
+        return self.functions.setdefault(function, FunctionStats(len(self.owners)))
+
+    def add_hits(self, hits: Sequence[int]) -> None:
+        for function in self.functions.values():
+            function.cycles = 0
+        for address, function in enumerate(self.owners):
+            function.cycles = (function.cycles or 0) + hits[address]
+
+    def to_json(self) -> Dict[str, object]:
+        functions = list(self.functions.items())
+        if any(function.cycles is not None for _, function in functions):
+            functions.sort(key=lambda item: -(item[1].cycles or 0))
+
+        commands: Dict[str, int] = {}
+        for _, function in functions:
+            for command, count in function.commands.items():
+                commands[command] = commands.get(command, 0) + count
+
+        result: Dict[str, object] = {
+            "instructions": len(self.owners),
+            "commands": commands,
+        }
+        if functions and functions[0][1].cycles is not None:
+            result["cycles"] = sum(function.cycles or 0 for _, function in functions)
+        result["functions"] = {name: function.to_json() for name, function in functions}
+        return result
@@ -1,9 +1,16 @@
-from n2t.infra.asm import AsmProgram
-from n2t.infra.emulator import EmulatorProgram
-from n2t.infra.hack import HackProgram
-from n2t.infra.io import FileFormat
-from n2t.infra.jack import JackProgram
-from n2t.infra.vm import VmProgram
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from n2t.infra.asm import AsmProgram
+    from n2t.infra.build import BuildProgram
+    from n2t.infra.emulator import EmulatorProgram
+    from n2t.infra.hack import HackProgram
+    from n2t.infra.io import FileFormat
+    from n2t.infra.jack import JackProgram
+    from n2t.infra.vm import VmProgram
 
 __all__ = [
     "FileFormat",
@@ -12,4 +19,24 @@ __all__ = [
     "JackProgram",
     "VmProgram",
     "EmulatorProgram",
+    "BuildProgram",
 ]
+
+# Resolved on first access, like the tools of n2t.core.
+_MODULES = {
+    "FileFormat": "n2t.infra.io",
+    "AsmProgram": "n2t.infra.asm",
+    "HackProgram": "n2t.infra.hack",
+    "JackProgram": "n2t.infra.jack",
+    "VmProgram": "n2t.infra.vm",
+    "EmulatorProgram": "n2t.infra.emulator",
+    "BuildProgram": "n2t.infra.build",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_MODULES[name]), name)
+    globals()[name] = value
+    return value
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Iterator, Protocol
+from typing import Iterable, Iterator, Protocol, Tuple
 
 from n2t.core import Assembler as DefaultAssembler
+from n2t.core.assembler import SourceMap
 from n2t.infra.io import File, FileFormat
 
 
@@ -20,9 +21,15 @@ class AsmProgram:
     def __post_init__(self) -> None:
         FileFormat.asm.validate(self.path)
 
-    def assemble(self) -> None:
+    def assemble(self, source_map: bool = False) -> None:
         hack_file = File(FileFormat.hack.convert(self.path))
-        hack_file.save(self.assembler.assemble(self))
+        if not source_map:
+            hack_file.save(self.assembler.assemble(self))
+            return
+
+        hack, mapping = self.assembler.assemble_with_map(self)
+        hack_file.save(hack)
+        File(FileFormat.map.convert(self.path)).save_bytes(mapping.to_bytes())
 
     def __iter__(self) -> Iterator[str]:
         yield from File(self.path).load()
@@ -31,3 +38,8 @@ class AsmProgram:
 class Assembler(Protocol):  # pragma: no cover
     def assemble(self, assembly: Iterable[str]) -> Iterable[str]:
         pass
+
+    def assemble_with_map(
+        self, assembly: Iterable[str]
+    ) -> Tuple[Iterable[str], SourceMap]:
+        pass
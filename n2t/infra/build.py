@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Protocol
+
+from n2t.core import (
+    Assembler as DefaultAssembler,
+    Emulator as DefaultEmulator,
+    JackCompiler as DefaultCompiler,
+)
+from n2t.infra.io import File, FileFormat
+from n2t.infra.vm import Source, TranslationReport, VmProgram
+
+
+@dataclass
+class BuildReport:
+    translation: TranslationReport = field(default_factory=TranslationReport)
+    rom_size: int = 0
+    stages: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class BuildProgram:
+    program: VmProgram
+    assembler: Assembler = field(default_factory=DefaultAssembler.create)
+    emulator: Emulator = field(default_factory=DefaultEmulator.create)
+    compiler: JackCompiler = field(default_factory=DefaultCompiler.create)
+
+    @classmethod
+    def load_from(
+        cls,
+        file_or_directory_name: str,
+        shared_runtime: bool = False,
+        stack_cache: bool = False,
+        optimize: bool = False,
+        intern_strings: bool = False,
+    ) -> BuildProgram:
+        return cls(
+            VmProgram.load_from(file_or_directory_name, shared_runtime, stack_cache),
+            compiler=DefaultCompiler.create(optimize, intern_strings),
+        )
+
+    def build(
+        self,
+        run: bool = False,
+        cycles: int = -1,
+        artifacts: bool = False,
+        jobs: int = 1,
+        cache: bool = False,
+        prune: bool = False,
+    ) -> BuildReport:
+        report = BuildReport()
+        assembly = self.program.assembly(report.translation, jobs, cache, prune)
+        if artifacts:
+            assembly = list(assembly)
+            File(self.program.asm_path).save(assembly)
+
+        words = self.assembler.assemble_words(assembly)
+        report.rom_size = len(words)
+        if artifacts:
+            hack_path = FileFormat.hack.convert(self.program.asm_path)
+            File(hack_path).save(format(word, "016b") for word in words)
+        if run:
+            json_path = self.program.asm_path.with_suffix(".json")
+            File(json_path).save(self.emulator.emulate_words(words, cycles))
+
+        return report
+
+    # Compiles, translates, assembles and emulates a Jack program without
+    # writing the intermediate files, unless they are kept as artifacts.
+    def run(
+        self,
+        cycles: int = -1,
+        artifacts: bool = False,
+        jobs: int = 1,
+        prune: bool = False,
+    ) -> BuildReport:
+        report = BuildReport()
+        start = time.perf_counter()
+        sources = self.compile_jack(artifacts)
+        if prune:
+            sources, report.translation.removed = self.program.eliminate_dead_functions(
+                sources
+            )
+        compiled = time.perf_counter()
+        fragments = self.program.fragments(sources, jobs)
+        assembly = list(self.program.translator.link(fragments))
+        translated = time.perf_counter()
+        words = self.assembler.assemble_words(assembly)
+        report.rom_size = len(words)
+        assembled = time.perf_counter()
+        ram = list(self.emulator.emulate_words(words, cycles))
+        emulated = time.perf_counter()
+        report.stages = {
+            "compile": compiled - start,
+            "translate": translated - compiled,
+            "assemble": assembled - translated,
+            "emulate": emulated - assembled,
+        }
+
+        File(self.program.asm_path.with_suffix(".json")).save(ram)
+        if artifacts:
+            File(self.program.asm_path).save(assembly)
+            hack_path = FileFormat.hack.convert(self.program.asm_path)
+            File(hack_path).save(format(word, "016b") for word in words)
+        return report
+
+    def compile_jack(self, artifacts: bool = False) -> List[Source]:
+        path = self.program.path
+        jack_files = sorted(path.glob("*.jack")) if path.is_dir() else [path]
+        sources = []
+        for jack_file in jack_files:
+            vm_code = list(self.compiler.compile(File(jack_file).load()))
+            vm_file = FileFormat.vm.convert(jack_file)
+            if artifacts:
+                File(vm_file).save(vm_code)
+            sources.append((vm_file.name, "\n".join(vm_code)))
+
+        # VM files without a Jack class, such as the OS, are linked as they are
+        # and in the same order as translate_vm would link them.
+        if path.is_dir():
+            compiled = {name for name, _ in sources}
+            sources += [
+                source for source in self.program.sources() if source[0] not in compiled
+            ]
+        return sorted(sources)
+
+
+class JackCompiler(Protocol):  # pragma: no cover
+    def compile(self, jack_code: Iterable[str]) -> Iterable[str]:
+        pass
+
+
+class Assembler(Protocol):  # pragma: no cover
+    def assemble_words(self, assembly: Iterable[str]) -> List[int]:
+        pass
+
+
+class Emulator(Protocol):  # pragma: no cover
+    def emulate_words(self, words: Iterable[int], cycles: int) -> Iterable[str]:
+        pass
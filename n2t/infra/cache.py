@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Optional
+
+from n2t.infra.io import File
+
+CACHE_DIRECTORY = ".n2t-cache"
+
+
+def source_fingerprint(package: ModuleType) -> str:
+    digest = hashlib.sha256()
+    for source in sorted(Path(str(package.__file__)).parent.glob("*.py")):
+        digest.update(source.name.encode())
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    def __str__(self) -> str:
+        return f"{self.hits} cached, {self.misses} rebuilt"
+
+
+@dataclass(frozen=True)
+class BuildCache:
+    directory: Path
+
+    @classmethod
+    def next_to(cls, project: Path, kind: str) -> BuildCache:
+        return cls(project.joinpath(CACHE_DIRECTORY, kind))
+
+    @staticmethod
+    def key(*parts: str | bytes) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            data = part.encode() if isinstance(part, str) else part
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def load(self, key: str) -> Optional[str]:
+        try:
+            return self.directory.joinpath(key).read_text()
+        except FileNotFoundError:
+            return None
+
+    def store(self, key: str, data: str) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        File(self.directory.joinpath(key)).save_bytes(data.encode())
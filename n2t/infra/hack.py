@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Iterable, Iterator, Protocol
+from typing import Iterable, Iterator, List, Optional, Protocol
 
 from n2t.core import Disassembler as DefaultDisassembler
+from n2t.core.disassembler import BatchDisassembler, LabelRecoveringDisassembler
 from n2t.infra.io import File, FileFormat
 
+CHUNKS_PER_JOB = 4
+
 
 @dataclass
 class HackProgram:
@@ -17,17 +22,52 @@ class HackProgram:
         FileFormat.hack.validate(self.path)
 
     @classmethod
-    def load_from(cls, file_name: str) -> HackProgram:
+    def load_from(
+        cls, file_name: str, batch: bool = False, labels: bool = False
+    ) -> HackProgram:
+        if labels:
+            return cls(Path(file_name), LabelRecoveringDisassembler.create())
+        if batch:
+            return cls(Path(file_name), BatchDisassembler.create())
         return cls(Path(file_name))
 
-    def disassemble(self) -> None:
+    def disassemble(self, jobs: int = 1) -> None:
         assembly_file = File(FileFormat.asm.convert(self.path))
-        assembly_file.save(self.disassembler.disassemble(self))
+        if jobs > 1:
+            assembly_file.save(self._disassemble_chunks(jobs))
+        else:
+            assembly_file.save(self.disassembler.disassemble(self))
+
+    def _disassemble_chunks(self, jobs: int) -> Iterator[str]:
+        source = File(self.path)
+        chunks = source.split(jobs * CHUNKS_PER_JOB)
+        if not chunks:
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_start_worker, initargs=(self.disassembler,)
+        ) as executor:
+            disassemble_chunk = partial(_disassemble_chunk, source)
+            for lines in executor.map(disassemble_chunk, *zip(*chunks)):
+                yield from lines
 
     def __iter__(self) -> Iterator[str]:
         yield from File(self.path).load()
 
 
+_worker_disassembler: Optional[Disassembler] = None
+
+
+def _start_worker(disassembler: Disassembler) -> None:
+    global _worker_disassembler
+    _worker_disassembler = disassembler
+
+
+def _disassemble_chunk(source: File, start: int, end: int) -> List[str]:
+    assert _worker_disassembler is not None
+    return list(_worker_disassembler.disassemble(source.load_range(start, end)))
+
+
 class Disassembler(Protocol):  # pragma: no cover
     def disassemble(self, words: Iterable[str]) -> Iterable[str]:
         pass
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
 import glob
+import mmap
 import os
+import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 from pathlib import Path
-from typing import Iterable
+from typing import IO, Any, Iterable, Iterator, List, Tuple
+
+BUFFER_SIZE = 1 << 20
+
+CHUNK_LINES = 1 << 12
 
 
 class FileFormat(Enum):
     hack = ".hack"
     asm = ".asm"
     vm = ".vm"
+    map = ".map"
 
     def validate(self, path: Path) -> None:
         assert path.suffix == self.value
@@ -24,14 +33,70 @@ class FileFormat(Enum):
 class File:
     path: Path
 
-    def load(self) -> Iterable[str]:
+    def load(self) -> List[str]:
         with self.path.open("r", newline="") as file:
-            yield from (line.strip() for line in file if line)
+            return split_lines(file.read())
 
     def save(self, lines: Iterable[str]) -> None:
-        with self.path.open("w", newline="") as file:
-            for line in lines:
-                file.write(f"{line}\n")
+        remaining = iter(lines)
+        with self.replace("w") as file:
+            while chunk := list(islice(remaining, CHUNK_LINES)):
+                file.write("\n".join(chunk))
+                file.write("\n")
+
+    def split(self, parts: int) -> List[Tuple[int, int]]:
+        size = self.path.stat().st_size
+        if size == 0:
+            return []
+
+        step = max(size // parts, 1)
+        ranges = []
+        with self.path.open("rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                start = 0
+                while start < size:
+                    end = data.find(b"\n", min(start + step, size) - 1)
+                    end = size if end == -1 else end + 1
+                    ranges.append((start, end))
+                    start = end
+
+        return ranges
+
+    def load_range(self, start: int, end: int) -> List[str]:
+        with self.path.open("rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return split_lines(data[start:end].decode())
+
+    def load_bytes(self) -> bytes:
+        return self.path.read_bytes()
+
+    def save_bytes(self, data: bytes) -> None:
+        with self.replace("wb") as file:
+            file.write(data)
+
+    # Writes next to the target and renames over it, so readers and parallel
+    # runs never see a partial file. Unlike mkstemp, "x" keeps the umask mode.
+    @contextmanager
+    def replace(self, mode: str) -> Iterator[IO[Any]]:
+        temporary = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}.tmp")
+        newline = None if "b" in mode else ""
+        try:
+            with open(
+                temporary, mode.replace("w", "x"), BUFFER_SIZE, newline=newline
+            ) as file:
+                yield file
+            os.replace(temporary, self.path)
+        except BaseException:
+            temporary.unlink(missing_ok=True)
+            raise
+
+
+# Splits like iterating a file opened with newline="", without the per-line I/O.
+def split_lines(text: str) -> List[str]:
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return list(map(str.strip, lines))
 
 
 def remove_files(pattern: str) -> None:
@@ -1,13 +1,42 @@
 from __future__ import annotations
 
-import glob
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Iterable, Iterator, Protocol
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+)
 
-from n2t.core import JackCompiler as DefaultCompiler
-from n2t.infra.io import File
+from n2t.core import JackCompiler as DefaultCompiler, compiler as jack_compiler
+from n2t.core.compiler import ProgramOutput
+from n2t.core.compiler.facade import ParsedClass
+from n2t.core.compiler.semantics import ClassInfo
+from n2t.core.compiler.syntax import JackClass
+from n2t.core.compiler.tokenizer import Tokens
+from n2t.infra.cache import BuildCache, source_fingerprint
+from n2t.infra.io import File, FileFormat
+
+Job = Tuple[Path, str, str, float]
+
+
+@dataclass(frozen=True)
+class CompileResult:
+    path: Path
+    seconds: float
+    error: Optional[str] = None
+    cached: bool = False
+    tokens: int = 0
+    phases: Dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
@@ -17,27 +46,78 @@ class JackProgram:  # TODO: your work for Projects 10 and 11 starts here
     compiler: JackCompiler = field(default_factory=DefaultCompiler.create)
 
     @classmethod
-    def load_from(cls, file_or_directory_name: str) -> JackProgram:
-        return cls(Path(file_or_directory_name), file_or_directory_name)
+    def load_from(
+        cls,
+        file_or_directory_name: str,
+        optimize: bool = False,
+        intern_strings: bool = False,
+    ) -> JackProgram:
+        return cls(
+            Path(file_or_directory_name),
+            file_or_directory_name,
+            DefaultCompiler.create(optimize, intern_strings),
+        )
 
-    def compile(self) -> None:
+    def compile(
+        self, jobs: int = 1, force: bool = False, profile: bool = False
+    ) -> List[CompileResult]:
+        return list(self.compile_files(jobs, force, profile))
+
+    def compile_program(self) -> ProgramOutput:
+        in_files = self.jack_files()
+        sources = [(path.name, File(path).load()) for path in in_files]
+        output = self.compiler.compile_program(sources)
+        for path in in_files:
+            if path.name in output.vm_code:
+                File(FileFormat.vm.convert(path)).save(output.vm_code[path.name])
+        return output
+
+    def compile_files(
+        self, jobs: int = 1, force: bool = False, profile: bool = False
+    ) -> Iterator[CompileResult]:
+        in_files = self.jack_files()
+        if not in_files:
+            return
+
+        cache = BuildCache.next_to(
+            self.path if self.path.is_dir() else self.path.parent, "jack"
+        )
+        version = source_fingerprint(jack_compiler) + repr(self.compiler)
+        pending: List[Job] = []
+        for path in in_files:
+            start = time.perf_counter()
+            jack_code = path.read_bytes().decode()
+            read = time.perf_counter() - start
+            key = cache.key(version, jack_code)
+            vm_code = None if force else cache.load(key)
+            if vm_code is None:
+                pending.append((path, jack_code, key, read))
+                continue
+
+            vm_file = FileFormat.vm.convert(path)
+            if not vm_file.exists() or vm_file.read_bytes() != vm_code.encode():
+                File(vm_file).save_bytes(vm_code.encode())
+            yield CompileResult(path, time.perf_counter() - start, cached=True)
+
+        if profile:
+            yield from (_profile_file(self.compiler, cache, job) for job in pending)
+            return
+
+        compile_job = partial(_compile_file, self.compiler, cache)
+        if jobs <= 1 or len(pending) <= 1:
+            yield from (compile_job(job) for job in pending)
+            return
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(compile_job, job) for job in pending]
+            yield from (future.result() for future in as_completed(futures))
+
+    def jack_files(self) -> List[Path]:
         if os.path.isfile(self.file_name):
-            dir_name = self.file_name.split(".")[-2]
-            path_dir = Path(dir_name + ".vm")
-            vm_file = File(path_dir)
-            p = Path(self.file_name)
-            program = JackProgram(p, self.file_name)
-            vm_file.save(self.compiler.compile(program))
-        elif os.path.isdir(self.file_name):
-            in_files = glob.glob(self.file_name + "/*.jack")
-            for file in in_files:
-                print(file)
-                dir_name = file.split(".")[-2]
-                path_dir = Path(dir_name + ".vm")
-                vm_file = File(path_dir)
-                p = Path(file)
-                program = JackProgram(p, file)
-                vm_file.save(self.compiler.compile(program))
+            return [self.path]
+        if os.path.isdir(self.file_name):
+            return sorted(self.path.glob("*.jack"))
+        return []
 
     def __iter__(self) -> Iterator[str]:
         yield from File(self.path).load()
@@ -74,6 +154,64 @@ class JackProgram:  # TODO: your work for Projects 10 and 11 starts here
     """
 
 
+def _compile_file(compiler: JackCompiler, cache: BuildCache, job: Job) -> CompileResult:
+    path, jack_code, key, _ = job
+    start = time.perf_counter()
+    try:
+        vm_code = list(compiler.compile(jack_code.splitlines()))
+    except KeyboardInterrupt:
+        raise
+    except BaseException as error:
+        return CompileResult(path, time.perf_counter() - start, repr(error))
+
+    File(FileFormat.vm.convert(path)).save(vm_code)
+    cache.store(key, "".join(f"{line}\n" for line in vm_code))
+    return CompileResult(path, time.perf_counter() - start)
+
+
+# Runs the compiler one phase at a time, so only --profile pays for the timers.
+def _profile_file(compiler: JackCompiler, cache: BuildCache, job: Job) -> CompileResult:
+    path, jack_code, key, read = job
+    start = time.perf_counter()
+    try:
+        tokens = compiler.tokenize(jack_code.splitlines())
+        tokenized = time.perf_counter()
+        parsed_class = compiler.parse_tokens(tokens)
+        parsed = time.perf_counter()
+        vm_code = compiler.generate_code(*parsed_class)
+        generated = time.perf_counter()
+    except KeyboardInterrupt:
+        raise
+    except BaseException as error:
+        return CompileResult(path, time.perf_counter() - start, repr(error))
+
+    File(FileFormat.vm.convert(path)).save(vm_code)
+    cache.store(key, "".join(f"{line}\n" for line in vm_code))
+    written = time.perf_counter()
+    phases = {
+        "read": read,
+        "tokenize": tokenized - start,
+        "parse": parsed - tokenized,
+        "codegen": generated - parsed,
+        "write": written - generated,
+    }
+    return CompileResult(path, written - start, tokens=len(tokens[0]), phases=phases)
+
+
 class JackCompiler(Protocol):  # pragma: no cover
     def compile(self, jack_code: Iterable[str]) -> Iterable[str]:
         pass
+
+    def tokenize(self, jack_code: Iterable[str]) -> Tokens:
+        pass
+
+    def parse_tokens(self, tokens: Tokens) -> ParsedClass:
+        pass
+
+    def generate_code(self, jack_class: JackClass, info: ClassInfo) -> List[str]:
+        pass
+
+    def compile_program(
+        self, sources: Sequence[Tuple[str, Iterable[str]]]
+    ) -> ProgramOutput:
+        pass
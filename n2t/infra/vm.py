@@ -1,42 +1,215 @@
 from __future__ import annotations
 
-import glob
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Iterable, Iterator, Protocol
+from typing import Iterable, Iterator, List, Optional, Protocol, Sequence, Tuple
 
-from n2t.core import VMTranslator as DefaultTranslator
+from n2t.core import (
+    Assembler as DefaultAssembler,
+    Emulator as DefaultEmulator,
+    VMInterpreter as DefaultInterpreter,
+    VMTranslator as DefaultTranslator,
+    vm_translator,
+)
+from n2t.core.vm_translator import Fragment
+from n2t.core.vm_translator.stats import ProgramStats
+from n2t.infra.cache import BuildCache, CacheStats, source_fingerprint
 from n2t.infra.io import File, FileFormat
 
+Source = Tuple[str, str]
+
+
+@dataclass
+class TranslationReport:
+    cache: CacheStats = field(default_factory=CacheStats)
+    removed: List[str] = field(default_factory=list)
+
 
 @dataclass
 class VmProgram:  # TODO: your work for Projects 7 and 8 starts here
     path: Path
     file_name: str
     translator: VMTranslator = field(default_factory=DefaultTranslator.create)
+    interpreter: VMInterpreter = field(default_factory=DefaultInterpreter.create)
+    assembler: Assembler = field(default_factory=DefaultAssembler.create)
+    emulator: Emulator = field(default_factory=DefaultEmulator.create)
 
     @classmethod
-    def load_from(cls, file_or_directory_name: str) -> VmProgram:
-        return cls(Path(file_or_directory_name), file_or_directory_name)
+    def load_from(
+        cls,
+        file_or_directory_name: str,
+        shared_runtime: bool = False,
+        stack_cache: bool = False,
+    ) -> VmProgram:
+        return cls(
+            Path(file_or_directory_name),
+            file_or_directory_name,
+            DefaultTranslator.create(shared_runtime, stack_cache),
+        )
+
+    @property
+    def asm_path(self) -> Path:
+        if self.path.is_dir():
+            return self.path.joinpath(self.path.name + ".asm")
+        return FileFormat.asm.convert(self.path)
+
+    def translate(
+        self,
+        jobs: int = 1,
+        cache: bool = False,
+        prune: bool = False,
+        stats: bool = False,
+        cycles: int = 0,
+    ) -> TranslationReport:
+        report = TranslationReport()
+        if not os.path.exists(self.file_name):
+            return report
+
+        assembly = list(self.assembly(report, jobs, cache, prune))
+        File(self.asm_path).save(assembly)
+        if stats:
+            self.save_stats(assembly, cycles)
+
+        return report
 
-    def translate(self) -> None:
+    def save_stats(self, assembly: List[str], cycles: int) -> None:
+        program_stats = self.translator.statistics(assembly)
+        if cycles:
+            words = self.assembler.assemble_words(assembly)
+            program_stats.add_hits(self.emulator.profile_words(words, cycles))
+
+        stats_file = File(self.asm_path.with_suffix(".stats.json"))
+        stats_file.save(json.dumps(program_stats.to_json(), indent=4).splitlines())
+
+    def assembly(
+        self,
+        report: TranslationReport,
+        jobs: int = 1,
+        cache: bool = False,
+        prune: bool = False,
+    ) -> Iterable[str]:
         if os.path.isfile(self.file_name):
-            asm_file = File(FileFormat.asm.convert(self.path))
-            asm_file.save(self.translator.translate(self, self.file_name, False))
-        elif os.path.isdir(self.file_name):
-            dir_name = self.file_name.split("\\")[-1]
-            path_dir = Path(self.file_name + "/" + dir_name + ".asm")
-            asm_file = File(path_dir)
-            in_files = glob.glob(self.file_name + "/*.vm")
-            asm_file.save(self.translator.translate(in_files, dir_name, True))
+            return self.translator.translate(self, self.file_name, False)
+
+        sources = self.sources()
+        if prune:
+            sources, report.removed = self.eliminate_dead_functions(sources)
+        if cache:
+            fragments = self.cached_fragments(sources, jobs, report.cache)
+        else:
+            fragments = self.fragments(sources, jobs)
+        return self.translator.link(fragments)
+
+    def interpret(self, steps: int = -1) -> None:
+        if not os.path.exists(self.file_name):
+            return
+
+        is_dir = self.path.is_dir()
+        sources = [(name, text.splitlines()) for name, text in self.sources()]
+        json_file = File(self.asm_path.with_suffix(".json"))
+        json_file.save(self.interpreter.interpret(sources, steps, is_dir))
+
+    def sources(self) -> List[Source]:
+        paths = sorted(self.path.glob("*.vm")) if self.path.is_dir() else [self.path]
+        return [(path.name, path.read_bytes().decode()) for path in paths]
+
+    def eliminate_dead_functions(
+        self, sources: List[Source]
+    ) -> Tuple[List[Source], List[str]]:
+        pruned, removed = self.translator.eliminate_dead_functions(
+            [(name, text.splitlines()) for name, text in sources]
+        )
+        return [(name, "\n".join(vm_code)) for name, vm_code in pruned], removed
+
+    def fragments(self, sources: List[Source], jobs: int) -> List[Fragment]:
+        translate = partial(_translate_source, self.translator)
+        if jobs <= 1 or len(sources) <= 1:
+            return [translate(source) for source in sources]
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            return list(executor.map(translate, sources))
+
+    def cached_fragments(
+        self, sources: List[Source], jobs: int, stats: CacheStats
+    ) -> List[Fragment]:
+        cache = BuildCache.next_to(self.path, "vm")
+        version = source_fingerprint(vm_translator)
+        keys = [
+            cache.key(version, repr(self.translator), name, text)
+            for name, text in sources
+        ]
+        fragments = [_decode_fragment(cache.load(key)) for key in keys]
+        missing = [index for index, found in enumerate(fragments) if found is None]
+        translated = self.fragments([sources[index] for index in missing], jobs)
+        for index, fragment in zip(missing, translated):
+            cache.store(keys[index], _encode_fragment(fragment))
+            fragments[index] = fragment
+
+        stats.hits += len(sources) - len(missing)
+        stats.misses += len(missing)
+        return [fragment for fragment in fragments if fragment is not None]
 
     def __iter__(self) -> Iterator[str]:
         yield from File(self.path).load()
 
 
+def _translate_source(translator: VMTranslator, source: Source) -> Fragment:
+    name, text = source
+    return translator.translate_file((line.strip() for line in text.splitlines()), name)
+
+
+def _encode_fragment(fragment: Fragment) -> str:
+    return "\n".join([" ".join(sorted(fragment.routines)), *fragment.code])
+
+
+def _decode_fragment(data: Optional[str]) -> Optional[Fragment]:
+    if data is None:
+        return None
+
+    routines, *code = data.split("\n")
+    return Fragment(code, frozenset(routines.split()))
+
+
 class VMTranslator(Protocol):  # pragma: no cover
     def translate(
         self, vm_code: Iterable[str], file_name: str, is_dir: bool
     ) -> Iterable[str]:
         pass
+
+    def translate_file(self, vm_code: Iterable[str], file_name: str) -> Fragment:
+        pass
+
+    def eliminate_dead_functions(
+        self, sources: Sequence[Tuple[str, Sequence[str]]]
+    ) -> Tuple[List[Tuple[str, List[str]]], List[str]]:
+        pass
+
+    def link(self, fragments: Iterable[Fragment]) -> Iterable[str]:
+        pass
+
+    def statistics(self, assembly: Iterable[str]) -> ProgramStats:
+        pass
+
+
+class Assembler(Protocol):  # pragma: no cover
+    def assemble_words(self, assembly: Iterable[str]) -> List[int]:
+        pass
+
+
+class Emulator(Protocol):  # pragma: no cover
+    def profile_words(self, words: Iterable[int], cycles: int) -> List[int]:
+        pass
+
+
+class VMInterpreter(Protocol):  # pragma: no cover
+    def interpret(
+        self,
+        sources: Sequence[Tuple[str, Iterable[str]]],
+        steps: int,
+        bootstrap: bool,
+    ) -> Iterable[str]:
+        pass
@@ -1,6 +1,7 @@
-from typer import Typer, echo
+import time
+from typing import Dict
 
-from n2t.infra import AsmProgram, EmulatorProgram, HackProgram, JackProgram, VmProgram
+from typer import BadParameter, Exit, Typer, echo
 
 cli = Typer(
     name="Nand 2 Tetris Software",
@@ -10,38 +11,218 @@ cli = Typer(
 
 
 @cli.command("disassemble", no_args_is_help=True)
-def run_disassembler(hack_file: str) -> None:
+def run_disassembler(
+    hack_file: str, batch: bool = False, labels: bool = False, jobs: int = 1
+) -> None:
+    from n2t.infra import HackProgram
+
+    if labels and jobs > 1:
+        raise BadParameter("--labels needs the whole program, use it without --jobs")
     echo(f"Disassembling {hack_file}")
-    HackProgram.load_from(hack_file).disassemble()
+    HackProgram.load_from(hack_file, batch, labels).disassemble(jobs)
     echo("Done!")
 
 
 @cli.command("assemble", no_args_is_help=True)
-def run_assembler(assembly_file: str) -> None:
+def run_assembler(assembly_file: str, source_map: bool = False) -> None:
+    from n2t.infra import AsmProgram
+
     echo(f"Assembling {assembly_file}")
-    AsmProgram.load_from(assembly_file).assemble()
+    AsmProgram.load_from(assembly_file).assemble(source_map)
     echo("Done!")
 
 
 @cli.command("translate_vm", no_args_is_help=True)
-def run_vm_translator(vm_file_or_directory: str) -> None:
+def run_vm_translator(
+    vm_file_or_directory: str,
+    shared_runtime: bool = False,
+    stack_cache: bool = False,
+    jobs: int = 1,
+    cache: bool = False,
+    prune: bool = False,
+    stats: bool = False,
+    cycles: int = 0,
+) -> None:
+    from n2t.infra import VmProgram
+
+    if shared_runtime and stack_cache:
+        raise BadParameter("--shared-runtime and --stack-cache can not be combined")
+    if cycles and not stats:
+        raise BadParameter("--cycles profiles the program for --stats")
     echo(f"Translating {vm_file_or_directory}")
-    VmProgram.load_from(vm_file_or_directory).translate()
+    program = VmProgram.load_from(vm_file_or_directory, shared_runtime, stack_cache)
+    report = program.translate(jobs, cache, prune, stats, cycles)
+    if cache:
+        echo(f"Files: {report.cache}")
+    if prune:
+        echo(f"Removed {len(report.removed)} unreachable functions")
+        for function in report.removed:
+            echo(f"  {function}")
+    echo("Done!")
+
+
+@cli.command("interpret_vm", no_args_is_help=True)
+def run_vm_interpreter(vm_file_or_directory: str, steps: int = -1) -> None:
+    from n2t.infra import VmProgram
+
+    echo(f"Interpreting {vm_file_or_directory}")
+    VmProgram.load_from(vm_file_or_directory).interpret(steps)
+    echo("Done!")
+
+
+@cli.command("build", no_args_is_help=True)
+def run_build(
+    vm_file_or_directory: str,
+    run: bool = False,
+    cycles: int = -1,
+    artifacts: bool = False,
+    shared_runtime: bool = False,
+    stack_cache: bool = False,
+    jobs: int = 1,
+    cache: bool = False,
+    prune: bool = False,
+) -> None:
+    from n2t.infra import BuildProgram
+
+    if shared_runtime and stack_cache:
+        raise BadParameter("--shared-runtime and --stack-cache can not be combined")
+    echo(f"Building {vm_file_or_directory}")
+    program = BuildProgram.load_from(vm_file_or_directory, shared_runtime, stack_cache)
+    report = program.build(run, cycles, artifacts, jobs, cache, prune)
+    echo(f"ROM size: {report.rom_size} words")
+    echo("Done!")
+
+
+@cli.command("run", no_args_is_help=True)
+def run_jack(
+    jack_file_or_directory: str,
+    cycles: int = -1,
+    artifacts: bool = False,
+    optimize: bool = False,
+    intern_strings: bool = False,
+    shared_runtime: bool = False,
+    stack_cache: bool = False,
+    jobs: int = 1,
+    prune: bool = False,
+) -> None:
+    from n2t.infra import BuildProgram
+
+    if shared_runtime and stack_cache:
+        raise BadParameter("--shared-runtime and --stack-cache can not be combined")
+    echo(f"Running {jack_file_or_directory}")
+    program = BuildProgram.load_from(
+        jack_file_or_directory, shared_runtime, stack_cache, optimize, intern_strings
+    )
+    report = program.run(cycles, artifacts, jobs, prune)
+    for stage, seconds in report.stages.items():
+        echo(f"  {stage}: {seconds:.3f}s")
+    echo(f"ROM size: {report.rom_size} words")
     echo("Done!")
 
 
 @cli.command("compile", no_args_is_help=True)
-def run_compiler(jack_file_or_directory: str) -> None:
+def run_compiler(
+    jack_file_or_directory: str,
+    jobs: int = 1,
+    force: bool = False,
+    optimize: bool = False,
+    intern_strings: bool = False,
+    whole_program: bool = False,
+    profile: bool = False,
+    pstats: str = "",
+) -> None:
+    import cProfile
+
+    from n2t.infra import JackProgram
+
+    if whole_program and jobs > 1:
+        raise BadParameter(
+            "--whole-program compiles classes together, use it without --jobs"
+        )
+    if profile and jobs > 1:
+        raise BadParameter("--profile times one file at a time, use it without --jobs")
+    if profile and whole_program:
+        raise BadParameter("--profile times one file at a time, not --whole-program")
+    if pstats and not profile:
+        raise BadParameter("--pstats dumps the statistics of --profile")
+
     echo(f"Compiling {jack_file_or_directory}")
-    JackProgram.load_from(jack_file_or_directory).compile()
+    start = time.perf_counter()
+    compiled, cached, failed, busy = 0, 0, 0, 0.0
+    program = JackProgram.load_from(jack_file_or_directory, optimize, intern_strings)
+    if whole_program:
+        output = program.compile_program()
+        for name, error in output.errors.items():
+            echo(f"  {name}: FAILED {error}", err=True)
+        elapsed = time.perf_counter() - start
+        echo(
+            f"Compiled {len(output.vm_code)} files, {len(output.errors)} failed "
+            f"in {elapsed:.2f}s"
+        )
+        echo(
+            f"Inlined {len(output.inlined)} call sites, "
+            f"~{output.cycles_saved} cycles saved"
+        )
+        if output.errors:
+            raise Exit(1)
+        echo("Done!")
+        return
+
+    phases: Dict[str, float] = {}
+    tokens = 0
+    profiler = cProfile.Profile()
+    if pstats:
+        profiler.enable()
+    for result in program.compile_files(jobs, force, profile):
+        busy += result.seconds
+        if result.cached:
+            cached += 1
+            echo(f"  {result.path.name}: cached")
+        elif result.phases:
+            compiled += 1
+            tokens += result.tokens
+            for phase, seconds in result.phases.items():
+                phases[phase] = phases.get(phase, 0.0) + seconds
+            echo(
+                f"  {result.path.name}: {result.seconds:.3f}s, {result.tokens} "
+                f"tokens ({_format_phases(result.phases)})"
+            )
+        elif result.error is None:
+            compiled += 1
+            echo(f"  {result.path.name}: {result.seconds:.3f}s")
+        else:
+            failed += 1
+            echo(f"  {result.path.name}: FAILED {result.error}", err=True)
+    elapsed = time.perf_counter() - start
+    echo(
+        f"Compiled {compiled} files, {cached} cached, {failed} failed "
+        f"in {elapsed:.2f}s ({busy:.2f}s compiling, {jobs} jobs)"
+    )
+    if phases:
+        echo(f"Phases: {_format_phases(phases)}")
+        echo(f"Tokens: {tokens} ({tokens / max(busy, 1e-9):,.0f} tokens/s)")
+    if pstats:
+        profiler.disable()
+        profiler.dump_stats(pstats)
+        echo(f"Profile written to {pstats}")
+    if failed:
+        raise Exit(1)
     echo("Done!")
 
 
 @cli.command("execute", no_args_is_help=True)
 def hack_asm_emulator(hack_or_asm_file: str, cycles: int = -1) -> None:
+    from n2t.infra import EmulatorProgram
+
     if cycles == -1:
         echo(f"Executing {hack_or_asm_file} with no cycles")
     else:
         echo(f"Executing {hack_or_asm_file} with {cycles} cycles")
     EmulatorProgram.load_from(hack_or_asm_file, cycles).emulate()
     echo("Done!")
+
+
+def _format_phases(phases: Dict[str, float]) -> str:
+    return ", ".join(
+        f"{name} {seconds * 1000:.1f}ms" for name, seconds in phases.items()
+    )
@@ -22,3 +22,14 @@ def asm_directory(pytestconfig: pytest.Config) -> Iterable[Path]:
     yield name
 
     remove_files(pattern=str(name.joinpath("*.hack")))
+
+
+@pytest.fixture(scope="module")
+def vm_directory(pytestconfig: pytest.Config) -> Iterable[Path]:
+    name = pytestconfig.rootpath.joinpath("tests", "e2e", "vm")
+
+    yield name
+
+    remove_files(pattern=str(name.joinpath("*", "*.asm")))
+    remove_files(pattern=str(name.joinpath("*", "*.json")))
+    remove_files(pattern=str(name.joinpath("*", "*.hack")))
@@ -3,6 +3,8 @@ from pathlib import Path
 
 import pytest
 
+from n2t.core import Assembler
+from n2t.infra.io import File
 from n2t.runner.cli import run_assembler
 
 _TEST_PROGRAMS = ["empty", "addL", "maxL", "rectL", "pongL", "max", "rect", "pong"]
@@ -21,3 +23,14 @@ def test_should_assemble(program: str, asm_directory: Path) -> None:
         f1=str(asm_directory.joinpath(f"{program}.cmp")),
         f2=str(asm_directory.joinpath(f"{program}.hack")),
     )
+
+
+@pytest.mark.parametrize("program", _TEST_PROGRAMS)
+def test_should_assemble_words(program: str, asm_directory: Path) -> None:
+    assembly = list(File(asm_directory.joinpath(f"{program}.asm")).load())
+
+    words = Assembler.create().assemble_words(assembly)
+
+    assert [format(word, "016b") for word in words] == list(
+        File(asm_directory.joinpath(f"{program}.cmp")).load()
+    )
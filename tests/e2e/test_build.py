@@ -0,0 +1,47 @@
+import filecmp
+from pathlib import Path
+
+import pytest
+
+from n2t.runner.cli import run_assembler, run_build, run_vm_translator
+
+_TEST_PROGRAMS = ["FibonacciElement", "StaticsTest"]
+_CYCLES = 5000
+
+
+@pytest.mark.parametrize("program", _TEST_PROGRAMS)
+def test_should_build_and_run(program: str, vm_directory: Path) -> None:
+    program_directory = vm_directory.joinpath(program)
+    json_file = program_directory.joinpath(f"{program}.json")
+
+    run_build(str(program_directory), run=True, cycles=_CYCLES)
+
+    assert not program_directory.joinpath(f"{program}.asm").exists()
+    assert filecmp.cmp(
+        shallow=False,
+        f1=str(
+            vm_directory.parent.parent.joinpath(
+                "final_project_tests", f"{program}.json"
+            )
+        ),
+        f2=str(json_file),
+    )
+    json_file.unlink()
+
+
+@pytest.mark.parametrize("program", _TEST_PROGRAMS)
+def test_should_write_artifacts(
+    program: str, vm_directory: Path, tmp_path: Path
+) -> None:
+    program_directory = vm_directory.joinpath(program)
+    asm_file = program_directory.joinpath(f"{program}.asm")
+    hack_file = program_directory.joinpath(f"{program}.hack")
+    run_vm_translator(str(program_directory))
+    run_assembler(str(asm_file))
+    asm_file.rename(tmp_path.joinpath("expected.asm"))
+    hack_file.rename(tmp_path.joinpath("expected.hack"))
+
+    run_build(str(program_directory), artifacts=True)
+
+    assert filecmp.cmp(str(tmp_path.joinpath("expected.asm")), str(asm_file), False)
+    assert filecmp.cmp(str(tmp_path.joinpath("expected.hack")), str(hack_file), False)
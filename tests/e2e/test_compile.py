@@ -0,0 +1,154 @@
+import pstats
+from pathlib import Path
+
+import pytest
+from typer import BadParameter, Exit
+
+from n2t.infra import JackProgram
+from n2t.runner.cli import run_compiler
+
+_CLASSES = {
+    "Main": """
+    class Main {
+        function void main() {
+            var int i;
+            let i = Counter.next(3);
+            do Output.printInt(i);
+            return;
+        }
+    }
+    """,
+    "Counter": """
+    /** Counts upwards. */
+    class Counter {
+        static int count;
+
+        function int next(int step) {
+            let count = count + step;
+            return count;
+        }
+    }
+    """,
+}
+
+
+def _write_classes(directory: Path) -> None:
+    for name, jack_code in _CLASSES.items():
+        directory.joinpath(f"{name}.jack").write_text(jack_code)
+
+
+def test_should_compile_in_parallel(tmp_path: Path) -> None:
+    sequential = tmp_path.joinpath("sequential")
+    parallel = tmp_path.joinpath("parallel")
+    for directory in (sequential, parallel):
+        directory.mkdir()
+        _write_classes(directory)
+
+    run_compiler(str(sequential))
+    run_compiler(str(parallel), jobs=2)
+
+    for name in _CLASSES:
+        expected = sequential.joinpath(f"{name}.vm").read_text()
+        assert parallel.joinpath(f"{name}.vm").read_text() == expected
+        assert "function" in expected
+
+
+def test_should_report_failed_files(tmp_path: Path) -> None:
+    _write_classes(tmp_path)
+    tmp_path.joinpath("Broken.jack").write_text('class Broken { "unterminated }')
+
+    with pytest.raises(Exit):
+        run_compiler(str(tmp_path), jobs=2)
+
+    assert tmp_path.joinpath("Main.vm").exists()
+    assert tmp_path.joinpath("Counter.vm").exists()
+    assert not tmp_path.joinpath("Broken.vm").exists()
+
+
+def test_should_report_failed_files_in_whole_program(tmp_path: Path) -> None:
+    _write_classes(tmp_path)
+    tmp_path.joinpath("Broken.jack").write_text('class Broken { "unterminated }')
+
+    with pytest.raises(Exit):
+        run_compiler(str(tmp_path), whole_program=True)
+
+    assert tmp_path.joinpath("Main.vm").exists()
+    assert tmp_path.joinpath("Counter.vm").exists()
+    assert not tmp_path.joinpath("Broken.vm").exists()
+
+
+def test_should_skip_unchanged_classes(tmp_path: Path) -> None:
+    _write_classes(tmp_path)
+    program = JackProgram.load_from(str(tmp_path))
+
+    assert not any(result.cached for result in program.compile())
+    expected = tmp_path.joinpath("Main.vm").read_text()
+    tmp_path.joinpath("Main.vm").unlink()
+    assert all(result.cached for result in program.compile())
+    assert tmp_path.joinpath("Main.vm").read_text() == expected
+
+    with tmp_path.joinpath("Counter.jack").open("a") as file:
+        file.write("\n")
+    rebuilt = [result.path.name for result in program.compile() if not result.cached]
+    assert rebuilt == ["Counter.jack"]
+    assert not any(result.cached for result in program.compile(force=True))
+
+
+def test_should_optimize_expressions(tmp_path: Path) -> None:
+    tmp_path.joinpath("Main.jack").write_text(
+        "class Main { function int f(int x) { return (x * 8) + (2 + 3); } }"
+    )
+
+    run_compiler(str(tmp_path), optimize=True)
+
+    vm_code = tmp_path.joinpath("Main.vm").read_text().splitlines()
+    assert "call Math.multiply 2" not in vm_code
+    assert "push constant 5" in vm_code
+
+
+def test_should_inline_across_classes(tmp_path: Path) -> None:
+    tmp_path.joinpath("Counter.jack").write_text(
+        "class Counter { function int step() { return 3; } }"
+    )
+    tmp_path.joinpath("Main.jack").write_text(
+        "class Main { function int main() { return Counter.step() + 1; } }"
+    )
+
+    run_compiler(str(tmp_path), whole_program=True)
+
+    vm_code = tmp_path.joinpath("Main.vm").read_text().splitlines()
+    assert "call Counter.step 0" not in vm_code
+    assert "push constant 3" in vm_code
+    assert tmp_path.joinpath("Counter.vm").exists()
+
+
+def test_should_reject_whole_program_with_jobs(tmp_path: Path) -> None:
+    with pytest.raises(BadParameter):
+        run_compiler(str(tmp_path), jobs=2, whole_program=True)
+
+
+def test_should_reject_profile_with_whole_program(tmp_path: Path) -> None:
+    with pytest.raises(BadParameter, match="--whole-program"):
+        run_compiler(str(tmp_path), profile=True, whole_program=True)
+
+
+def test_should_profile_compilation(tmp_path: Path) -> None:
+    _write_classes(tmp_path)
+    stats_file = tmp_path.joinpath("compile.pstats")
+
+    results = JackProgram.load_from(str(tmp_path)).compile(profile=True)
+    run_compiler(str(tmp_path), force=True, profile=True, pstats=str(stats_file))
+
+    assert [result.path.name for result in results] == ["Counter.jack", "Main.jack"]
+    for result in results:
+        assert list(result.phases) == ["read", "tokenize", "parse", "codegen", "write"]
+        assert result.tokens > 0
+    assert pstats.Stats(str(stats_file)).get_stats_profile().func_profiles
+
+
+def test_should_skip_phase_timers_without_profile(tmp_path: Path) -> None:
+    _write_classes(tmp_path)
+
+    results = JackProgram.load_from(str(tmp_path)).compile()
+
+    assert all(not result.phases and not result.tokens for result in results)
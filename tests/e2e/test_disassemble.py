@@ -19,3 +19,16 @@ def test_should_disassemble(program: str, hack_directory: Path) -> None:
         f1=str(hack_directory.joinpath(f"{program}.cmp")),
         f2=str(hack_directory.joinpath(f"{program}.asm")),
     )
+
+
+@pytest.mark.parametrize("program", _TEST_PROGRAMS)
+def test_should_disassemble_in_parallel(program: str, hack_directory: Path) -> None:
+    hack_file = str(hack_directory.joinpath(f"{program}.hack"))
+
+    run_disassembler(hack_file, batch=True, jobs=2)
+
+    assert filecmp.cmp(
+        shallow=False,
+        f1=str(hack_directory.joinpath(f"{program}.cmp")),
+        f2=str(hack_directory.joinpath(f"{program}.asm")),
+    )
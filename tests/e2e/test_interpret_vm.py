@@ -0,0 +1,40 @@
+import json
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from n2t.core import VMInterpreter
+from n2t.runner.cli import run_vm_interpreter
+
+_TEST_PROGRAMS = ["FibonacciElement", "StaticsTest"]
+_SCRATCH = {13, 14, 15}
+
+
+def _ram(json_file: Path) -> Dict[int, int]:
+    with json_file.open() as file:
+        return {
+            int(address): value for address, value in json.load(file)["RAM"].items()
+        }
+
+
+@pytest.mark.parametrize("program", _TEST_PROGRAMS)
+def test_should_interpret(program: str, vm_directory: Path) -> None:
+    program_directory = vm_directory.joinpath(program)
+    expected = _ram(
+        vm_directory.parent.parent.joinpath("final_project_tests", f"{program}.json")
+    )
+    sources = [
+        (path.name, path.read_text().splitlines())
+        for path in sorted(program_directory.glob("*.vm"))
+    ]
+    machine = VMInterpreter.create().load(sources, bootstrap=True)
+
+    machine.run()
+    run_vm_interpreter(str(program_directory))
+
+    actual = machine.result()
+    assert _ram(program_directory.joinpath(f"{program}.json")) == actual
+    assert actual.keys() == expected.keys() - _SCRATCH
+    for address in actual.keys() - machine.return_slots:
+        assert actual[address] == expected[address]
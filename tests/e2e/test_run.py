@@ -0,0 +1,96 @@
+from pathlib import Path
+
+from n2t.runner.cli import (
+    hack_asm_emulator,
+    run_assembler,
+    run_compiler,
+    run_jack,
+    run_vm_translator,
+)
+
+_CYCLES = 20000
+
+_CLASSES = {
+    "Sys": """
+    class Sys {
+        function void init() {
+            do Main.main();
+            while (true) {}
+            return;
+        }
+    }
+    """,
+    "Main": """
+    class Main {
+        static int total;
+
+        function void main() {
+            var int i;
+            var Array squares;
+            let squares = 3000;
+            let i = 0;
+            while (i < 8) {
+                let squares[i] = Main.square(i);
+                let total = total + squares[i];
+                let i = i + 1;
+            }
+            return;
+        }
+
+        function int square(int n) {
+            var int i, result;
+            let i = 0;
+            let result = 0;
+            while (i < n) {
+                let result = result + n;
+                let i = i + 1;
+            }
+            return result;
+        }
+    }
+    """,
+}
+
+_OS_VM = """
+function Memory.alloc 0
+push constant 0
+return
+"""
+
+
+def _write_program(directory: Path) -> None:
+    for name, jack_code in _CLASSES.items():
+        directory.joinpath(f"{name}.jack").write_text(jack_code)
+    directory.joinpath("Memory.vm").write_text(_OS_VM)
+
+
+def test_should_run_like_the_separate_commands(tmp_path: Path) -> None:
+    program = tmp_path.joinpath("Squares")
+    program.mkdir()
+    _write_program(program)
+    json_file = program.joinpath("Squares.json")
+
+    run_jack(str(program), cycles=_CYCLES)
+
+    actual = json_file.read_text()
+    assert '"3007": 49' in actual
+    assert not program.joinpath("Main.vm").exists()
+    assert not program.joinpath("Squares.asm").exists()
+
+    run_compiler(str(program))
+    run_vm_translator(str(program))
+    run_assembler(str(program.joinpath("Squares.asm")))
+    hack_asm_emulator(str(program.joinpath("Squares.hack")), cycles=_CYCLES)
+    assert json_file.read_text() == actual
+
+
+def test_should_keep_artifacts(tmp_path: Path) -> None:
+    _write_program(tmp_path)
+
+    run_jack(str(tmp_path), cycles=_CYCLES, artifacts=True, optimize=True)
+
+    assert tmp_path.joinpath("Main.vm").exists()
+    assert tmp_path.joinpath("Sys.vm").exists()
+    assert tmp_path.joinpath(f"{tmp_path.name}.asm").exists()
+    assert tmp_path.joinpath(f"{tmp_path.name}.hack").exists()
+    assert '"3007": 49' in tmp_path.joinpath(f"{tmp_path.name}.json").read_text()
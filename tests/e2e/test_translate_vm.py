@@ -0,0 +1,122 @@
+import filecmp
+import json
+import shutil
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from n2t.core import Assembler
+from n2t.infra.vm import VmProgram
+from n2t.runner.cli import hack_asm_emulator, run_vm_translator
+
+_TEST_PROGRAMS = ["FibonacciElement", "StaticsTest"]
+_CYCLES = 5000
+
+
+def _ram(json_file: Path) -> Dict[int, int]:
+    with json_file.open() as file:
+        return {
+            int(address): value for address, value in json.load(file)["RAM"].items()
+        }
+
+
+def _run(program_directory: Path) -> Path:
+    asm_file = program_directory.joinpath(f"{program_directory.name}.asm")
+    hack_asm_emulator(str(asm_file), _CYCLES)
+    return asm_file.with_suffix(".json")
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+@pytest.mark.parametrize("program", _TEST_PROGRAMS)
+def test_should_translate(program: str, jobs: int, vm_directory: Path) -> None:
+    program_directory = vm_directory.joinpath(program)
+
+    run_vm_translator(str(program_directory), jobs=jobs)
+
+    assert filecmp.cmp(
+        shallow=False,
+        f1=str(
+            vm_directory.parent.parent.joinpath(
+                "final_project_tests", f"{program}.json"
+            )
+        ),
+        f2=str(_run(program_directory)),
+    )
+
+
+@pytest.mark.parametrize("mode", ["shared_runtime", "stack_cache"])
+@pytest.mark.parametrize("program", _TEST_PROGRAMS)
+def test_should_keep_vm_state(program: str, mode: str, vm_directory: Path) -> None:
+    program_directory = vm_directory.joinpath(program)
+    expected = _ram(
+        vm_directory.parent.parent.joinpath("final_project_tests", f"{program}.json")
+    )
+
+    run_vm_translator(str(program_directory), **{mode: True})
+
+    actual = _ram(_run(program_directory))
+    observed = [0, 1, 2, 3, 4, *range(16, 256), *range(256, expected[0])]
+    assert {address: actual.get(address, 0) for address in observed} == {
+        address: expected.get(address, 0) for address in observed
+    }
+
+
+def test_should_reuse_cached_fragments(vm_directory: Path, tmp_path: Path) -> None:
+    program_directory = tmp_path.joinpath("StaticsTest")
+    shutil.copytree(vm_directory.joinpath("StaticsTest"), program_directory)
+    asm_file = program_directory.joinpath("StaticsTest.asm")
+    program = VmProgram.load_from(str(program_directory))
+
+    program.translate()
+    expected = asm_file.read_text()
+    first = program.translate(cache=True).cache
+    second = program.translate(cache=True).cache
+    assert asm_file.read_text() == expected
+    class2 = program_directory.joinpath("Class2.vm")
+    class2.write_text(class2.read_text() + "\n")
+    third = program.translate(cache=True).cache
+
+    assert (first.hits, first.misses) == (0, 3)
+    assert (second.hits, second.misses) == (3, 0)
+    assert (third.hits, third.misses) == (2, 1)
+    assert asm_file.read_text() == expected
+
+
+def test_should_remove_unreachable_functions(
+    vm_directory: Path, tmp_path: Path
+) -> None:
+    program_directory = tmp_path.joinpath("FibonacciElement")
+    shutil.copytree(vm_directory.joinpath("FibonacciElement"), program_directory)
+    asm_file = program_directory.joinpath("FibonacciElement.asm")
+    program = VmProgram.load_from(str(program_directory))
+    program.translate()
+    expected = asm_file.read_text()
+    program_directory.joinpath("Dead.vm").write_text(
+        "function Dead.unused 0\ncall Dead.helper 0\nreturn\n"
+        "function Dead.helper 0\npush constant 0\nreturn\n"
+    )
+
+    report = program.translate(prune=True)
+
+    assert report.removed == ["Dead.helper", "Dead.unused"]
+    assert asm_file.read_text() == expected
+
+
+def test_should_report_function_stats(vm_directory: Path) -> None:
+    program_directory = vm_directory.joinpath("FibonacciElement")
+    asm_file = program_directory.joinpath("FibonacciElement.asm")
+
+    run_vm_translator(str(program_directory), stats=True, cycles=_CYCLES)
+
+    with asm_file.with_suffix(".stats.json").open() as file:
+        stats = json.load(file)
+    words = Assembler.create().assemble_words(asm_file.read_text().splitlines())
+    functions = stats["functions"]
+    assert stats["instructions"] == len(words)
+    assert stats["cycles"] == _CYCLES
+    assert list(functions) == ["Sys.init", "Main.fibonacci", "$$bootstrap"]
+    assert sum(function["cycles"] for function in functions.values()) == _CYCLES
+    assert [sum(function["commands"].values()) for function in functions.values()] == [
+        function["instructions"] for function in functions.values()
+    ]
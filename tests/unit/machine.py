@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+from typing import Dict, Iterable, List, Optional
+
+from n2t.core import Assembler, Emulator, JackCompiler, VMTranslator
+from n2t.core.vm_translator import Fragment
+
+HALT = "$$HALT"
+
+MEMORY = """
+class Memory {
+    static int free;
+
+    function int alloc(int size) {
+        var int block;
+        if (free = 0) {
+            let free = 2048;
+        }
+        let block = free;
+        let free = free + size;
+        return block;
+    }
+}
+"""
+
+
+def compile_classes(
+    compiler: JackCompiler, sources: Dict[str, str]
+) -> Dict[str, List[str]]:
+    return {
+        f"{name}.vm": list(compiler.compile(jack_code.splitlines()))
+        for name, jack_code in sources.items()
+    }
+
+
+# Links the files behind a bootstrap that parks the CPU at HALT once Sys.init
+# returns, so the program can run without a cycle budget.
+def link(
+    vm_files: Dict[str, List[str]], translator: Optional[VMTranslator] = None
+) -> List[int]:
+    translator = translator or VMTranslator.create()
+    fragments = [Fragment([f"@{HALT}", "0;JMP"])]
+    for name, vm_code in vm_files.items():
+        fragments.append(translator.translate_file(vm_code, name))
+    return Assembler.create().assemble_words([*translator.link(fragments), f"({HALT})"])
+
+
+def run(words: Iterable[int]) -> Dict[int, int]:
+    ram = json.loads("".join(Emulator.create().emulate_words(words, -1)))["RAM"]
+    return {int(address): value for address, value in ram.items()}
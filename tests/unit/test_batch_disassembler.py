@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from hypothesis import given
+from hypothesis.strategies import integers, lists, one_of, text
+
+from n2t.core.disassembler import BatchDisassembler, Disassembler
+from tests.unit.strategies import gibberish_words, hack_words
+
+
+@given(word=one_of(text(), gibberish_words(), hack_words()))
+def test_should_match_chain_for_single_word(word: str) -> None:
+    chain = Disassembler.create()
+    batch = BatchDisassembler.create()
+
+    assert batch.disassemble_one(word) == chain.disassemble_one(word)
+
+
+@given(words=lists(one_of(hack_words(), text(max_size=20)), max_size=50))
+def test_should_match_chain_for_mixed_batch(words: list[str]) -> None:
+    chain = Disassembler.create()
+    batch = BatchDisassembler.create()
+
+    assert list(batch.disassemble(words)) == list(chain.disassemble(words))
+
+
+@given(words=lists(hack_words(), max_size=50))
+def test_should_match_chain_for_valid_batch(words: list[str]) -> None:
+    chain = Disassembler.create()
+    batch = BatchDisassembler.create()
+
+    assert list(batch.disassemble(words)) == list(chain.disassemble(words))
+
+
+@given(words=lists(integers(min_value=0, max_value=0xFFFF), max_size=50))
+def test_should_decode_packed_words(words: list[int]) -> None:
+    chain = Disassembler.create()
+    batch = BatchDisassembler.create()
+
+    expected = chain.disassemble(f"{word:016b}" for word in words)
+
+    assert list(batch.disassemble_packed(words)) == list(expected)
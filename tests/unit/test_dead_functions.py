@@ -0,0 +1,40 @@
+from n2t.core.vm_translator.pruning import eliminate_dead_functions
+
+_SYS = ["function Sys.init 0", "call Main.main 0", "label LOOP", "goto LOOP"]
+_MAIN = [
+    "// Main",
+    "function Main.main 0",
+    "call Math.abs 1",
+    "return",
+    "function Main.unused 0",
+    "call Math.max 2",
+    "return",
+]
+_MATH = [
+    "function Math.abs 0",
+    "push argument 0",
+    "return",
+    "function Math.max 0",
+    "call Math.abs 1",
+    "return",
+]
+
+
+def test_should_keep_functions_reachable_from_sys_init() -> None:
+    pruned, removed = eliminate_dead_functions(
+        [("Main.vm", _MAIN), ("Math.vm", _MATH), ("Sys.vm", _SYS)]
+    )
+
+    assert removed == ["Main.unused", "Math.max"]
+    assert pruned == [
+        ("Main.vm", _MAIN[:4]),
+        ("Math.vm", _MATH[:3]),
+        ("Sys.vm", _SYS),
+    ]
+
+
+def test_should_keep_everything_without_entry_point() -> None:
+    pruned, removed = eliminate_dead_functions([("Math.vm", _MATH)])
+
+    assert removed == []
+    assert pruned == [("Math.vm", _MATH)]
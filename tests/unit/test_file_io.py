@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+from hypothesis import given, settings
+from hypothesis.strategies import lists, sampled_from
+
+from n2t.infra.io import File, split_lines
+
+_PIECES = ["@17", "D=M", " ", "\t", "\n", "\r", "\r\n", "\x0c", "// x"]
+
+
+@settings(max_examples=200)
+@given(lists(sampled_from(_PIECES)).map("".join))
+def test_should_split_like_reading_lines(content: str) -> None:
+    expected = [line.strip() for line in io.StringIO(content, newline="")]
+
+    assert split_lines(content) == expected
+
+
+def test_should_load_range_like_load(tmp_path: Path) -> None:
+    source = File(tmp_path.joinpath("Prog.hack"))
+    source.save(format(word, "016b") for word in range(1000))
+
+    chunks = [source.load_range(start, end) for start, end in source.split(7)]
+
+    assert [line for chunk in chunks for line in chunk] == source.load()
+
+
+@settings(max_examples=20, deadline=None)
+@given(lists(sampled_from(["@17", "D=M", "", "(LOOP)", "0;JMP"]), max_size=10000))
+def test_should_round_trip_lines(
+    tmp_path_factory: pytest.TempPathFactory, lines: List[str]
+) -> None:
+    path = tmp_path_factory.mktemp("round_trip").joinpath("Prog.asm")
+
+    File(path).save(iter(lines))
+
+    assert File(path).load() == lines
+
+
+def test_should_keep_old_content_when_saving_fails(tmp_path: Path) -> None:
+    target = File(tmp_path.joinpath("Prog.asm"))
+    target.save(["@1", "D=A"])
+
+    def interrupted() -> Iterator[str]:
+        yield "@2"
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        target.save(interrupted())
+
+    assert target.load() == ["@1", "D=A"]
+    assert [path.name for path in tmp_path.iterdir()] == ["Prog.asm"]
+
+
+def test_should_create_files_with_default_mode(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("Prog.hack")
+    path.write_text("")
+    expected = path.stat().st_mode
+
+    File(path).save(["0000000000000000"])
+    File(path).save_bytes(b"0000000000000000\n")
+
+    assert path.stat().st_mode == expected
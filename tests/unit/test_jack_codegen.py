@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import List
+
+from n2t.core import JackCompiler
+from tests.unit.machine import MEMORY, compile_classes, link, run
+
+_STRING = """
+class String {
+    field Array chars;
+    field int length;
+
+    constructor String new(int maxLength) {
+        let chars = Memory.alloc(maxLength);
+        let length = 0;
+        return this;
+    }
+
+    method String appendChar(char c) {
+        let chars[length] = c;
+        let length = length + 1;
+        return this;
+    }
+
+    method int charAt(int i) {
+        return chars[i];
+    }
+}
+"""
+
+_SYS = """
+class Sys {
+    static int first;
+
+    function void init() {
+        var int i;
+        var Array out;
+        let out = 7000;
+        let i = 0;
+        while (i < 3) {
+            let out[i] = Sys.pick("abc", i) + Sys.pick("xyz", 2);
+            let i = i + 1;
+        }
+        let out[3] = out[0] + out[2];
+        let out[4] = Sys.pick("abc", 1);
+        return;
+    }
+
+    function int pick(String text, int i) {
+        return text.charAt(i);
+    }
+}
+"""
+
+
+def _compile(compiler: JackCompiler, jack_code: str) -> List[str]:
+    return list(compiler.compile(jack_code.splitlines()))
+
+
+def _run(compiler: JackCompiler) -> List[int]:
+    sources = {"Memory": MEMORY, "String": _STRING, "Sys": _SYS}
+    ram = run(link(compile_classes(compiler, sources)))
+    return [ram[address] for address in range(7000, 7005)]
+
+
+def test_should_intern_string_literals() -> None:
+    vm_code = _compile(JackCompiler.create(intern_strings=True), _SYS)
+
+    assert vm_code.count("call String.new 1") == 2
+    assert vm_code.count("function Sys.$strings 0") == 1
+    assert "pop static 1" in vm_code
+    assert "pop static 2" in vm_code
+
+
+def test_should_keep_results_with_interned_strings() -> None:
+    expected = _run(JackCompiler.create())
+
+    assert expected == [219, 220, 221, 440, 98]
+    assert _run(JackCompiler.create(True, intern_strings=True)) == expected
+
+
+def test_should_address_constant_indices_directly() -> None:
+    vm_code = _compile(JackCompiler.create(optimize=True), _SYS)
+
+    assert "push that 2" in vm_code
+    assert "pop that 3" in vm_code
+    assert "pop that 4" in vm_code
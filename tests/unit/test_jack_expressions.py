@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+from hypothesis import given, settings
+from hypothesis.strategies import (
+    SearchStrategy,
+    integers,
+    recursive,
+    sampled_from,
+    tuples,
+)
+
+from n2t.core import Emulator, JackCompiler
+from n2t.core.compiler.expressions import (
+    Binary,
+    Constant,
+    KeywordConstant,
+    ShiftLeft,
+    Unary,
+    Variable,
+    simplify,
+)
+from tests.unit.machine import compile_classes, link, run
+
+_MATH = """
+class Math {
+    function int multiply(int x, int y) {
+        var int sum, bit;
+        let sum = 0;
+        let bit = 1;
+        while (~(bit = 0)) {
+            if (~((y & bit) = 0)) {
+                let sum = sum + x;
+            }
+            let x = x + x;
+            let bit = bit + bit;
+        }
+        return sum;
+    }
+
+    function int divide(int x, int y) {
+        var int quotient;
+        let quotient = 0;
+        while (~(x < y)) {
+            let x = x - y;
+            let quotient = quotient + 1;
+        }
+        return quotient;
+    }
+}
+"""
+
+_SYS = """
+class Sys {
+    static int result;
+
+    function void init() {
+        var int x, y;
+        let x = %s;
+        let y = %s;
+        let result = %s;
+        return;
+    }
+}
+"""
+
+_RESULT = 16
+
+
+def _run(x: int, y: int, expression: str, optimize: bool) -> Tuple[int, int]:
+    sources = {"Math": _MATH, "Sys": _SYS % (x, y, expression)}
+    words = link(compile_classes(JackCompiler.create(optimize), sources))
+    return run(words)[_RESULT], sum(Emulator.create().profile_words(words, -1))
+
+
+def _expressions() -> SearchStrategy[str]:
+    leaves = integers(0, 32767).map(str) | sampled_from(["x", "y", "true", "false"])
+    return recursive(
+        leaves,
+        lambda children: (
+            tuples(sampled_from(["-", "~"]), children).map(lambda u: f"{u[0]}{u[1]}")
+            | tuples(children, sampled_from(list("+-*&|<>=")), children).map(
+                lambda b: f"({b[0]} {b[1]} {b[2]})"
+            )
+        ),
+        max_leaves=6,
+    )
+
+
+@settings(max_examples=40, deadline=None)
+@given(integers(-32767, 32767), integers(-32767, 32767), _expressions())
+def test_should_keep_results_and_save_cycles(x: int, y: int, expression: str) -> None:
+    expected, baseline = _run(x, y, expression, optimize=False)
+    actual, cycles = _run(x, y, expression, optimize=True)
+
+    assert actual == expected
+    assert cycles <= baseline
+
+
+def test_should_evaluate_operators_left_to_right() -> None:
+    result, _ = _run(7, 3, "x + y * 2 - -x / 3", optimize=False)
+
+    assert result == 9
+
+
+def test_should_fold_constants() -> None:
+    assert simplify(Binary("+", Constant(2), Constant(3))) == Constant(5)
+    assert simplify(Unary("-", Constant(5))) == Constant(-5)
+    assert simplify(Binary("/", Constant(-7), Constant(2))) == Constant(-3)
+    assert simplify(Binary("*", Constant(300), Constant(300))) == Constant(24464)
+    assert simplify(Unary("~", KeywordConstant("true"))) == Constant(0)
+    assert simplify(Binary("<", Constant(6790), Constant(-25978))) == Constant(-1)
+
+
+def test_should_simplify_expressions() -> None:
+    x = Variable("x")
+
+    assert simplify(Unary("~", Unary("~", x))) == x
+    assert simplify(Binary("*", x, Constant(8))) == ShiftLeft(x, 3)
+    assert simplify(Binary("*", Constant(4), x)) == ShiftLeft(x, 2)
+    assert simplify(Binary("/", x, Constant(1))) == x
+    assert simplify(Binary("+", x, Unary("-", Constant(5)))) == Binary(
+        "-", x, Constant(5)
+    )
+    assert simplify(Binary("*", x, Constant(3))) == Binary("*", x, Constant(3))
+    assert simplify(Binary("*", Constant(3), x)) == Binary("*", Constant(3), x)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import Dict, List
+
+from n2t.core import JackCompiler
+from tests.unit.machine import MEMORY, link, run
+
+_POINT = """
+class Point {
+    field int x, y;
+    static int created;
+
+    constructor Point new(int ax, int ay) {
+        let x = ax;
+        let y = ay;
+        let created = created + 1;
+        return this;
+    }
+
+    method int getX() { return x; }
+    method int getY() { return y; }
+    method void setX(int value) { let x = value; return; }
+    function int count() { return created; }
+    function int identity(int value) { return value; }
+
+    method int sum() {
+        return getX() + getY() + Point.count();
+    }
+}
+"""
+
+_SYS = """
+class Sys {
+    function void init() {
+        var Array out;
+        var Point p;
+        let out = 7000;
+        let p = Point.new(3, 4);
+        let out[0] = p.getY() - p.getX();
+        do p.setX(Point.identity(p.getY() + 5));
+        let out[1] = p.getX();
+        let out[2] = p.sum();
+        let out[3] = Point.count();
+        do p.getX();
+        return;
+    }
+}
+"""
+
+_SOURCES = {"Memory.jack": MEMORY, "Point.jack": _POINT, "Sys.jack": _SYS}
+
+
+def _compile(compiler: JackCompiler) -> Dict[str, List[str]]:
+    sources = [(name, code.splitlines()) for name, code in _SOURCES.items()]
+    return compiler.compile_program(sources).vm_code
+
+
+def _run(vm_files: Dict[str, List[str]]) -> List[int]:
+    ram = run(link(vm_files))
+    return [ram[address] for address in range(7000, 7004)]
+
+
+def test_should_inline_trivial_methods() -> None:
+    output = JackCompiler.create().compile_program(
+        [(name, code.splitlines()) for name, code in _SOURCES.items()]
+    )
+
+    callees = sorted(call.callee for call in output.inlined)
+    assert callees == [
+        "Point.count",
+        "Point.getX",
+        "Point.getX",
+        "Point.getX",
+        "Point.getX",
+        "Point.getY",
+        "Point.getY",
+        "Point.getY",
+        "Point.identity",
+        "Point.setX",
+    ]
+    assert output.cycles_saved > 0
+    sys_code = output.vm_code["Sys.jack"]
+    assert not any(line.startswith("call Point.get") for line in sys_code)
+    assert "call Point.setX 2" not in sys_code
+    assert "call Point.count 0" in sys_code
+    assert "pop that 0" in sys_code
+    assert "call Point.count 0" not in output.vm_code["Point.jack"]
+
+
+def test_should_keep_results_when_inlining() -> None:
+    compiler = JackCompiler.create()
+    expected = [list(compiler.compile(code.splitlines())) for code in _SOURCES.values()]
+
+    assert _run(dict(zip(_SOURCES, expected))) == [1, 9, 14, 1]
+    assert _run(_compile(compiler)) == [1, 9, 14, 1]
+    assert _run(_compile(JackCompiler.create(optimize=True))) == [1, 9, 14, 1]
+
+
+def test_should_keep_calls_with_side_effects() -> None:
+    sources = [
+        ("Point.jack", _POINT.splitlines()),
+        (
+            "Main.jack",
+            """
+            class Main {
+                function int f(Point p) {
+                    return Point.identity(p.sum()) + p.getX();
+                }
+                function int g() { return Main.h(Point.new(1, 2)); }
+                function int h(Point p) { return 0; }
+            }
+            """.splitlines(),
+        ),
+    ]
+
+    output = JackCompiler.create().compile_program(sources)
+
+    main_code = output.vm_code["Main.jack"]
+    assert "call Point.sum 1" in main_code
+    assert "call Point.new 2" in main_code
+    assert "call Point.identity 1" not in main_code
+    assert "call Main.h 1" in main_code
+
+
+def test_should_report_unresolved_names() -> None:
+    sources = [("Point.jack", _POINT.splitlines())]
+    for body in ["return y;", "let y = value; return;"]:
+        jack_code = f"class Bad {{ method int bad(int value) {{ {body} }} }}"
+        sources.append((f"Bad{len(sources)}.jack", [jack_code]))
+
+    output = JackCompiler.create().compile_program(sources)
+
+    assert list(output.vm_code) == ["Point.jack"]
+    assert list(output.errors) == ["Bad1.jack", "Bad2.jack"]
+    for error in output.errors.values():
+        assert "Error while resolving 'y' in Bad.bad" in error
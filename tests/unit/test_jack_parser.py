@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import pytest
+
+from n2t.core import JackCompiler
+from n2t.core.compiler.expressions import Binary, Call, Constant, Unary, Variable
+from n2t.core.compiler.parser import parse
+from n2t.core.compiler.semantics import analyze
+from n2t.core.compiler.syntax import (
+    DoStatement,
+    IfStatement,
+    LetStatement,
+    Parameter,
+    ReturnStatement,
+    WhileStatement,
+)
+from n2t.core.compiler.tokenizer import scan
+
+_POINT = """
+class Point {
+    field int x, y;
+    static int count;
+
+    constructor Point new(int ax, int ay) {
+        let x = ax;
+        let y = ay;
+        let count = count + 1;
+        return this;
+    }
+
+    method int distance(Point other) {
+        var int dx;
+        let dx = x - other.getX();
+        if (dx < 0) { let dx = -dx; } else { do Output.printInt(dx); }
+        while (dx > 10) { let dx = dx - 10; }
+        return dx;
+    }
+}
+"""
+
+
+def test_should_parse_class_into_syntax_tree() -> None:
+    point = parse(*scan(_POINT))
+
+    assert point.name == "Point"
+    assert [subroutine.name for subroutine in point.subroutines] == [
+        "new",
+        "distance",
+    ]
+    distance = point.subroutines[1]
+    assert distance.parameters == (Parameter("Point", "other"),)
+    let, if_, while_, return_ = distance.body
+    assert let == LetStatement(
+        "dx",
+        None,
+        Binary("-", Variable("x"), Call("other", "getX", ())),
+    )
+    assert isinstance(if_, IfStatement)
+    assert if_.then == (LetStatement("dx", None, Unary("-", Variable("dx"))),)
+    assert if_.otherwise == (
+        DoStatement(Call("Output", "printInt", (Variable("dx"),))),
+    )
+    assert isinstance(while_, WhileStatement)
+    assert while_.condition == Binary(">", Variable("dx"), Constant(10))
+    assert return_ == ReturnStatement(Variable("dx"))
+
+
+def test_should_build_scopes_per_subroutine() -> None:
+    info = analyze(parse(*scan(_POINT)))
+
+    assert info.fields == 2
+    new, distance = info.scopes["new"], info.scopes["distance"]
+    assert new.resolve("ay").push == "push argument 1"
+    assert new.resolve("count").pop == "pop static 0"
+    assert distance.resolve("other").type == "Point"
+    assert distance.resolve("other").push == "push argument 1"
+    assert distance.resolve("y").push == "push this 1"
+    assert "dx" not in new.symbols
+
+
+def test_should_call_methods_on_parameters() -> None:
+    vm_code = list(JackCompiler.create().compile(_POINT.splitlines()))
+
+    assert "call Point.getX 1" in vm_code
+    assert "call Memory.alloc 1" in vm_code
+
+
+@pytest.mark.parametrize(
+    "jack_code, message",
+    [
+        ("class A { function int f() { return y; } }", "'y' in A.f"),
+        ("class A { function void f() { let x = 1 } }", "expected ';'"),
+        ("class A { function void f() { return; } ", "expected '}'"),
+        ("class A { function void f(int", "unexpected 'end of file'"),
+        ("class A { function void f(int a,", "unexpected 'end of file'"),
+        ("class A { field int x", "unexpected 'end of file'"),
+    ],
+)
+def test_should_report_invalid_programs(jack_code: str, message: str) -> None:
+    with pytest.raises(BaseException, match=message):
+        JackCompiler.create().compile([jack_code])
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+
+from n2t.core.compiler.tokenizer import (
+    IDENTIFIER,
+    INT_CONST,
+    KEYWORD,
+    STRING_CONST,
+    SYMBOL,
+    tokenize,
+)
+
+
+def test_should_tokenize_typed_tokens() -> None:
+    tokens = tokenize('let x_1 = a[2] + "a b";')
+
+    assert tokens == [
+        (KEYWORD, "let"),
+        (IDENTIFIER, "x_1"),
+        (SYMBOL, "="),
+        (IDENTIFIER, "a"),
+        (SYMBOL, "["),
+        (INT_CONST, "2"),
+        (SYMBOL, "]"),
+        (SYMBOL, "+"),
+        (STRING_CONST, '"a b"'),
+        (SYMBOL, ";"),
+    ]
+
+
+def test_should_skip_comments() -> None:
+    jack_code = """
+    /** Documentation
+     * spanning lines, with code: let x = 1;
+     */
+    do f(); // trailing comment
+    /* inline */ return /* a
+    multi-line comment */ 1;
+    """
+
+    values = [value for _, value in tokenize(jack_code)]
+
+    assert values == ["do", "f", "(", ")", ";", "return", "1", ";"]
+
+
+@pytest.mark.parametrize("jack_code", ['let s = "open;', "return; /* open", "let #"])
+def test_should_reject_malformed_code(jack_code: str) -> None:
+    with pytest.raises(BaseException, match="line 1"):
+        tokenize(jack_code)
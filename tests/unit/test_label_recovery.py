@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from hypothesis import given
+from hypothesis.strategies import lists, one_of
+
+from n2t.core.assembler import Assembler
+from n2t.core.disassembler import LabelRecoveringDisassembler
+from tests.unit.strategies import HackAssemblyPair, a_instructions, c_instructions
+
+_PROGRAM = [
+    "0000000000010000",  # @16
+    "1110101010001000",  # M=0
+    "0000000000000001",  # @1
+    "1111110000010000",  # D=M
+    "0000000000000110",  # @6
+    "1110001100000010",  # D;JEQ
+    "0000000000010000",  # @16
+    "1111110111001000",  # M=M+1
+    "0100000000000000",  # @16384
+    "1110110000010000",  # D=A
+    "0000000000001010",  # @10
+    "1110101010000111",  # 0;JMP
+]
+
+
+def test_should_recover_labels_and_symbols() -> None:
+    disassembler = LabelRecoveringDisassembler.create()
+
+    assembly = list(disassembler.disassemble(_PROGRAM))
+
+    assert assembly == [
+        "@VAR_16",
+        "M=0",
+        "@LCL",
+        "D=M",
+        "@L_6",
+        "D;JEQ",
+        "(L_6)",
+        "@VAR_16",
+        "M=M+1",
+        "@SCREEN",
+        "D=A",
+        "(L_10)",
+        "@L_10",
+        "0;JMP",
+    ]
+
+
+@given(instructions=lists(one_of(a_instructions(), c_instructions()), max_size=64))
+def test_should_reassemble_to_same_words(
+    instructions: list[HackAssemblyPair],
+) -> None:
+    words = [instruction.hack for instruction in instructions]
+    disassembler = LabelRecoveringDisassembler.create()
+
+    assembly = disassembler.disassemble(words)
+
+    assert list(Assembler.create().assemble(assembly)) == words
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _loaded_modules(code: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_should_load_no_tool_to_start_the_cli() -> None:
+    modules = _loaded_modules("import n2t.runner.cli")
+
+    assert not {name for name in modules if name.startswith("n2t.core.")}
+    assert "n2t.infra.asm" not in modules
+
+
+def test_should_load_only_the_tool_in_use() -> None:
+    modules = _loaded_modules("from n2t.infra import AsmProgram")
+
+    assert "n2t.core.assembler" in modules
+    assert "n2t.core.compiler" not in modules
+    assert "n2t.core.vm_translator" not in modules
+
+
+def test_should_reject_unknown_names() -> None:
+    with pytest.raises(ImportError):
+        from n2t.core import Linker  # noqa: F401
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pytest
+
+from n2t.core.assembler import Assembler, SourceMap
+
+_PROGRAM = [
+    "// Counts down from R0",
+    "",
+    "@R0",
+    "D=M",
+    "@counter",
+    "M=D",
+    "(LOOP)",
+    "   @counter",
+    "   MD=M-1   // decrement",
+    "   @LOOP",
+    "   D;JGT",
+    "(END)",
+    "@END",
+    "0;JMP",
+]
+
+
+def test_should_map_addresses_to_source_lines() -> None:
+    hack, source_map = Assembler.create().assemble_with_map(_PROGRAM)
+
+    assert len(source_map) == len(hack) == 10
+    assert source_map.lookup(0) == (3, None)
+    assert source_map.lookup(4) == (8, "LOOP")
+    assert source_map.lookup(7) == (11, "LOOP")
+    assert source_map.lookup(9) == (14, "END")
+
+
+def test_should_record_final_symbol_table() -> None:
+    _, source_map = Assembler.create().assemble_with_map(_PROGRAM)
+
+    assert source_map.symbols == {"LOOP": 4, "END": 8, "counter": 16}
+    assert source_map.variables == {"counter": 16}
+
+
+def test_should_round_trip_binary_format() -> None:
+    _, source_map = Assembler.create().assemble_with_map(_PROGRAM)
+
+    loaded = SourceMap.from_bytes(source_map.to_bytes())
+
+    assert loaded == source_map
+    assert [loaded.lookup(i) for i in range(len(loaded))] == [
+        source_map.lookup(i) for i in range(len(source_map))
+    ]
+
+
+def test_should_reject_other_formats() -> None:
+    _, source_map = Assembler.create().assemble_with_map(_PROGRAM)
+    data = bytearray(source_map.to_bytes())
+    data[0] ^= 0xFF
+
+    with pytest.raises(BaseException, match="Error while loading source map"):
+        SourceMap.from_bytes(bytes(data))
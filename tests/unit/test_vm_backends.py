@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from typing import Dict, List
+
+import pytest
+from hypothesis import given, settings
+from hypothesis.strategies import integers
+
+from n2t.core import VMTranslator
+from n2t.core.vm_translator.codegen import shared_runtime
+from tests.unit.machine import link, run
+
+_SYS = """
+function Sys.init 1
+push constant %d
+call Main.fibonacci 1
+pop static 0
+push constant %d
+push constant %d
+gt
+pop static 1
+push constant %d
+push constant %d
+lt
+pop static 2
+push constant %d
+push constant %d
+eq
+pop static 3
+push constant %d
+pop local 0
+label LOOP
+push local 0
+push constant 0
+eq
+if-goto END
+push static 4
+push local 0
+add
+pop static 4
+push local 0
+push constant 1
+sub
+pop local 0
+goto LOOP
+label END
+push constant 0
+return
+"""
+
+_MAIN = """
+function Main.fibonacci 0
+push argument 0
+push constant 2
+lt
+if-goto BASE
+push argument 0
+push constant 2
+sub
+call Main.fibonacci 1
+push argument 0
+push constant 1
+sub
+call Main.fibonacci 1
+add
+return
+label BASE
+push argument 0
+return
+"""
+
+# Leaves values on the stack across a goto, a call, a return and a label that
+# is reached both by falling through and by jumping, so the stack cache has
+# to spill D at each of them.
+_SPILLS = """
+function Sys.init 0
+push constant 1
+goto SKIP
+label BACK
+add
+call Sys.double 1
+pop static 0
+push constant 0
+return
+label SKIP
+push constant 10
+label AGAIN
+push static 1
+push constant 1
+add
+pop static 1
+push static 1
+push constant 3
+lt
+if-goto AGAIN
+goto BACK
+function Sys.double 0
+push argument 0
+push argument 0
+add
+return
+"""
+
+_OBSERVED = [0, 1, 2, 3, 4, *range(16, 256)]
+
+
+def _fibonacci(n: int) -> int:
+    return n if n < 2 else _fibonacci(n - 1) + _fibonacci(n - 2)
+
+
+def _vm_files(n: int, x: int, y: int) -> Dict[str, List[str]]:
+    sys_code = _SYS % (n, x, y, x, y, x, y, n)
+    return {"Main.vm": _MAIN.splitlines(), "Sys.vm": sys_code.splitlines()}
+
+
+def _state(vm_files: Dict[str, List[str]], translator: VMTranslator) -> List[int]:
+    ram = run(link(vm_files, translator))
+    return [ram.get(address, 0) for address in _OBSERVED]
+
+
+@pytest.mark.parametrize("mode", ["shared_runtime", "stack_cache"])
+@settings(max_examples=25, deadline=None)
+@given(integers(0, 12), integers(0, 32767), integers(0, 32767))
+def test_should_keep_vm_state(mode: str, n: int, x: int, y: int) -> None:
+    vm_files = _vm_files(n, x, y)
+
+    expected = _state(vm_files, VMTranslator.create())
+
+    assert _state(vm_files, VMTranslator.create(**{mode: True})) == expected
+    assert expected[5:10] == [
+        _fibonacci(n),
+        0xFFFF * (x > y),
+        0xFFFF * (x < y),
+        0xFFFF * (x == y),
+        n * (n + 1) // 2,
+    ]
+
+
+def test_should_share_runtime_routines() -> None:
+    translator = VMTranslator.create(shared_runtime=True)
+    fragments = [
+        translator.translate_file(vm_code, name)
+        for name, vm_code in _vm_files(5, 1, 2).items()
+    ]
+    assembly = translator.link(fragments)
+
+    runtime = shared_runtime(fragments[0].routines | fragments[1].routines)
+    start = len(assembly) - len(runtime)
+    labels = [line for line in assembly if line.startswith("($$")]
+    assert runtime
+    assert assembly[start:] == runtime
+    assert len(labels) == len(set(labels))
+
+
+def test_should_spill_cached_top_at_control_flow() -> None:
+    vm_files = {"Sys.vm": _SPILLS.splitlines()}
+
+    expected = _state(vm_files, VMTranslator.create())
+
+    assert _state(vm_files, VMTranslator.create(stack_cache=True)) == expected
+    assert expected[5:7] == [22, 3]
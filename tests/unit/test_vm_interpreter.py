@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+from typing import List, Tuple
+
+from hypothesis import given, settings
+from hypothesis.strategies import integers, lists, sampled_from, tuples
+
+from n2t.core import Assembler, Emulator, VMInterpreter, VMTranslator
+
+_BINARY = ["add", "sub", "and", "or", "eq", "lt", "gt"]
+_UNARY = ["neg", "not"]
+_SCRATCH = {13, 14, 15}
+
+Operation = Tuple[str, int, int]
+
+
+def _program(operations: List[Operation]) -> List[str]:
+    lines = ["function Sys.init 0"]
+    for index, (operation, x, y) in enumerate(operations):
+        lines.append(f"push constant {x}")
+        if operation in _BINARY:
+            lines.append(f"push constant {y}")
+        else:
+            lines.append("neg")
+        lines.extend([operation, f"pop static {index}"])
+    return [*lines, "label END", "goto END"]
+
+
+def _emulate(vm_code: List[str]) -> dict[int, int]:
+    translator = VMTranslator.create()
+    assembly = translator.link([translator.translate_file(vm_code, "Sys.vm")])
+    words = Assembler.create().assemble_words(assembly)
+    ram = json.loads(
+        "".join(Emulator.create().emulate_words(words, 100 * len(vm_code)))
+    )
+    return {int(address): value for address, value in ram["RAM"].items()}
+
+
+@settings(max_examples=50, deadline=None)
+@given(
+    lists(
+        tuples(
+            sampled_from(_BINARY + _UNARY),
+            integers(0, 32767),
+            integers(0, 32767),
+        ),
+        min_size=1,
+        max_size=8,
+    )
+)
+def test_should_match_emulated_translation(operations: List[Operation]) -> None:
+    vm_code = _program(operations)
+    machine = VMInterpreter.create().load([("Sys.vm", vm_code)], bootstrap=True)
+
+    machine.run()
+
+    expected = _emulate(vm_code)
+    actual = machine.result()
+    assert actual.keys() == expected.keys() - _SCRATCH
+    assert {
+        address: value
+        for address, value in actual.items()
+        if address not in machine.return_slots
+    } == {
+        address: expected[address]
+        for address in actual
+        if address not in machine.return_slots
+    }